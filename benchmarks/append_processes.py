@@ -0,0 +1,123 @@
+"""Stress check of the append mode of the :class:`pyrolog.FileHandler` (see :class:`pyrolog.AppendIO`): several
+processes write records to the same file at once. Every record has the opening and closing lines with its id, and
+the body lines prefixed by the id, every 10th record is large (larger than :data:`pyrolog.defaults.ATOMIC_WRITE_SIZE`,
+written under the advisory lock) and every 7th record has the exception traceback. Check fails if any record is lost,
+written twice or mixed with the other record.
+
+Usage:
+
+.. code-block:: shell
+
+    $ python benchmarks/append_processes.py [processes] [records]
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import pyrolog
+
+SMALL_LINES = 3
+LARGE_LINES = 200
+
+
+def record_lines(p: int, i: int) -> list[str]:
+    rid = f'{p}-{i}'
+
+    return [f'<{rid}>'] + [f'{rid}: {"x" * 40}'] * (LARGE_LINES if i % 10 == 0 else SMALL_LINES) + [f'</{rid}>']
+
+
+def writer(path: str, p: int, records: int):
+    context  = pyrolog.LoggingContext(dict(pyrolog.defaults.DEFAULT_LOG_LEVELS))
+    handler  = pyrolog.FileHandler(path, append=True, log_level='debug', logging_context=context,
+                                   formatter=pyrolog.PlainFormatter('{message}'))
+    logger   = pyrolog.Logger('Append', handlers=[handler], logging_context=context)
+
+    for i in range(records):
+        message = '\n'.join(record_lines(p, i))
+
+        if i % 7 == 0:
+            try:
+                raise ValueError(f'record {p}-{i}')
+            except ValueError as e:
+                logger.error(message, exc=e)
+        else:
+            logger.info(message)
+
+    handler.shutdown()
+
+
+def check(path: str, processes: int, records: int) -> tuple[int, int, int]:
+    """Parses the file and counts lost, duplicated and broken records."""
+
+    seen    = {}
+    broken  = 0
+    lines   = []
+    rid     = None
+
+    with open(path, encoding='utf8') as f:
+        for line in f.read().splitlines():
+            if rid is None:
+                if line.startswith('<') and line.endswith('>'):
+                    rid    = line[1:-1]
+                    lines  = [line]
+                # other lines outside of the records are the tracebacks of the previous records
+
+                continue
+
+            lines.append(line)
+
+            if line == f'</{rid}>':
+                p, i = map(int, rid.split('-'))
+
+                if lines == record_lines(p, i):
+                    seen[rid] = seen.get(rid, 0) + 1
+                else:
+                    broken += 1
+
+                rid = None
+            elif not line.startswith(f'{rid}: '):
+                broken  += 1
+                rid      = None
+
+    expected    = {f'{p}-{i}' for p in range(processes) for i in range(records)}
+    lost        = len(expected - seen.keys())
+    duplicated  = sum(1 for n in seen.values() if n > 1)
+
+    return lost, duplicated, broken
+
+
+def main(processes: int = 8, records: int = 2000) -> int:
+    path = os.path.join(tempfile.mkdtemp(), 'append.log')
+
+    workers = [multiprocessing.Process(target=writer, args=(path, p, records)) for p in range(processes)]
+
+    start = time.perf_counter()
+
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+    elapsed = time.perf_counter() - start
+
+    lost, duplicated, broken = check(path, processes, records)
+
+    print(f'{processes} processes, {processes * records:,} records, {os.path.getsize(path):,} bytes, '
+          f'{elapsed:.2f} s')
+    print(f'{lost} lost, {duplicated} duplicated, {broken} broken')
+
+    failed = lost + duplicated + broken + sum(w.exitcode != 0 for w in workers)
+
+    print('OK' if not failed else 'FAILED')
+
+    os.remove(path)
+    os.rmdir(os.path.dirname(path))
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*map(int, sys.argv[1:])))
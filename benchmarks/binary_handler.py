@@ -0,0 +1,53 @@
+"""Throughput and size benchmark: compares :class:`pyrolog.BinaryHandler` with :class:`pyrolog.IOHandler` using
+:class:`pyrolog.PlainFormatter` (with time) on the same records, and measures time of the offline decoding.
+
+Usage:
+
+.. code-block:: shell
+
+    $ python benchmarks/binary_handler.py [records]
+"""
+
+import io
+import sys
+import time
+
+import pyrolog
+
+
+def run(handler: pyrolog.Handler, records: int) -> float:
+    logger  = pyrolog.Logger('Bench', handlers=[handler])
+    bound   = logger.bind(request_id='a1b2c3', user='bob')
+
+    start = time.perf_counter()
+
+    for i in range(records // 3):
+        logger.info('Plain message')
+        logger.info('Request {} finished in {elapsed} ms', i, elapsed=12.5)
+        bound.info('Request finished')
+
+    return time.perf_counter() - start
+
+
+def main(records: int = 300_000):
+    text    = io.StringIO()
+    binary  = io.BytesIO()
+
+    formatter = pyrolog.PlainFormatter(pyrolog.defaults.TIMED_MINIMAL_FORMAT_STRING)
+
+    for name, handler, sink in (('text', pyrolog.IOHandler(text, formatter=formatter), text),
+                                ('binary', pyrolog.BinaryHandler(binary), binary)):
+        elapsed = run(handler, records)
+        print(f'{name:>7}: {records / elapsed:12,.0f} records/s, {sink.tell() / records:6.1f} bytes/record')
+
+    binary.seek(0)
+
+    start    = time.perf_counter()
+    decoded  = sum(1 for _ in pyrolog.render_binary(binary, formatter))
+    elapsed  = time.perf_counter() - start
+
+    print(f'{"decode":>7}: {decoded / elapsed:12,.0f} records/s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
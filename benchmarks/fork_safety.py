@@ -0,0 +1,120 @@
+"""Stress check of the fork safety (see :meth:`pyrolog.Handler.before_fork()`): threads of the parent process log to
+the file (directly and through the :class:`pyrolog.QueueHandler`) while the parent forks children, that log to the
+same handlers and exit. Every line has the unique id. Check fails if any child hangs (deadlock), any line is lost or
+written twice, or any line is broken.
+
+Usage:
+
+.. code-block:: shell
+
+    $ python benchmarks/fork_safety.py [children] [threads]
+"""
+
+import collections
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import pyrolog
+
+LINES_PER_CHILD = 200
+CHILD_TIMEOUT = 10
+
+
+def main(children: int = 50, threads: int = 4) -> int:
+    if not hasattr(os, 'fork'):
+        print('os.fork() is not available on this platform')
+        return 0
+
+    directory  = tempfile.mkdtemp()
+    path       = os.path.join(directory, 'fork.log')
+    formatter  = pyrolog.PlainFormatter('{message}')
+    direct     = pyrolog.FileHandler(path, log_level='debug', formatter=formatter)
+    queued     = pyrolog.QueueHandler(pyrolog.FileHandler(os.path.join(directory, 'queued.log'), log_level='debug',
+                                                          formatter=formatter), block=True)
+    logger     = pyrolog.Logger('Fork', handlers=[direct, queued])
+
+    stop      = threading.Event()
+    produced  = collections.Counter()
+
+    def worker(n: int):
+        i = 0
+
+        while not stop.is_set():
+            logger.info('parent-{}-{}', n, i)
+            i += 1
+
+        produced[n] = i
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+
+    for w in workers:
+        w.start()
+
+    pids    = []
+    failed  = 0
+
+    for c in range(children):
+        pid = os.fork()
+
+        if pid == 0:
+            for i in range(LINES_PER_CHILD):
+                logger.info('child-{}-{}', c, i)
+
+            queued.close()
+            os._exit(0)
+
+        pids.append(pid)
+        time.sleep(0.005)
+
+    for pid in pids:
+        deadline = time.monotonic() + CHILD_TIMEOUT
+
+        while True:
+            done, status = os.waitpid(pid, os.WNOHANG)
+
+            if done:
+                failed += status != 0
+                break
+
+            if time.monotonic() > deadline:
+                print(f'child {pid} hangs (deadlock)')
+                os.kill(pid, 9)
+                os.waitpid(pid, 0)
+                failed += 1
+                break
+
+            time.sleep(0.01)
+
+    stop.set()
+
+    for w in workers:
+        w.join()
+
+    queued.close()
+    direct.file_io.flush()
+
+    expected = {f'parent-{n}-{i}' for n, count in produced.items() for i in range(count)}
+    expected |= {f'child-{c}-{i}' for c in range(children) for i in range(LINES_PER_CHILD)}
+
+    for name in ('fork.log', 'queued.log'):
+        with open(os.path.join(directory, name)) as f:
+            counts = collections.Counter(f.read().splitlines())
+
+        lost        = len(expected - counts.keys())
+        duplicated  = sum(1 for n in counts.values() if n > 1)
+        broken      = len(counts.keys() - expected)
+
+        print(f'{name:>10}: {sum(counts.values()):,} lines, {lost} lost, {duplicated} duplicated, {broken} broken')
+
+        failed += lost + duplicated + broken
+
+    print('OK' if not failed else 'FAILED')
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*map(int, sys.argv[1:])))
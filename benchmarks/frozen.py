@@ -0,0 +1,66 @@
+"""Throughput benchmark: compares the usual (dynamic) log methods with the frozen ones (see
+:meth:`pyrolog.LoggingContext.freeze()`) on the setup of the ``examples/presentation.py`` (colored maximum format for
+the terminal, plain maximum format for the file), with the streams replaced by in-memory ones and the handlers'
+log level raised to ``info``, to measure also calls of the level that no handler accepts (``debug``).
+
+Usage:
+
+.. code-block:: shell
+
+    $ python benchmarks/frozen.py [records]
+"""
+
+import io
+import sys
+import time
+
+import pyrolog
+
+
+def run(logger: pyrolog.Logger, records: int) -> tuple[float, float]:
+    start = time.perf_counter()
+
+    for i in range(records // 3):
+        logger.info('Plain message')
+        logger.error('Request {} finished in {elapsed} ms', i, elapsed=12.5)
+        logger.warn('Request {} finished: {}', i, [200, 'OK'])
+
+    logged = time.perf_counter() - start
+    start  = time.perf_counter()
+
+    for i in range(records):
+        logger.debug('Request {} finished: {}', i, [200, 'OK'])
+
+    return logged, time.perf_counter() - start
+
+
+def main(records: int = 60_000):
+    context = pyrolog.defaults.DEFAULT_LOGGING_CONTEXT
+
+    sout_handler = pyrolog.IOHandler(
+        io.StringIO(),
+        log_level='info',
+        formatter=pyrolog.ColoredFormatter(pyrolog.defaults.COLORED_MAXIMUM_FORMAT_STRING),
+        colors=True
+    )
+    file_handler = pyrolog.IOHandler(
+        io.StringIO(),
+        log_level='info',
+        formatter=pyrolog.PlainFormatter(pyrolog.defaults.MAXIMUM_FORMAT_STRING),
+        colors=False
+    )
+
+    logger = pyrolog.Logger('MainLogger', handlers=[sout_handler, file_handler])
+
+    for name in ('dynamic', 'frozen'):
+        if name == 'frozen':
+            context.freeze()
+
+        logged, skipped = run(logger, records)
+        print(f'{name:>8}: {records / logged:12,.0f} records/s, {records / skipped:14,.0f} skipped calls/s')
+
+    context.thaw()
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
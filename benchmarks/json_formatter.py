@@ -0,0 +1,50 @@
+"""Throughput benchmark: compares :class:`pyrolog.JsonFormatter` with :class:`pyrolog.PlainFormatter` on the same
+records (plain message, message with arguments and message with bound fields).
+
+Uses `orjson` if it is installed, pass ``--stdlib`` to force the standard :mod:`json` module.
+
+Usage:
+
+.. code-block:: shell
+
+    $ python benchmarks/json_formatter.py [records] [--stdlib]
+"""
+
+import io
+import sys
+import time
+
+import pyrolog
+
+
+def run(formatter: pyrolog.Formatter, records: int) -> float:
+    sink    = io.StringIO()
+    logger  = pyrolog.Logger('Bench', handlers=[pyrolog.IOHandler(sink, formatter=formatter)])
+    bound   = logger.bind(request_id='a1b2c3', user='bob')
+
+    start = time.perf_counter()
+
+    for i in range(records // 3):
+        logger.info('Plain message')
+        logger.info('Request {} finished in {elapsed} ms', i, elapsed=12.5)
+        bound.info('Request finished')
+
+        if sink.tell() > 1 << 24:
+            sink.seek(0)
+            sink.truncate()
+
+    return time.perf_counter() - start
+
+
+def main(records: int = 300_000, use_orjson: bool = True):
+    for name, formatter in (('plain', pyrolog.PlainFormatter()),
+                            ('json', pyrolog.JsonFormatter(static_fields={'service': 'bench'},
+                                                           use_orjson=use_orjson))):
+        elapsed = run(formatter, records)
+        print(f'{name:>6}: {records / elapsed:12,.0f} records/s')
+
+
+if __name__ == '__main__':
+    use_orjson = '--stdlib' not in sys.argv
+
+    main(*map(int, [a for a in sys.argv[1:] if a != '--stdlib']), use_orjson=use_orjson)
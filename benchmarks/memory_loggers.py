@@ -0,0 +1,61 @@
+"""Memory benchmark: creates and drops short-lived loggers (and their formatters) in a loop.
+
+Resident set size and the size of the logging context registries must stay flat, because registries don't keep
+loggers and formatters alive.
+
+Usage:
+
+.. code-block:: shell
+
+    $ python benchmarks/memory_loggers.py [iterations]
+"""
+
+import gc
+import io
+import os
+import sys
+import tracemalloc
+
+import pyrolog
+
+
+def get_rss() -> int:
+    """Gets current resident set size in bytes. Returns 0 if it can't be determined on this platform."""
+
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def main(iterations: int = 200_000, report_every: int = 20_000):
+    context  = pyrolog.LoggingContext(dict(pyrolog.defaults.DEFAULT_LOG_LEVELS))
+    group    = pyrolog.Group('Requests', logging_context=context)
+    sink     = io.StringIO()
+
+    tracemalloc.start()
+
+    for i in range(1, iterations + 1):
+        handler = pyrolog.IOHandler(sink, formatter=pyrolog.PlainFormatter(logging_context=context),
+                                    logging_context=context)
+        logger = pyrolog.Logger(f'Request{i % 1000}', handlers=[handler, ], logging_context=context)
+        logger.info('request {} handled', i)
+
+        grouped_logger = group.logger(f'Connection{i % 1000}')
+        grouped_logger.info('connection {} closed', i)
+
+        del logger, grouped_logger, handler
+        sink.seek(0)
+        sink.truncate()
+
+        if i % report_every == 0:
+            gc.collect()
+            current, _ = tracemalloc.get_traced_memory()
+            print(f'{i:>9} loggers | rss {get_rss() / 2**20:8.2f} MiB | traced {current / 2**10:9.1f} KiB | '
+                  f'registered loggers {len(context.loggers)} | group loggers {len(group.loggers)} | '
+                  f'formatters {len(pyrolog.formatters.defined_formatters)}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]))
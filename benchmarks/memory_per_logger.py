@@ -0,0 +1,67 @@
+"""Memory benchmark: bytes per logger and group. Creates many loggers (one per entity, as in the applications that
+make a logger per connection or per user) without and with the group, and reports memory allocated per object
+(measured by ``tracemalloc``, including the entries of the logging context and group registries).
+
+Usage:
+
+.. code-block:: shell
+
+    $ python benchmarks/memory_per_logger.py [loggers]
+"""
+
+import gc
+import io
+import sys
+import tracemalloc
+
+from typing import Callable
+
+import pyrolog
+
+
+def measure(make: Callable[[int], object], count: int) -> float:
+    """Measures mean memory allocated per object made by the function."""
+
+    gc.collect()
+    tracemalloc.start()
+
+    start    = tracemalloc.get_traced_memory()[0]
+    objects  = [make(i) for i in range(count)]
+    total    = tracemalloc.get_traced_memory()[0] - start
+
+    tracemalloc.stop()
+
+    # list of the objects isn't a part of the object size
+    total -= sys.getsizeof(objects)
+
+    del objects
+    gc.collect()
+
+    return total / count
+
+
+def main(count: int = 20_000):
+    context  = pyrolog.LoggingContext(dict(pyrolog.defaults.DEFAULT_LOG_LEVELS))
+    handler  = pyrolog.IOHandler(io.StringIO(), logging_context=context)
+    group    = pyrolog.Group('Entities', handlers=[handler], logging_context=context)
+
+    # names are made before the measure, so only the loggers are counted
+    names = [f'Entity{i}' for i in range(count)]
+
+    results = {
+        'logger': measure(lambda i: pyrolog.Logger(names[i], handlers=[handler], logging_context=context), count),
+        'grouped logger': measure(lambda i: group.logger(names[i]), count),
+        # names made at runtime (i.e. from the entity type), equal names are interned
+        'repeated name': measure(lambda i: group.logger(f'Entity{i % 100}'), count),
+        'group': measure(lambda i: pyrolog.Group(names[i], logging_context=context, parent_group=group),
+                         min(count, 2_000)),
+    }
+
+    print(f'{"object":<16} {"bytes per object":>17}')
+
+    for name, allocated in results.items():
+        print(f'{name:<16} {allocated:17,.0f}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]))
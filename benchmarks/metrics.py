@@ -0,0 +1,49 @@
+"""Throughput benchmark: measures cost of the metrics (see :mod:`pyrolog.metrics`). Logs the same records with the
+metrics disabled and enabled, to the in-memory streams with the plain formatter, by the usual and frozen loggers.
+
+Usage:
+
+.. code-block:: shell
+
+    $ python benchmarks/metrics.py [records]
+"""
+
+import io
+import sys
+import time
+
+import pyrolog
+
+
+def run(logger: pyrolog.Logger, records: int) -> float:
+    start = time.perf_counter()
+
+    for i in range(records // 3):
+        logger.info('Plain message')
+        logger.info('Request {} finished in {elapsed} ms', i, elapsed=12.5)
+        logger.debug('Request {} finished: {}', i, [200, 'OK'])
+
+    return time.perf_counter() - start
+
+
+def main(records: int = 150_000):
+    context = pyrolog.defaults.DEFAULT_LOGGING_CONTEXT
+    logger  = pyrolog.Logger('Bench', handlers=[pyrolog.IOHandler(io.StringIO(), log_level='info', name='memory')])
+
+    for name in ('disabled', 'enabled'):
+        if name == 'enabled':
+            context.enable_metrics()
+
+        elapsed = run(logger, records)
+        print(f'{name:>19}: {records / elapsed:12,.0f} records/s')
+
+        context.freeze()
+        elapsed = run(logger, records)
+        context.thaw()
+        print(f'{name + " (frozen)":>19}: {records / elapsed:12,.0f} records/s')
+
+    context.disable_metrics()
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,53 @@
+"""Throughput benchmark: measures overhead of the sampled profiling (see :mod:`pyrolog.profiling`) with the colored
+maximum format to the in-memory stream, and prints report of the profiler.
+
+Usage:
+
+.. code-block:: shell
+
+    $ python benchmarks/profiling.py [records] [every]
+"""
+
+import io
+import sys
+import time
+
+import pyrolog
+
+
+def run(logger: pyrolog.Logger, records: int) -> float:
+    start = time.perf_counter()
+
+    for i in range(records // 3):
+        logger.info('Plain message')
+        logger.info('Request {} finished in {elapsed} ms', i, elapsed=12.5)
+        logger.warn('Request {} finished: {}', i, [200, 'OK', {'retry': False}])
+
+    return time.perf_counter() - start
+
+
+def main(records: int = 60_000, every: int = 100):
+    context  = pyrolog.defaults.DEFAULT_LOGGING_CONTEXT
+    handler  = pyrolog.IOHandler(
+        io.StringIO(),
+        formatter=pyrolog.ColoredFormatter(pyrolog.defaults.COLORED_MAXIMUM_FORMAT_STRING),
+        colors=True,
+        name='memory'
+    )
+    logger   = pyrolog.Logger('Bench', handlers=[handler])
+
+    elapsed = run(logger, records)
+    print(f'disabled: {records / elapsed:12,.0f} records/s')
+
+    profiler = context.enable_profiling(every)
+
+    elapsed = run(logger, records)
+    print(f' enabled: {records / elapsed:12,.0f} records/s (1 of {every} records profiled)')
+    print()
+    print(profiler.report())
+
+    context.disable_profiling()
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
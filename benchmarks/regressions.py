@@ -0,0 +1,162 @@
+"""Regression checks of the fixed bugs, which aren't visible by the throughput benchmarks (unbounded caches, hangs,
+lost records). Every check raises `AssertionError` if the bug is back. Check fails also if it doesn't finish in
+:data:`CHECK_TIMEOUT` seconds.
+
+Usage:
+
+.. code-block:: shell
+
+    $ python benchmarks/regressions.py                   # run all checks
+    $ python benchmarks/regressions.py profiled          # run checks which names contain given strings
+"""
+
+import io
+import signal
+import sys
+import threading
+import traceback
+
+from typing import Callable
+
+import pyrolog
+
+CHECK_TIMEOUT = 30
+
+CHECKS: dict[str, Callable[[], None]] = {}
+"""Checks by names."""
+
+MAIN_THREAD: set[str] = set()
+"""Checks, that are run in the main thread (i.e. they install signal handlers), without the timeout."""
+
+
+def check(name: str, main_thread: bool = False):
+    """Registers check."""
+
+    def decorator(func: Callable[[], None]):
+        CHECKS[name] = func
+
+        if main_thread:
+            MAIN_THREAD.add(name)
+
+        return func
+
+    return decorator
+
+
+@check('profiled bound fields cache')
+def profiled_bound_fields_cache():
+    # sampled records are formatted by the copies of the formatter, they must not be kept by the bound fields
+    context   = pyrolog.LoggingContext(dict(pyrolog.defaults.DEFAULT_LOG_LEVELS))
+    handler   = pyrolog.IOHandler(io.StringIO(), formatter=pyrolog.PlainFormatter('{context} {message}',
+                                                                                  logging_context=context),
+                                  logging_context=context)
+    logger    = pyrolog.Logger('Check', handlers=[handler], logging_context=context)
+    bound     = logger.bind(request_id=1)
+
+    bound.info('Not profiled')
+    size = len(bound.fields.rendered)
+
+    context.enable_profiling(every=1)
+
+    for i in range(1000):
+        bound.info('Profiled {}', i)
+
+    context.disable_profiling()
+
+    assert len(bound.fields.rendered) == size, f'{len(bound.fields.rendered)} cached renders, expected {size}'
+
+
+@check('binary self-containing containers')
+def binary_self_containing_containers():
+    # container, that contains itself twice, expands to 2 ** depth items without the recursion check
+    value = []
+    value += [value, value]
+
+    output  = io.BytesIO()
+    writer  = pyrolog.BinaryWriter(output)
+
+    writer.write('{}', None, 'info', '', 'Check', '', '', [value, list(range(100_000))])
+    output.seek(0)
+
+    args = next(iter(pyrolog.BinaryReader(output))).args
+
+    assert repr(args[0]) == '[[...], [...]]', repr(args[0])
+    assert len(args[1]) <= writer.max_items + 1, f'{len(args[1])} items written'
+
+
+@check('shutdown on ignored signals', main_thread=True)
+def shutdown_on_ignored_signals():
+    # ignored signal doesn't end the process, so the handlers must keep working after it
+    if not hasattr(signal, 'SIGUSR1'):
+        return
+
+    output   = io.StringIO()
+    handler  = pyrolog.IOHandler(output, formatter=pyrolog.PlainFormatter('{message}'))
+    logger   = pyrolog.Logger('Check', handlers=[handler])
+    default  = signal.signal(signal.SIGUSR1, signal.SIG_IGN)
+
+    try:
+        assert pyrolog.shutdown_on_signals((signal.SIGUSR1, )) == ()
+
+        signal.raise_signal(signal.SIGUSR1)
+        logger.info('After the signal')
+    finally:
+        signal.signal(signal.SIGUSR1, default)
+        handler.shutdown()
+
+    assert handler.enabled is False and output.getvalue() == 'After the signal\n', repr(output.getvalue())
+
+
+def run(func: Callable[[], None], main_thread: bool = False) -> str | None:
+    """Runs check in the daemon thread (so the hanging check doesn't block the others), or in the main thread.
+
+    :returns: Error, or None if the check is passed.
+    """
+
+    errors: list[str] = []
+
+    if main_thread:
+        try:
+            func()
+        except BaseException:
+            return traceback.format_exc()
+
+        return None
+
+    def target():
+        try:
+            func()
+        except BaseException:
+            errors.append(traceback.format_exc())
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(CHECK_TIMEOUT)
+
+    if thread.is_alive():
+        return f'not finished in {CHECK_TIMEOUT} seconds'
+
+    return errors[0] if errors else None
+
+
+def main(*names: str) -> int:
+    failed = 0
+
+    for name, func in CHECKS.items():
+        if names and not any(n in name for n in names):
+            continue
+
+        error = run(func, name in MAIN_THREAD)
+        failed += error is not None
+
+        print(f'{name}: {"OK" if error is None else "FAILED"}')
+
+        if error is not None:
+            print(error)
+
+    print('OK' if not failed else 'FAILED')
+    return int(bool(failed))
+
+
+if __name__ == '__main__':
+    sys.exit(main(*sys.argv[1:]))
@@ -0,0 +1,48 @@
+"""Throughput benchmark: logs the same records to the colored stream and to the plain stream (i.e. terminal and
+file). Compares two separate formatters (:class:`pyrolog.ColoredFormatter` and :class:`pyrolog.PlainFormatter`, every
+record is formatted twice) with one shared :class:`pyrolog.ColoredFormatter` (record is rendered once, plain output is
+encoded from the colored one).
+
+Usage:
+
+.. code-block:: shell
+
+    $ python benchmarks/shared_rendering.py [records]
+"""
+
+import io
+import sys
+import time
+
+import pyrolog
+
+
+def run(handlers: list[pyrolog.Handler], records: int) -> float:
+    logger  = pyrolog.Logger('Bench', handlers=handlers)
+    bound   = logger.bind(request_id='a1b2c3', user='bob')
+
+    start = time.perf_counter()
+
+    for i in range(records // 3):
+        logger.info('Plain message')
+        logger.info('Request {} finished in {elapsed} ms', i, elapsed=12.5)
+        bound.info('Request {} finished: {}', i, [200, 'OK'])
+
+    return time.perf_counter() - start
+
+
+def main(records: int = 150_000):
+    colored = pyrolog.ColoredFormatter(pyrolog.defaults.COLORED_TIMED_MINIMAL_FORMAT_STRING)
+    plain   = pyrolog.PlainFormatter(pyrolog.defaults.TIMED_MINIMAL_FORMAT_STRING)
+    shared  = pyrolog.ColoredFormatter(pyrolog.defaults.COLORED_TIMED_MINIMAL_FORMAT_STRING)
+
+    for name, handlers in (('separate', [pyrolog.IOHandler(io.StringIO(), formatter=colored, colors=True),
+                                         pyrolog.IOHandler(io.StringIO(), formatter=plain, colors=False)]),
+                           ('shared', [pyrolog.IOHandler(io.StringIO(), formatter=shared, colors=True),
+                                       pyrolog.IOHandler(io.StringIO(), formatter=shared, colors=False)])):
+        elapsed = run(handlers, records)
+        print(f'{name:>8}: {records / elapsed:12,.0f} records/s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,73 @@
+"""Startup benchmark: measures how much ``import pyrolog`` (and creating the first logger) adds to the start of the
+interpreter, by spawning short-lived processes. Also prints the slowest imports reported by ``-X importtime``.
+
+Run it twice (or after ``python -m compileall pyrolog``), so the bytecode cache is warm.
+
+Usage:
+
+.. code-block:: shell
+
+    $ python benchmarks/startup.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SNIPPETS = {
+    'interpreter': 'pass',
+    'import': 'import pyrolog',
+    'plain logger': 'import pyrolog; pyrolog.get_plain_logger().info("started")',
+    'colored logger': 'import pyrolog; pyrolog.get_colored_logger().info("started")',
+}
+
+
+def measure(code: str, runs: int) -> float:
+    timings = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+def import_times(limit: int = 10) -> list[tuple[int, str]]:
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import pyrolog'],
+                            check=True, capture_output=True, text=True)
+    times = []
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times.append((int(cumulative), name.strip()))
+
+    return sorted(times, reverse=True)[:limit]
+
+
+def main(runs: int = 30):
+    baseline = None
+
+    for name, code in SNIPPETS.items():
+        elapsed = measure(code, runs)
+
+        if baseline is None:
+            baseline = elapsed
+            print(f'{name:>15}: {elapsed * 1000:8.2f} ms')
+        else:
+            print(f'{name:>15}: {elapsed * 1000:8.2f} ms (+{(elapsed - baseline) * 1000:.2f} ms)')
+
+    print('\nslowest imports (cumulative, us):')
+
+    for cumulative, name in import_times():
+        print(f'{cumulative:>10}  {name}')
+
+
+if __name__ == '__main__':
+    os.environ.pop('PYTHONDONTWRITEBYTECODE', None)
+    main(*map(int, sys.argv[1:]))
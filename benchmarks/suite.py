@@ -0,0 +1,338 @@
+"""Benchmark suite of the record path, formatters and handlers. Every case is run several times, the best run is
+reported as operations per second and nanoseconds per operation (operation is one log call, or one created
+logger/group for the ``creation`` case). Allocations are measured by ``tracemalloc`` in the separate pass: CPython
+doesn't count allocations, so the peak of the memory allocated during one operation (and freed after it) is reported.
+
+Results can be saved as JSON and compared with the saved baseline: cases that became slower than the threshold are
+reported as regressions and the exit code is 1.
+
+Usage:
+
+.. code-block:: shell
+
+    $ python benchmarks/suite.py                                   # run all cases
+    $ python benchmarks/suite.py plain colored                     # run cases which names contain given strings
+    $ python benchmarks/suite.py --save baseline.json              # save results
+    $ python benchmarks/suite.py --baseline baseline.json          # compare with the saved results
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from typing import Callable, Iterator
+
+import pyrolog
+
+RunFunction = Callable[[int], None]
+"""Function, that does given number of operations."""
+
+CASES: dict[str, Callable[[], Iterator[RunFunction]]] = {}
+"""Cases of the suite by names. Case is the generator function: it yields function, that does given number of
+operations, and cleans up after it is resumed."""
+
+NO_ALLOCATIONS: set[str] = set()
+"""Cases, which allocations aren't measured (one operation isn't representative for them)."""
+
+
+def case(name: str, allocations: bool = True):
+    """Registers case of the suite."""
+
+    def decorator(func: Callable[[], Iterator[RunFunction]]):
+        CASES[name] = func
+
+        if not allocations:
+            NO_ALLOCATIONS.add(name)
+
+        return func
+
+    return decorator
+
+
+class NullIO:
+    """Text IO, that drops written data. Keeps memory of the IO handlers flat."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+def make_context() -> pyrolog.LoggingContext:
+    """Makes separate logging context for the case, so loggers of the cases don't affect each other (i.e. name
+    offsets)."""
+
+    return pyrolog.LoggingContext(dict(pyrolog.defaults.DEFAULT_LOG_LEVELS))
+
+
+def make_logger(*formatters: pyrolog.Formatter, log_level: str = 'debug', **kwargs) -> pyrolog.Logger:
+    """Makes logger with the handlers to the :class:`NullIO` with given formatters."""
+
+    context   = make_context()
+    handlers  = [pyrolog.IOHandler(NullIO(), log_level=log_level, formatter=f, logging_context=context, **kwargs)
+                 for f in formatters]
+
+    return pyrolog.Logger('BenchLogger', handlers=handlers, logging_context=context)
+
+
+def calls(op: Callable[[], None]) -> RunFunction:
+    """Makes run function, that calls the operation given number of times."""
+
+    def run(n: int):
+        for _ in range(n):
+            op()
+
+    return run
+
+
+@case('disabled_level')
+def disabled_level():
+    logger = make_logger(pyrolog.PlainFormatter(), log_level='info')
+
+    yield calls(lambda: logger.debug('Request {} finished in {elapsed} ms', 1, elapsed=12.5))
+
+
+@case('plain_minimal')
+def plain_minimal():
+    logger = make_logger(pyrolog.PlainFormatter(pyrolog.defaults.MINIMAL_FORMAT_STRING))
+
+    yield calls(lambda: logger.info('Request {} finished in {elapsed} ms', 1, elapsed=12.5))
+
+
+@case('plain_maximum')
+def plain_maximum():
+    logger = make_logger(pyrolog.PlainFormatter(pyrolog.defaults.MAXIMUM_FORMAT_STRING,
+                                                pyrolog.defaults.MAXIMUM_TIME_FORMAT_STRING))
+
+    yield calls(lambda: logger.info('Request {} finished in {elapsed} ms', 1, elapsed=12.5))
+
+
+@case('plain_maximum_bytes')
+def plain_maximum_bytes():
+    logger = make_logger(pyrolog.PlainFormatter(pyrolog.defaults.MAXIMUM_FORMAT_STRING,
+                                                pyrolog.defaults.MAXIMUM_TIME_FORMAT_STRING), output_encoding='utf8')
+
+    yield calls(lambda: logger.info('Request {} finished in {elapsed} ms', 1, elapsed=12.5))
+
+
+@case('colored_nested')
+def colored_nested():
+    logger = make_logger(pyrolog.ColoredFormatter(pyrolog.defaults.COLORED_MAXIMUM_FORMAT_STRING), colors=True)
+    value  = {'users': [{'name': 'bob', 'roles': ['admin', 'dev'], 'active': True}, {'name': 'alice', 'age': 31}],
+              'limits': (10, 2.5, None), 'raw': b'\x00\xff'}
+
+    yield calls(lambda: logger.info('State {} of {}', value, ['a', 1, [2, [3, {'x': 4}]]]))
+
+
+@case('exception')
+def exception():
+    logger = make_logger(pyrolog.PlainFormatter())
+
+    def op():
+        # new exception from the same place every time, as in the real loops: stack is taken from the traceback
+        # cache, exception message is formatted every time
+        try:
+            {}['missing']
+        except KeyError as e:
+            logger.error('Request failed', exc=e)
+
+    yield calls(op)
+
+
+@case('file_handler')
+def file_handler(bytes_output: bool = False):
+    context  = make_context()
+    path     = os.path.join(tempfile.mkdtemp(), 'bench.log')
+    handler  = pyrolog.FileHandler(path, log_level='debug', logging_context=context, bytes_output=bytes_output,
+                                   formatter=pyrolog.PlainFormatter(pyrolog.defaults.MAXIMUM_FORMAT_STRING))
+    logger   = pyrolog.Logger('BenchLogger', handlers=[handler], logging_context=context)
+
+    yield calls(lambda: logger.info('Request {} finished in {elapsed} ms', 1, elapsed=12.5))
+
+    handler.file_io.close()
+    os.remove(path)
+    os.rmdir(os.path.dirname(path))
+
+
+@case('file_handler_bytes')
+def file_handler_bytes():
+    yield from file_handler(bytes_output=True)
+
+
+@case('fanout')
+def fanout():
+    logger = make_logger(pyrolog.ColoredFormatter(pyrolog.defaults.COLORED_MAXIMUM_FORMAT_STRING),
+                         pyrolog.PlainFormatter(pyrolog.defaults.MAXIMUM_FORMAT_STRING),
+                         pyrolog.JsonFormatter(),
+                         pyrolog.PlainFormatter())
+
+    yield calls(lambda: logger.info('Request {} finished in {elapsed} ms', 1, elapsed=12.5))
+
+
+@case('threads', allocations=False)
+def threads(count: int = 4):
+    logger = make_logger(pyrolog.PlainFormatter(pyrolog.defaults.MAXIMUM_FORMAT_STRING))
+
+    def worker(n: int):
+        for _ in range(n):
+            logger.info('Request {} finished in {elapsed} ms', 1, elapsed=12.5)
+
+    def run(n: int):
+        workers = [threading.Thread(target=worker, args=(n // count,)) for _ in range(count)]
+
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+    yield run
+
+
+@case('creation', allocations=False)
+def creation():
+    context  = make_context()
+    handler  = pyrolog.IOHandler(NullIO(), logging_context=context)
+    root     = pyrolog.Group('Root', handlers=[handler], logging_context=context)
+    created  = []
+
+    def run(n: int):
+        # every 10th object is a subgroup, loggers are spread over the subgroups
+        group = root
+
+        for i in range(n):
+            if i % 10 == 0:
+                group = pyrolog.Group(f'Group{len(created)}', logging_context=context, parent_group=root)
+                created.append(group)
+            else:
+                created.append(pyrolog.Logger(f'Logger{len(created)}', logging_context=context, group=group))
+
+    yield run
+
+    for obj in created:
+        obj.close()
+
+
+def measure(name: str, ops: int, repeat: int) -> dict[str, float]:
+    """Runs the case and measures it."""
+
+    gen  = CASES[name]()
+    run  = next(gen)
+
+    run(max(ops // 10, 1))
+
+    best = min(timed(run, ops) for _ in range(repeat))
+
+    result = {'ops_per_sec': ops / best * 1e9, 'ns_per_op': best / ops, 'alloc_bytes_per_op': None}
+
+    if name not in NO_ALLOCATIONS:
+        result['alloc_bytes_per_op'] = allocations(run, min(ops, 1000))
+
+    next(gen, None)
+
+    return result
+
+
+def timed(run: RunFunction, ops: int) -> int:
+    """Times one run of the case, in nanoseconds."""
+
+    start = time.perf_counter_ns()
+    run(ops)
+
+    return time.perf_counter_ns() - start
+
+
+def allocations(run: RunFunction, ops: int) -> float:
+    """Measures mean peak of the memory allocated during one operation."""
+
+    total = 0
+
+    tracemalloc.start()
+
+    try:
+        for _ in range(ops):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            run(1)
+            total += tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+
+    return total / ops
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], threshold: float) -> list[str]:
+    """Compares results with the baseline, prints the differences and returns names of the regressed cases."""
+
+    regressions = []
+
+    print()
+    print(f'{"case":<20} {"baseline ns/op":>15} {"ns/op":>12} {"change":>9}')
+
+    for name, result in results.items():
+        base = baseline.get(name)
+
+        if base is None:
+            continue
+
+        change  = result['ns_per_op'] / base['ns_per_op'] - 1
+        mark    = ''
+
+        if change > threshold:
+            regressions.append(name)
+            mark = '  REGRESSION'
+
+        print(f'{name:<20} {base["ns_per_op"]:15,.0f} {result["ns_per_op"]:12,.0f} {change:+9.1%}{mark}')
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark suite of pyrolog.')
+    parser.add_argument('cases', nargs='*', help='run only cases which names contain any of given strings')
+    parser.add_argument('-n', '--ops', type=int, default=20_000, help='operations per run')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='runs per case, the best one is reported')
+    parser.add_argument('--save', help='save results to the JSON file')
+    parser.add_argument('--baseline', help='compare results with the JSON file saved by --save')
+    parser.add_argument('--threshold', type=float, default=0.1, help='slowdown reported as regression (0.1 is 10%%)')
+    args = parser.parse_args(argv)
+
+    names = [n for n in CASES if not args.cases or any(c in n for c in args.cases)]
+
+    results = {}
+
+    print(f'{"case":<20} {"ops/sec":>12} {"ns/op":>12} {"alloc B/op":>12}')
+
+    for name in names:
+        result = results[name] = measure(name, args.ops, args.repeat)
+        alloc  = result['alloc_bytes_per_op']
+
+        print(f'{name:<20} {result["ops_per_sec"]:12,.0f} {result["ns_per_op"]:12,.0f} '
+              f'{"-" if alloc is None else format(alloc, ",.0f"):>12}')
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'python': sys.version, 'platform': platform.platform(), 'pyrolog': pyrolog.__version__,
+                       'ops': args.ops, 'results': results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+
+        if compare(results, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
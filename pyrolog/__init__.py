@@ -14,8 +14,14 @@ from ._types import LogOnlyLevels
 from .group import *
 from .logger import *
 from .logging_context import *
+from .context_scope import *
 from .handlers import *
 from .formatters import *
+from .tracebacks import *
+from .binary import *
+from .metrics import *
+from .profiling import *
+from .health import *
 from .version import *
 from .colors import *
 
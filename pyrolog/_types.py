@@ -81,3 +81,47 @@ class LogOnlyLevels:
         return level in self.levels
 
 LogLevel: TypeAlias = str | int | LogOnlyLevels
+
+
+class BoundFields(dict):
+    """Dict with the fields bound to the logger by :meth:`pyrolog.Logger.bind()`. Fields can be referenced by the
+    format strings and messages like any other named argument.
+
+    :ivar rendered: (**System variable.** Do not change it manually) Cache of the fields pre-rendered by every
+        formatter that has used them.
+    :type rendered: dict
+    :ivar last_merged: (**System variable.** Do not change it manually) The last fields merged by :meth:`merge()`
+        and the result of merging.
+    :type last_merged: tuple[BoundFields, BoundFields] | None
+    """
+
+    __slots__ = ('rendered', 'last_merged')
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+
+        self.rendered     = {}
+        self.last_merged  = None
+
+    def merge(self, other: 'BoundFields') -> 'BoundFields':
+        """Merges other fields with these. Fields of this object take precedence. The result is cached while `other`
+        is the same object, so merging with the same context scope doesn't make new objects and keeps the rendered
+        fields cached.
+
+        :param other: Fields to merge with.
+        :type other: BoundFields
+
+        :returns: Merged fields.
+        :rtype: BoundFields
+        """
+
+        last = self.last_merged
+
+        if last is not None and last[0] is other:
+            return last[1]
+
+        merged = BoundFields(other, **self)
+        self.last_merged = (other, merged)
+
+        return merged
+
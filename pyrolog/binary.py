@@ -0,0 +1,792 @@
+"""Module that defines the compact binary log format: writer (used by :class:`pyrolog.BinaryHandler`) and streaming
+reader, that renders binary logs back through any formatter (see also ``python -m pyrolog.decode``).
+
+Binary log is the header (:data:`MAGIC`) followed by the frames. Every frame is the tag (1 byte) and the payload
+length (uint32), followed by the payload:
+
+* ``D`` - defines string of the dictionary: id (uint32) and UTF-8 encoded string. Templates, logger names, group
+  paths, levels, colors, names of the named arguments and fields, and rendered tracebacks are interned to the
+  dictionary, so every string is written once per file;
+* ``S`` - defines source of the records: id (uint32) and string ids of the level, logger name, logger color, group
+  path and group color (uint32 each);
+* ``R`` - record: time in nanoseconds (int64), ids of the source and template (uint32 each), followed by the encoded
+  arguments, named arguments, fields and traceback;
+* ``C`` - clears the dictionary (when it reaches :data:`pyrolog.defaults.BINARY_DICTIONARY_SIZE` strings).
+
+Records aren't formatted on write, formatting happens only when logs are read.
+
+.. important::
+    Due to the library's import system, if you import `pyrolog` by this code:
+
+    .. code-block:: python
+
+        import pyrolog
+
+    You must use this as:
+
+    .. code-block:: python
+
+        pyrolog.BinaryWriter
+
+    As example.
+"""
+
+import datetime
+import struct
+
+from collections import namedtuple
+from itertools import islice
+
+from .defaults import BINARY_DICTIONARY_SIZE, BINARY_MAX_DEPTH, BINARY_MAX_ITEMS
+from .formatters import Formatter, Lazy, TRUNCATION_MARK, parse_template
+from .tracebacks import TracebackCache, RenderedTraceback
+from ._types import BoundFields
+
+from typing import Any, BinaryIO, Iterator
+
+__all__ = ['BinaryObject', 'BinaryException', 'BinaryNamespace', 'BinaryRecord', 'BinaryFormatError', 'BinaryWriter',
+           'BinaryReader', 'render_binary']
+
+MAGIC = b'PYROLOG\x01'
+"""Header of the binary logs (format signature and version)."""
+
+FRAME       = struct.Struct('<cI')
+RECORD      = struct.Struct('<qII')
+SOURCE      = struct.Struct('<IIIIII')
+STRING_ID   = struct.Struct('<I')
+INT64       = struct.Struct('<q')
+FLOAT64     = struct.Struct('<d')
+
+NO_TIME     = -1 << 63
+
+RECURSION_MARKS = {list: '[...]', tuple: '(...)', set: '{...}', frozenset: '{...}', dict: '{...}'}
+
+INT64_MIN   = -1 << 63
+INT64_MAX   = (1 << 63) - 1
+
+TAG_DEFINE  = b'D'
+TAG_RECORD  = b'R'
+TAG_SOURCE  = b'S'
+TAG_CLEAR   = b'C'
+
+# value tags
+V_NONE       = 0x00
+V_TRUE       = 0x01
+V_FALSE      = 0x02
+V_INT        = 0x03
+V_BIGINT     = 0x04
+V_FLOAT      = 0x05
+V_STR        = 0x06
+V_INTERNED   = 0x07
+V_BYTES      = 0x08
+V_LIST       = 0x09
+V_TUPLE      = 0x0A
+V_DICT       = 0x0B
+V_NAMESPACE  = 0x0C
+V_OBJECT     = 0x0D
+V_EXCEPTION  = 0x0E
+
+BinaryRecord = namedtuple('BinaryRecord', ('time', 'level', 'logger_name', 'logger_color', 'group_name',
+                                           'group_color', 'message', 'args', 'kwargs', 'fields', 'exc'))
+"""Record read from the binary log. `exc` is the rendered traceback or `None`."""
+
+
+class BinaryFormatError(ValueError):
+    """Raised when the binary log is malformed."""
+
+
+class BinaryObject:
+    """Object of the type, that isn't supported by the binary format, read from the binary log. Such objects are
+    written as their string representation.
+
+    :ivar type_name: Name of the original type.
+    :type type_name: str
+    :ivar text: String representation of the original object.
+    :type text: str
+    """
+
+    __slots__ = ('type_name', 'text')
+
+    def __init__(self, type_name: str, text: str):
+        self.type_name  = type_name
+        self.text       = text
+
+    def __format__(self, format_spec: str) -> str:
+        return self.text.__format__(format_spec)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return self.text
+
+
+class BinaryException(Exception):
+    """Exception, that was passed as argument, read from the binary log.
+
+    :ivar type_name: Name of the original exception type.
+    :type type_name: str
+    """
+
+    def __init__(self, type_name: str, text: str):
+        super().__init__(text)
+
+        self.type_name = type_name
+
+    def __repr__(self) -> str:
+        return f'{self.type_name}({str(self)!r})'
+
+
+class BinaryNamespace:
+    """Named tuple (i.e. :class:`inspect.FrameInfo` passed as `stack`) read from the binary log. Fields are
+    accessible as attributes."""
+
+    def __init__(self, type_name: str, items: dict[str, Any]):
+        self.__dict__.update(items)
+        self.__type_name = type_name
+
+    def __repr__(self) -> str:
+        items = ', '.join(f'{k}={v!r}' for k, v in self.__dict__.items() if not k.startswith('_'))
+        return f'{self.__type_name}({items})'
+
+
+class BinaryWriter:
+    """Encodes records to the binary format.
+
+    :ivar io: Binary IO to write records to.
+    :type io: BinaryIO
+    :ivar tracebacks: Cache of the rendered tracebacks.
+    :type tracebacks: TracebackCache
+    :ivar dictionary_size: Maximum count of the strings in the dictionary.
+    :type dictionary_size: int
+    :ivar skip_kwargs: Names of the named arguments, that are written only if they are referenced by the message.
+    :type skip_kwargs: frozenset[str]
+    :ivar max_depth: Maximum depth of the nested containers.
+    :type max_depth: int
+    :ivar max_items: Maximum total count of the items of the containers per record.
+    :type max_items: int
+    """
+
+    def __init__(self,
+                 io: BinaryIO,
+                 tracebacks: TracebackCache | None = None,
+                 dictionary_size: int = BINARY_DICTIONARY_SIZE,
+                 skip_kwargs: tuple[str, ...] = ('stack', ),
+                 max_depth: int = BINARY_MAX_DEPTH,
+                 max_items: int = BINARY_MAX_ITEMS,
+                 ):
+        """
+        :param io: Binary IO to write records to. Header is written immediately.
+        :type io: BinaryIO
+        :param tracebacks: Cache of the rendered tracebacks. If it isn't given, the new one is created.
+        :type tracebacks: TracebackCache | None
+        :param dictionary_size: Maximum count of the strings in the dictionary. When dictionary is full, it is
+            cleared before the next record (and the strings are defined again).
+        :type dictionary_size: int
+        :param skip_kwargs: Names of the named arguments, that are written only if they are referenced by the
+            message. By default, it is the frame info passed by the log methods.
+        :type skip_kwargs: tuple[str, ...]
+        :param max_depth: Maximum depth of the nested containers, deeper values are written as `...`.
+        :type max_depth: int
+        :param max_items: Maximum total count of the items of the containers per record, the rest of the items are
+            written as `... (+N)`.
+        :type max_items: int
+        """
+        self.io               = io
+        self.tracebacks       = TracebackCache() if tracebacks is None else tracebacks
+        self.dictionary_size  = dictionary_size
+        self.skip_kwargs      = frozenset(skip_kwargs)
+        self.max_depth        = max_depth
+        self.max_items        = max_items
+
+        # ids of the containers being encoded (to detect the recursion) and items left for the record
+        self._path: set[int]  = set()
+        self._items_left      = max_items
+
+        self._strings: dict[str, int]                            = {}
+        self._sources: dict[tuple[str, str, str, str, str], int]  = {}
+        self._templates: dict[str, tuple[int, frozenset[str]]]    = {}
+
+        self.io.write(MAGIC)
+
+    def intern(self, string: str, out: bytearray) -> int:
+        """Gets id of the string in the dictionary. If string isn't defined yet, appends its definition to `out`.
+
+        :param string: String.
+        :type string: str
+        :param out: Buffer of the frames, that will be written.
+        :type out: bytearray
+
+        :returns: Id of the string.
+        :rtype: int
+        """
+
+        string_id = self._strings.get(string)
+
+        if string_id is None:
+            string_id = self._strings[string] = len(self._strings)
+            encoded   = string.encode('utf8', 'surrogatepass')
+
+            out += FRAME.pack(TAG_DEFINE, STRING_ID.size + len(encoded))
+            out += STRING_ID.pack(string_id)
+            out += encoded
+
+        return string_id
+
+    def define_source(self, source: tuple[str, str, str, str, str], out: bytearray) -> int:
+        """Defines source of the records (level, logger name, logger color, group path and group color) and appends
+        its definition to `out`.
+
+        :param source: Source of the records.
+        :type source: tuple[str, str, str, str, str]
+        :param out: Buffer of the frames, that will be written.
+        :type out: bytearray
+
+        :returns: Id of the source.
+        :rtype: int
+        """
+
+        string_ids = [self.intern(string, out) for string in source]
+        source_id  = self._sources[source] = len(self._sources)
+
+        out += FRAME.pack(TAG_SOURCE, SOURCE.size)
+        out += SOURCE.pack(source_id, *string_ids)
+
+        return source_id
+
+    def encode_value(self, value: Any, out: bytearray, strings: bytearray, depth: int = 0):
+        """Encodes value to `out`. Containers deeper than :attr:`max_depth` are written as `...`, containers, that
+        contain themselves, are written as `[...]` at the repeat, and items over the :attr:`max_items` budget of the
+        record are written as `... (+N)`. Values that can't be encoded (i.e. their `str()` raises) are written as
+        their `repr()` or as the placeholder, so the record is always written.
+
+        :param value: Value.
+        :type value: Any
+        :param out: Buffer of the record payload.
+        :type out: bytearray
+        :param strings: Buffer of the string definitions, that are written before the record.
+        :type strings: bytearray
+        :param depth: Depth of the value.
+        :type depth: int
+        """
+
+        type_ = type(value)
+
+        # fast path for the most common types
+        if type_ is str:
+            self.encode_string(V_STR, value, out)
+            return
+        if type_ is int and INT64_MIN <= value <= INT64_MAX:
+            out.append(V_INT)
+            out += INT64.pack(value)
+            return
+        if type_ is float:
+            out.append(V_FLOAT)
+            out += FLOAT64.pack(value)
+            return
+
+        start = len(out)
+
+        try:
+            if isinstance(value, Lazy):
+                value = value.value
+
+            if value is None:
+                out.append(V_NONE)
+            elif value is True:
+                out.append(V_TRUE)
+            elif value is False:
+                out.append(V_FALSE)
+            elif isinstance(value, int):
+                if INT64_MIN <= value <= INT64_MAX:
+                    out.append(V_INT)
+                    out += INT64.pack(value)
+                else:
+                    self.encode_string(V_BIGINT, str(int(value)), out)
+            elif isinstance(value, float):
+                out.append(V_FLOAT)
+                out += FLOAT64.pack(value)
+            elif isinstance(value, str):
+                self.encode_string(V_STR, value, out)
+            elif isinstance(value, (bytes, bytearray, memoryview)):
+                data = bytes(value)
+                out.append(V_BYTES)
+                out += STRING_ID.pack(len(data))
+                out += data
+            elif isinstance(value, (tuple, list, set, frozenset, dict)):
+                if depth >= self.max_depth:
+                    self.encode_mark(value, TRUNCATION_MARK, out, strings)
+                elif id(value) in self._path:
+                    self.encode_mark(value, next(mark for type_, mark in RECURSION_MARKS.items()
+                                                 if isinstance(value, type_)), out, strings)
+                else:
+                    self._path.add(id(value))
+
+                    try:
+                        self.encode_container(value, out, strings, depth)
+                    finally:
+                        self._path.discard(id(value))
+            else:
+                self.encode_object(value, out, strings)
+        except Exception:
+            # strings interned meanwhile are defined in `strings` anyway, only the value is replaced
+            del out[start:]
+            self.encode_object(value, out, strings)
+
+    def encode_container(self, value: tuple | list | set | frozenset | dict, out: bytearray, strings: bytearray,
+                         depth: int):
+        """Encodes items of the container to `out` (see :meth:`encode_value()`). Only items left in the
+        :attr:`max_items` budget of the record are encoded, the rest is written as one `... (+N)` item.
+
+        :param value: Container.
+        :type value: tuple | list | set | frozenset | dict
+        :param out: Buffer of the record payload.
+        :type out: bytearray
+        :param strings: Buffer of the string definitions, that are written before the record.
+        :type strings: bytearray
+        :param depth: Depth of the container.
+        :type depth: int
+        """
+
+        left = self._items_left
+
+        if isinstance(value, tuple) and hasattr(value, '_fields'):
+            # fields of the named tuples are always written, there are few of them
+            self._items_left = left - len(value._fields)
+
+            out.append(V_NAMESPACE)
+            out += STRING_ID.pack(self.intern(type(value).__name__, strings))
+            out += STRING_ID.pack(len(value._fields))
+
+            for name in value._fields:
+                out += STRING_ID.pack(self.intern(name, strings))
+                self.encode_value(getattr(value, name), out, strings, depth + 1)
+            return
+
+        # mutable containers are copied, so count of the items matches the encoded items
+        if isinstance(value, dict):
+            items = list(islice(value.items(), max(left, 0)))
+        else:
+            items = value[:max(left, 0)] if type(value) is tuple else list(islice(value, max(left, 0)))
+
+        rest              = len(value) - len(items)
+        self._items_left  = left - len(items)
+
+        out.append(V_DICT if isinstance(value, dict) else V_TUPLE if isinstance(value, tuple) else V_LIST)
+        out += STRING_ID.pack(len(items) + (rest > 0))
+
+        if isinstance(value, dict):
+            for k, v in items:
+                self.encode_value(k, out, strings, depth + 1)
+                self.encode_value(v, out, strings, depth + 1)
+
+            if rest > 0:
+                self.encode_mark(value, TRUNCATION_MARK, out, strings)
+                self.encode_mark(value, f'(+{rest})', out, strings)
+        else:
+            for item in items:
+                self.encode_value(item, out, strings, depth + 1)
+
+            if rest > 0:
+                self.encode_mark(value, f'{TRUNCATION_MARK} (+{rest})', out, strings)
+
+    def encode_mark(self, value: Any, mark: str, out: bytearray, strings: bytearray):
+        """Encodes mark of the value, that isn't written (i.e. `...` of the truncated container), to `out`.
+
+        :param value: Value.
+        :type value: Any
+        :param mark: Mark.
+        :type mark: str
+        :param out: Buffer of the record payload.
+        :type out: bytearray
+        :param strings: Buffer of the string definitions, that are written before the record.
+        :type strings: bytearray
+        """
+
+        out.append(V_OBJECT)
+        out += STRING_ID.pack(self.intern(type(value).__name__, strings))
+        self.encode_string(V_STR, mark, out)
+
+    def encode_object(self, value: Any, out: bytearray, strings: bytearray):
+        """Encodes value of the type, that isn't supported by the binary format, as its string representation. If
+        `str()` of the value raises, `repr()` is used, and if it raises too, the placeholder is written.
+
+        :param value: Value.
+        :type value: Any
+        :param out: Buffer of the record payload.
+        :type out: bytearray
+        :param strings: Buffer of the string definitions, that are written before the record.
+        :type strings: bytearray
+        """
+
+        type_name = type(value).__name__
+
+        try:
+            text = str(value)
+        except Exception:
+            try:
+                text = repr(value)
+            except Exception:
+                text = f'<unprintable {type_name} object>'
+
+        out.append(V_EXCEPTION if isinstance(value, BaseException) else V_OBJECT)
+        out += STRING_ID.pack(self.intern(type_name, strings))
+        self.encode_string(V_STR, text if type(text) is str else f'<unprintable {type_name} object>', out)
+
+    @staticmethod
+    def encode_string(tag: int, string: str, out: bytearray):
+        """Encodes not interned string to `out`.
+
+        :param tag: Value tag.
+        :type tag: int
+        :param string: String.
+        :type string: str
+        :param out: Buffer of the record payload.
+        :type out: bytearray
+        """
+
+        encoded = string.encode('utf8', 'surrogatepass')
+
+        out.append(tag)
+        out += STRING_ID.pack(len(encoded))
+        out += encoded
+
+    def encode_mapping(self,
+                       mapping: dict[str, Any] | None,
+                       out: bytearray,
+                       strings: bytearray,
+                       skip: frozenset[str] = frozenset()):
+        """Encodes named arguments or fields to `out`. Names are interned to the dictionary.
+
+        :param mapping: Named arguments or fields.
+        :type mapping: dict[str, Any] | None
+        :param out: Buffer of the record payload.
+        :type out: bytearray
+        :param strings: Buffer of the string definitions, that are written before the record.
+        :type strings: bytearray
+        :param skip: Names, that aren't encoded.
+        :type skip: frozenset[str]
+        """
+
+        start  = len(out)
+        count  = 0
+
+        out.append(V_DICT)
+        out += STRING_ID.pack(0)
+
+        for k, v in mapping.items() if mapping else ():
+            if k in skip:
+                continue
+
+            string_id = self._strings.get(k)
+
+            out.append(V_INTERNED)
+            out += STRING_ID.pack(self.intern(k, strings) if string_id is None else string_id)
+            self.encode_value(v, out, strings)
+
+            count += 1
+
+        if count:
+            STRING_ID.pack_into(out, start + 1, count)
+        else:
+            del out[start:]
+            out.append(V_NONE)
+
+    def write(self,
+              message: str,
+              time: datetime.datetime | None,
+              level: str | int,
+              logger_color: str,
+              logger_name: str,
+              group_name: str,
+              group_color: str,
+              fmt_args: list[Any] | None = None,
+              fmt_kwargs: dict[str, Any] | None = None,
+              fields: BoundFields | None = None,
+              exc: Exception | None = None) -> int:
+        """Encodes record and writes it (with the new string definitions) to the IO by one call. If the record can't
+        be encoded or written, strings, sources and templates defined for it are removed from the dictionary, so the
+        next records don't reference the definitions, that weren't written.
+
+        :returns: Number of the written bytes.
+        :rtype: int
+        """
+
+        strings, sources, templates = len(self._strings), len(self._sources), len(self._templates)
+
+        try:
+            data = self.encode_record(message, time, level, logger_color, logger_name, group_name, group_color,
+                                      fmt_args, fmt_kwargs, fields, exc)
+            self.io.write(data)
+        except BaseException:
+            # ids are given in the insertion order, so the new definitions are the last items
+            for dictionary, count in ((self._strings, strings), (self._sources, sources),
+                                      (self._templates, templates)):
+                while len(dictionary) > count:
+                    dictionary.popitem()
+            raise
+
+        return len(data)
+
+    def encode_record(self,
+                      message: str,
+                      time: datetime.datetime | None,
+                      level: str | int,
+                      logger_color: str,
+                      logger_name: str,
+                      group_name: str,
+                      group_color: str,
+                      fmt_args: list[Any] | None = None,
+                      fmt_kwargs: dict[str, Any] | None = None,
+                      fields: BoundFields | None = None,
+                      exc: Exception | None = None) -> bytearray:
+        """Encodes record with the new string definitions (see :meth:`write()`).
+
+        :returns: Frames to be written.
+        :rtype: bytearray
+        """
+
+        strings = bytearray()
+
+        self._path.clear()
+        self._items_left = self.max_items
+
+        # clear the dictionary only between the records, so ids of the record are valid
+        if len(self._strings) >= self.dictionary_size:
+            self._strings.clear()
+            self._sources.clear()
+            self._templates.clear()
+            strings += FRAME.pack(TAG_CLEAR, 0)
+
+        source     = (str(level), logger_name, logger_color, group_name, group_color)
+        source_id  = self._sources.get(source)
+
+        if source_id is None:
+            source_id = self.define_source(source, strings)
+
+        template = self._templates.get(message)
+
+        if template is None:
+            # named arguments from the skip list are written only if template references them
+            template = self._templates[message] = (self.intern(message, strings),
+                                                   self.skip_kwargs.difference(parse_template(message).names))
+
+        template_id, skip = template
+
+        payload = bytearray(RECORD.pack(
+            NO_TIME if time is None else round(time.timestamp() * 1_000_000) * 1000,
+            source_id,
+            template_id,
+        ))
+
+        if fmt_args:
+            self.encode_value(fmt_args, payload, strings)
+        else:
+            payload.append(V_NONE)
+
+        self.encode_mapping(fmt_kwargs, payload, strings, skip)
+        self.encode_mapping(fields, payload, strings)
+
+        if exc is None:
+            payload.append(V_NONE)
+        else:
+            payload.append(V_INTERNED)
+            payload += STRING_ID.pack(self.intern(self.tracebacks.format(exc), strings))
+
+        strings += FRAME.pack(TAG_RECORD, len(payload))
+        strings += payload
+
+        return strings
+
+
+class BinaryReader:
+    """Streaming reader of the binary logs. Iterate it to get the :class:`BinaryRecord` objects. Truncated last frame
+    (i.e. log is still being written) ends the iteration.
+
+    :ivar io: Binary IO to read records from.
+    :type io: BinaryIO
+    """
+
+    def __init__(self, io: BinaryIO):
+        """
+        :param io: Binary IO to read records from.
+        :type io: BinaryIO
+
+        :raises BinaryFormatError: If IO isn't the binary log.
+        """
+        self.io = io
+
+        self._strings: dict[int, str]                            = {}
+        self._sources: dict[int, tuple[str, str, str, str, str]]  = {}
+
+        if self.io.read(len(MAGIC)) != MAGIC:
+            raise BinaryFormatError('Not a pyrolog binary log (or unsupported version)')
+
+    def __iter__(self) -> Iterator[BinaryRecord]:
+        strings = self._strings
+        sources = self._sources
+
+        while True:
+            header = self.io.read(FRAME.size)
+
+            if len(header) < FRAME.size:
+                return
+
+            tag, length  = FRAME.unpack(header)
+            payload      = self.io.read(length)
+
+            if len(payload) < length:
+                return
+
+            if tag == TAG_RECORD:
+                yield self.decode_record(payload)
+            elif tag == TAG_DEFINE:
+                strings[STRING_ID.unpack_from(payload)[0]] = payload[STRING_ID.size:].decode('utf8', 'surrogatepass')
+            elif tag == TAG_SOURCE:
+                source_id, *ids   = SOURCE.unpack(payload)
+                sources[source_id] = tuple(strings[i] for i in ids)
+            elif tag == TAG_CLEAR:
+                strings.clear()
+                sources.clear()
+            else:
+                raise BinaryFormatError(f'Unknown frame tag: {tag!r}')
+
+    def decode_record(self, payload: bytes) -> BinaryRecord:
+        """Decodes the record frame payload.
+
+        :param payload: Payload of the record frame.
+        :type payload: bytes
+
+        :returns: Decoded record.
+        :rtype: BinaryRecord
+        """
+
+        try:
+            time_ns, source_id, template_id  = RECORD.unpack_from(payload)
+            source                           = self._sources[source_id]
+            message                          = self._strings[template_id]
+
+            args, offset    = self.decode_value(payload, RECORD.size)
+            kwargs, offset  = self.decode_value(payload, offset)
+            fields, offset  = self.decode_value(payload, offset)
+            exc, offset     = self.decode_value(payload, offset)
+        except (KeyError, IndexError, struct.error) as e:
+            raise BinaryFormatError('Malformed record frame') from e
+
+        if time_ns == NO_TIME:
+            time = None
+        else:
+            seconds, nanoseconds  = divmod(time_ns, 1_000_000_000)
+            time                  = datetime.datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+        return BinaryRecord(time, *source, message, [] if args is None else list(args),
+                            {} if kwargs is None else kwargs, None if fields is None else BoundFields(fields), exc)
+
+    def decode_value(self, payload: bytes, offset: int) -> tuple[Any, int]:
+        """Decodes value from the payload.
+
+        :param payload: Payload of the record frame.
+        :type payload: bytes
+        :param offset: Offset of the value.
+        :type offset: int
+
+        :returns: Value and offset of the next value.
+        :rtype: tuple[Any, int]
+        """
+
+        tag      = payload[offset]
+        offset  += 1
+
+        if tag == V_NONE:
+            return None, offset
+        if tag == V_TRUE:
+            return True, offset
+        if tag == V_FALSE:
+            return False, offset
+        if tag == V_INT:
+            return INT64.unpack_from(payload, offset)[0], offset + INT64.size
+        if tag == V_FLOAT:
+            return FLOAT64.unpack_from(payload, offset)[0], offset + FLOAT64.size
+        if tag == V_INTERNED:
+            return self._strings[STRING_ID.unpack_from(payload, offset)[0]], offset + STRING_ID.size
+
+        if tag in (V_STR, V_BIGINT, V_BYTES):
+            length  = STRING_ID.unpack_from(payload, offset)[0]
+            offset += STRING_ID.size
+            data    = payload[offset:offset + length]
+
+            if tag == V_BYTES:
+                return data, offset + length
+
+            text = data.decode('utf8', 'surrogatepass')
+            return int(text) if tag == V_BIGINT else text, offset + length
+
+        if tag in (V_LIST, V_TUPLE, V_DICT):
+            count   = STRING_ID.unpack_from(payload, offset)[0]
+            offset += STRING_ID.size
+            items   = []
+
+            for _ in range(count * 2 if tag == V_DICT else count):
+                item, offset = self.decode_value(payload, offset)
+                items.append(item)
+
+            if tag == V_DICT:
+                return dict(zip(items[::2], items[1::2])), offset
+
+            return tuple(items) if tag == V_TUPLE else items, offset
+
+        if tag == V_NAMESPACE:
+            type_name, count  = self._strings[STRING_ID.unpack_from(payload, offset)[0]], \
+                                STRING_ID.unpack_from(payload, offset + STRING_ID.size)[0]
+            offset           += STRING_ID.size * 2
+            items             = {}
+
+            for _ in range(count):
+                name          = self._strings[STRING_ID.unpack_from(payload, offset)[0]]
+                items[name], offset = self.decode_value(payload, offset + STRING_ID.size)
+
+            return BinaryNamespace(type_name, items), offset
+
+        if tag in (V_OBJECT, V_EXCEPTION):
+            type_name     = self._strings[STRING_ID.unpack_from(payload, offset)[0]]
+            text, offset  = self.decode_value(payload, offset + STRING_ID.size)
+
+            return (BinaryException if tag == V_EXCEPTION else BinaryObject)(type_name, text), offset
+
+        raise BinaryFormatError(f'Unknown value tag: {tag:#x}')
+
+
+def render_binary(io: BinaryIO, formatter: Formatter, log_exceptions: bool = True) -> Iterator[str]:
+    """Renders binary log through the formatter. Logger name and group name offsets of the formatter (if it uses
+    offsets) are updated by the names met in the log.
+
+    :param io: Binary IO to read records from.
+    :type io: BinaryIO
+    :param formatter: Any formatter, i.e. :class:`pyrolog.PlainFormatter` or :class:`pyrolog.ColoredFormatter`.
+    :type formatter: Formatter
+    :param log_exceptions: Determines whether render tracebacks or not.
+    :type log_exceptions: bool
+
+    :returns: Iterator of the rendered lines (every record and traceback is one item, without the trailing newline).
+    :rtype: Iterator[str]
+    """
+
+    offsets = getattr(formatter, 'offsets', False)
+
+    for record in BinaryReader(io):
+        if offsets:
+            static = formatter.static_variables
+
+            if len(record.logger_name) > static['logger_name_offset']:
+                static['logger_name_offset'] = len(record.logger_name)
+            if len(record.group_name) > static['group_name_offset']:
+                static['group_name_offset'] = len(record.group_name)
+
+        exc = RenderedTraceback(record.exc) if log_exceptions and record.exc is not None else None
+
+        yield formatter.format(record.message, record.time, record.level, record.logger_color, record.logger_name,
+                               record.group_name, record.group_color, record.args, record.kwargs, record.fields,
+                               exc=exc if formatter.embeds_exceptions else None)
+
+        if exc is not None and not formatter.embeds_exceptions:
+            yield formatter.format_exception(exc)
@@ -1,4 +1,8 @@
-"""Contains the color bindings to the colorama library.
+"""Contains the color bindings (ANSI escape sequences, the same as colorama library uses).
+
+Colorama library is needed only on Windows, to make console understand the ANSI escape sequences. It is imported
+lazily by :func:`fix_windows_console()` (which is called by :class:`pyrolog.ColoredFormatter`), so programs that don't
+use colors don't import it.
 
 .. important::
     Due to the library's import system, if you import `pyrolog` by this code:
@@ -18,64 +22,86 @@
 
 import sys
 
-from colorama import Fore, Back, Style, init, just_fix_windows_console
+__all__ = ['TextColor', 'BGColor', 'TextStyle', 'fix_windows_console']
+
+CSI = '\033['
+"""Control sequence introducer."""
+
+windows_console_fixed = False
+"""(**System variable.** Do not change it manually) Determines whether :func:`fix_windows_console()` is done."""
+
+
+def fix_windows_console():
+    """Fixes Windows console (enables ANSI escape sequences) by the colorama library. Does nothing on other platforms,
+    if it is already done, or if the `--pyrolog-disable-windows-fix` command line argument is given."""
+
+    global windows_console_fixed
+
+    if windows_console_fixed:
+        return
+
+    windows_console_fixed = True
+
+    if sys.platform != 'win32' or '--pyrolog-disable-windows-fix' in sys.argv:
+        return
+
+    try:
+        from colorama import init, just_fix_windows_console
+    except ImportError:
+        return
 
-# fix windows console if current platform is windows, and fix isn't disabled
-if sys.platform == 'win32' and '--pyrolog-disable-windows-fix' not in sys.argv:
     init()
     just_fix_windows_console()
 
-__all__ = ['TextColor', 'BGColor', 'TextStyle']
-
 
 class TextColor:
-    """Bindings to colorama Fore colors."""
-
-    reset         = Fore.RESET
-    black         = Fore.BLACK
-    red           = Fore.RED
-    green         = Fore.GREEN
-    blue          = Fore.BLUE
-    cyan          = Fore.CYAN
-    yellow        = Fore.YELLOW
-    magenta       = Fore.MAGENTA
-    white         = Fore.WHITE
-    lightblack    = Fore.LIGHTBLACK_EX
-    lightred      = Fore.LIGHTRED_EX
-    lightgreen    = Fore.LIGHTGREEN_EX
-    lightblue     = Fore.LIGHTBLUE_EX
-    lightcyan     = Fore.LIGHTCYAN_EX
-    lightyellow   = Fore.LIGHTYELLOW_EX
-    lightmagenta  = Fore.LIGHTMAGENTA_EX
-    lightwhite    = Fore.LIGHTWHITE_EX
+    """ANSI text (foreground) colors."""
+
+    reset         = CSI + '39m'
+    black         = CSI + '30m'
+    red           = CSI + '31m'
+    green         = CSI + '32m'
+    blue          = CSI + '34m'
+    cyan          = CSI + '36m'
+    yellow        = CSI + '33m'
+    magenta       = CSI + '35m'
+    white         = CSI + '37m'
+    lightblack    = CSI + '90m'
+    lightred      = CSI + '91m'
+    lightgreen    = CSI + '92m'
+    lightblue     = CSI + '94m'
+    lightcyan     = CSI + '96m'
+    lightyellow   = CSI + '93m'
+    lightmagenta  = CSI + '95m'
+    lightwhite    = CSI + '97m'
 
 
 class BGColor:
-    """Bindings to colorama Back colors."""
-
-    reset         = Back.RESET
-    black         = Back.BLACK
-    red           = Back.RED
-    green         = Back.GREEN
-    blue          = Back.BLUE
-    cyan          = Back.CYAN
-    yellow        = Back.YELLOW
-    magenta       = Back.MAGENTA
-    white         = Back.WHITE
-    lightblack    = Back.LIGHTBLACK_EX
-    lightred      = Back.LIGHTRED_EX
-    lightgreen    = Back.LIGHTGREEN_EX
-    lightblue     = Back.LIGHTBLUE_EX
-    lightcyan     = Back.LIGHTCYAN_EX
-    lightyellow   = Back.LIGHTYELLOW_EX
-    lightmagenta  = Back.LIGHTMAGENTA_EX
-    lightwhite    = Back.LIGHTWHITE_EX
+    """ANSI background colors."""
+
+    reset         = CSI + '49m'
+    black         = CSI + '40m'
+    red           = CSI + '41m'
+    green         = CSI + '42m'
+    blue          = CSI + '44m'
+    cyan          = CSI + '46m'
+    yellow        = CSI + '43m'
+    magenta       = CSI + '45m'
+    white         = CSI + '47m'
+    lightblack    = CSI + '100m'
+    lightred      = CSI + '101m'
+    lightgreen    = CSI + '102m'
+    lightblue     = CSI + '104m'
+    lightcyan     = CSI + '106m'
+    lightyellow   = CSI + '103m'
+    lightmagenta  = CSI + '105m'
+    lightwhite    = CSI + '107m'
 
 
 class TextStyle:
-    """Bindings to colorama Style."""
+    """ANSI text styles."""
 
-    reset   = Style.RESET_ALL
-    dim     = Style.DIM
-    bold    = Style.BRIGHT
-    normal  = Style.NORMAL
+    reset   = CSI + '0m'
+    dim     = CSI + '2m'
+    bold    = CSI + '1m'
+    normal  = CSI + '22m'
@@ -0,0 +1,99 @@
+"""Dedicated module for the context scopes, that are based on the :mod:`contextvars`.
+
+.. important::
+    Due to the library's import system, if you import `pyrolog` by this code:
+
+    .. code-block:: python
+
+        import pyrolog
+
+    You must use this as:
+
+    .. code-block:: python
+
+        pyrolog.context(request_id=...)
+
+    As example.
+"""
+
+from contextvars import ContextVar, Token
+
+from ._types import BoundFields
+
+from typing import Any
+
+__all__ = ['ContextScope', 'context', 'get_context']
+
+context_fields: ContextVar[BoundFields | None] = ContextVar('pyrolog_context_fields', default=None)
+"""Context variable with the fields of the current scope. Is `None` when no scope is entered."""
+
+
+class ContextScope:
+    """Scope that merges its fields into every record logged inside it. Works as a context manager and as an async
+    context manager. Scopes are stored in the :mod:`contextvars`, so they are propagated to the `asyncio` tasks and to
+    the code that is run by `contextvars.copy_context().run(...)`.
+
+    Nested scopes inherit fields of the outer scopes.
+
+    :ivar fields: Fields of the scope.
+    :type fields: dict[str, Any]
+    """
+
+    def __init__(self, fields: dict[str, Any]):
+        """
+        :param fields: Fields of the scope.
+        :type fields: dict[str, Any]
+        """
+
+        self.fields  = fields
+        self._token: Token | None = None
+
+    def __enter__(self) -> BoundFields:
+        current = context_fields.get()
+        merged  = BoundFields(self.fields) if current is None else BoundFields(current, **self.fields)
+
+        self._token = context_fields.set(merged)
+        return merged
+
+    def __exit__(self, *exc_info: Any):
+        context_fields.reset(self._token)
+        self._token = None
+
+    async def __aenter__(self) -> BoundFields:
+        return self.__enter__()
+
+    async def __aexit__(self, *exc_info: Any):
+        self.__exit__(*exc_info)
+
+
+def context(**fields: Any) -> ContextScope:
+    """Makes a new context scope with the given fields.
+
+    Example:
+
+    .. code-block:: python
+
+        with pyrolog.context(request_id=request.id):
+            logger.info('Handling request')  # request_id is available to the formatters
+
+        async with pyrolog.context(trace_id=trace_id):
+            await handle()
+
+    :param fields: Fields of the scope.
+    :type fields: Any
+
+    :returns: Context scope.
+    :rtype: ContextScope
+    """
+
+    return ContextScope(fields)
+
+
+def get_context() -> BoundFields | None:
+    """Gets fields of the current context scope.
+
+    :returns: Fields of the current scope or `None` if no scope is entered.
+    :rtype: BoundFields | None
+    """
+
+    return context_fields.get()
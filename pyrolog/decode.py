@@ -0,0 +1,121 @@
+"""Command line decoder of the binary logs (written by :class:`pyrolog.BinaryHandler`). Renders binary log through
+the :class:`pyrolog.PlainFormatter`, :class:`pyrolog.ColoredFormatter` or :class:`pyrolog.JsonFormatter`.
+
+Usage:
+
+.. code-block:: shell
+
+    $ python -m pyrolog.decode app.plog
+    $ python -m pyrolog.decode --colored --maximum app.plog | less -R
+    $ tail -c +1 -f app.plog | python -m pyrolog.decode -
+
+.. important::
+    This module isn't imported by ``import pyrolog``. Import it as is:
+
+    .. code-block:: python
+
+        import pyrolog.decode
+
+        pyrolog.decode.main(['app.plog'])
+"""
+
+import argparse
+import sys
+
+from . import defaults
+from .binary import BinaryFormatError, render_binary
+from .formatters import Formatter, PlainFormatter, ColoredFormatter, JsonFormatter
+
+__all__ = ['make_formatter', 'main']
+
+
+def resolve_format_string(value: str) -> str:
+    """Resolves format string given in the command line. It can be the name of the format string defined in
+    :mod:`pyrolog.defaults` (i.e. ``MAXIMUM_FORMAT_STRING``) or the format string itself.
+
+    :param value: Name of the format string or the format string.
+    :type value: str
+
+    :returns: Format string.
+    :rtype: str
+    """
+
+    if value.isidentifier() and value.endswith('FORMAT_STRING'):
+        return getattr(defaults, value)
+
+    return value
+
+
+def make_formatter(args: argparse.Namespace) -> Formatter:
+    """Makes formatter by the parsed command line arguments.
+
+    :param args: Parsed command line arguments.
+    :type args: argparse.Namespace
+
+    :returns: Formatter.
+    :rtype: Formatter
+    """
+
+    if args.json:
+        return JsonFormatter()
+
+    prefix = 'COLORED_' if args.colored else ''
+
+    if args.maximum:
+        format_string       = getattr(defaults, prefix + 'MAXIMUM_FORMAT_STRING')
+        time_format_string  = getattr(defaults, prefix + 'MAXIMUM_TIME_FORMAT_STRING')
+    else:
+        format_string       = getattr(defaults, prefix + 'TIMED_MINIMAL_FORMAT_STRING')
+        time_format_string  = getattr(defaults, prefix + 'MINIMAL_TIME_FORMAT_STRING')
+
+    if args.format is not None:
+        format_string = resolve_format_string(args.format)
+    if args.time_format is not None:
+        time_format_string = resolve_format_string(args.time_format)
+
+    formatter_class = ColoredFormatter if args.colored else PlainFormatter
+
+    return formatter_class(format_string, time_format_string)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point of the decoder.
+
+    :param argv: Command line arguments. If it isn't given, `sys.argv` is used.
+    :type argv: list[str] | None
+
+    :returns: Exit code.
+    :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(prog='python -m pyrolog.decode', description='Renders pyrolog binary logs.')
+    parser.add_argument('path', help='path to the binary log, "-" to read it from the stdin')
+    parser.add_argument('-c', '--colored', action='store_true', help='use the colored formatter')
+    parser.add_argument('-j', '--json', action='store_true', help='render records as JSON lines')
+    parser.add_argument('-m', '--maximum', action='store_true', help='use the maximum format strings')
+    parser.add_argument('-f', '--format', help='format string or name of the format string from pyrolog.defaults')
+    parser.add_argument('-t', '--time-format', help='time format string or name of the one from pyrolog.defaults')
+    parser.add_argument('--no-exceptions', action='store_true', help='don\'t render tracebacks')
+    args = parser.parse_args(argv)
+
+    formatter = make_formatter(args)
+
+    io = sys.stdin.buffer if args.path == '-' else open(args.path, 'rb')
+
+    try:
+        for line in render_binary(io, formatter, log_exceptions=not args.no_exceptions):
+            sys.stdout.write(line + '\n')
+    except BinaryFormatError as e:
+        print(f'{parser.prog}: error: {e}', file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        sys.stderr.close()
+    finally:
+        if io is not sys.stdin.buffer:
+            io.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
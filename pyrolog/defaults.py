@@ -48,6 +48,13 @@ MAXIMUM_TIME_FORMAT_STRING_FILENAME_SAFE = '{year:04d}_{month:02d}_{day:02d}-{ho
 MAXIMUM_FORMAT_STRING = '{time} | {level:<{level_offset}} | {group_name:<{group_name_offset}} | {logger_name:<{logger_name_offset}} -> {message}'
 """Format specification that is recommended for professional, large projects."""
 
+TEMPLATE_CACHE_SIZE = 512
+"""Size of the LRU cache with the parsed templates (messages and format strings)."""
+
+ENCODED_SEGMENTS_CACHE_SIZE = 4096
+"""Maximum count of the encoded fields of the format string cached by every formatter (see
+:meth:`pyrolog.PlainFormatter.format_bytes()`). Cache is cleared when it is full."""
+
 DEFAULT_LOGGING_CONTEXT = LoggingContext(DEFAULT_LOG_LEVELS)
 """The logging context that is used by all elements of the logging library by default."""
 
@@ -75,6 +82,71 @@ DEFAULT_COLOR_DICT = {
 }
 """The default color dict that is used by ColoredFormatter"""
 
+TRACEBACK_CACHE_SIZE = 256
+"""Size of the LRU cache with the rendered tracebacks (used by formatters)."""
+
+JSON_PREFIXES_CACHE_SIZE = 4096
+"""Maximum count of the encoded constant parts of the records cached by :class:`pyrolog.JsonFormatter`."""
+
+BINARY_PREVIEW = 64
+"""Default maximum count of the rendered bytes of the binary values (bytes, bytearray, memoryview)."""
+
+BINARY_DICTIONARY_SIZE = 65536
+"""Maximum count of the strings in the dictionary of the binary log (see :class:`pyrolog.BinaryWriter`)."""
+
+BINARY_MAX_DEPTH = 32
+"""Maximum depth of the nested containers written to the binary log, deeper values (i.e. of the self-referencing
+containers) are written as `...` (see :class:`pyrolog.BinaryWriter`)."""
+
+BINARY_MAX_ITEMS = 10000
+"""Maximum total count of the items of the containers written to the binary log per record, the rest of the items
+are written as `... (+N)` (see :class:`pyrolog.BinaryWriter`)."""
+
+HEALTH_EWMA_ALPHA = 0.2
+"""Weight of the last record in the moving averages of the handler latency and errors (see
+:class:`pyrolog.HandlerHealth`)."""
+
+BREAKER_ERROR_RATE = 0.5
+"""Default average error rate of the handler, at which its circuit breaker trips (see :class:`pyrolog.GuardedHandler`)."""
+
+BREAKER_MAX_LATENCY = 0.25
+"""Default average write latency of the handler in seconds, at which its circuit breaker trips."""
+
+BREAKER_COOLDOWN = 5.0
+"""Default time in seconds, for which the tripped handler is bypassed before it is tried again."""
+
+QUEUE_SIZE = 10000
+"""Default maximum count of the records waiting in the queue of the :class:`pyrolog.QueueHandler`."""
+
+SHED_HIGH_WATERMARK = 0.8
+"""Default fill of the queue (from 0 to 1), at which the :class:`pyrolog.QueueHandler` raises its effective level."""
+
+SHED_LOW_WATERMARK = 0.2
+"""Default fill of the queue (from 0 to 1), at which the :class:`pyrolog.QueueHandler` lowers its effective level back."""
+
+SHED_COOLDOWN = 1.0
+"""Default minimum time in seconds between the changes of the effective level of the :class:`pyrolog.QueueHandler`."""
+
+SHUTDOWN_TIMEOUT = 5.0
+"""Default time in seconds, for which the handlers are drained at shutdown (i.e. at the exit)."""
+
+ATOMIC_WRITE_SIZE = 4096
+"""Default maximum size in bytes of the record written to the appended file without the advisory lock (see
+:class:`pyrolog.AppendIO`). It is the ``PIPE_BUF`` of Linux, the size of writes that POSIX guarantees to be atomic."""
+
+MAX_VALUE_ITEMS = 100
+"""Default maximum count of the rendered items of every list, tuple, dict, set or deque (used by
+ColoredFormatter)."""
+
+MAX_VALUE_DEPTH = 16
+"""Default maximum depth of the rendered nested containers (used by ColoredFormatter)."""
+
+MAX_VALUE_CHARS = 16384
+"""Default maximum length of the every rendered argument, colors aren't counted (used by ColoredFormatter)."""
+
+MAX_VALUE_STRING = 4096
+"""Default maximum length of the every rendered string (used by ColoredFormatter)."""
+
 COLORED_MINIMAL_FORMAT_STRING = '{level_color}{level:<{level_offset}}{reset} {message}'
 """The colored minimal formatter specification, which is the default for the colored formatter and recommended for small projects."""
 
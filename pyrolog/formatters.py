@@ -16,31 +16,245 @@
     As example.
 """
 
-import traceback
+import copy
 import datetime
+import re
+import string
+import weakref
 
 from abc import abstractmethod
-from collections import namedtuple
+from collections import deque, namedtuple
 from functools import lru_cache
+from itertools import islice
 
 from . import empty_colors
 from .logging_context import LoggingContext
-from ._types import VarDict, ColorDict
+from ._types import VarDict, ColorDict, BoundFields
 from .defaults import (DEFAULT_LOGGING_CONTEXT,
+                       JSON_PREFIXES_CACHE_SIZE,
+                       TEMPLATE_CACHE_SIZE,
+                       ENCODED_SEGMENTS_CACHE_SIZE,
+                       BINARY_PREVIEW,
                        MINIMAL_FORMAT_STRING,
                        MINIMAL_TIME_FORMAT_STRING,
                        COLORED_MINIMAL_FORMAT_STRING,
                        COLORED_MINIMAL_TIME_FORMAT_STRING,
-                       DEFAULT_COLOR_DICT)
-from .colors import TextColor, BGColor, TextStyle
+                       DEFAULT_COLOR_DICT,
+                       MAX_VALUE_ITEMS,
+                       MAX_VALUE_DEPTH,
+                       MAX_VALUE_CHARS,
+                       MAX_VALUE_STRING)
+from .colors import TextColor, BGColor, TextStyle, fix_windows_console
+from .tracebacks import TracebackCache
 
-from typing import Any
+from typing import Any, Callable
 
-__all__ = ['fmt', 'Uncolored', 'Formatter', 'PlainFormatter', 'ColoredFormatter']
+__all__ = ['fmt', 'Uncolored', 'Lazy', 'lazy', 'Template', 'parse_template', 'compile_template', 'strip_styles',
+           'Formatter', 'PlainFormatter', 'ColoredFormatter', 'JsonFormatter']
 
 fmt = namedtuple('FormatTuple', ('format_string', 'string'))
 """Special type to specify formatting in :class:`ColoredFormatter` use case."""
 
+TRUNCATION_MARK = '...'
+"""Mark of the truncated parts of the values rendered by :class:`ColoredFormatter`."""
+
+DictItem = namedtuple('DictItem', ('key', 'separator', 'value'))
+"""Item of the dict, that is pushed to the rendering stack by :meth:`ColoredFormatter.format_dict()`."""
+
+BINARY_TYPES = (bytes, bytearray, memoryview)
+"""Types of the binary values, that are rendered by :meth:`PlainFormatter.format_binary()`. Other objects with the
+buffer protocol are rendered by it too (see :func:`is_binary()`)."""
+
+BINARY_TYPE_CACHE: dict[type, bool] = {}
+"""(**System variable.** Do not change it manually) Cache of :func:`is_binary()` results by the type."""
+
+STATIC_FIELD_TYPES = (str, int, float, bool, bytes, type(None))
+"""Types of the bound fields values, that are rendered once and cached by formatters."""
+
+STYLE_PATTERN = re.compile('\x1b\\[[0-9;]*m')
+"""Pattern of the style tokens (ANSI SGR sequences) in the rendered text."""
+
+FORMAT_PARSER = string.Formatter()
+"""Parser of the format strings (see :meth:`string.Formatter.parse()`)."""
+
+FIELD_NAME_PATTERN = re.compile(r'[^.\[]*')
+"""Pattern of the first part of the field name (argument name or index, before the attribute or item access)."""
+
+Template = namedtuple('Template', ('names', 'positional', 'literal'))
+"""Parsed template (message or format string). `names` is a frozenset with the names of the fields referenced by
+template (including fields in the format specs, i.e. `level_offset` in `{level:<{level_offset}}`), `positional` is
+`True` if template references positional arguments, `literal` is the ready string if template has no fields at all
+(otherwise it is `None`)."""
+
+Segment = namedtuple('Segment', ('data', 'template', 'names', 'variable'))
+"""Segment of the format string compiled by :func:`compile_template()`. Segment is one of:
+
+* `data` - encoded literal text;
+* `template` and `names` - part of the format string (i.e. ` | {level:<{level_offset}} | `), that doesn't depend on
+  the message, time and context, so it is the same for all the records of the logger and level, and is encoded once
+  for every combination of the values of the `names`;
+* `template` - part of the format string, that is formatted and encoded for every record;
+* `variable` - name of the record variable (i.e. `message`), which value is encoded as is.
+"""
+
+RECORD_VARIABLES = frozenset({'message', 'time', 'context'})
+"""Variables of the format string, that are different for every record."""
+
+
+def supports_buffer(value: Any) -> bool:
+    """Checks if value supports the buffer protocol.
+
+    :param value: Value to check.
+    :type value: Any
+
+    :returns: `True` if value supports the buffer protocol, otherwise `False`.
+    :rtype: bool
+    """
+
+    try:
+        memoryview(value).release()
+    except TypeError:
+        return False
+
+    return True
+
+
+def is_binary(value: Any) -> bool:
+    """Checks if value is rendered as the binary value by the formatters (see
+    :meth:`PlainFormatter.format_binary()`): it is `bytes`, `bytearray`, `memoryview` or other object with the buffer
+    protocol (i.e. `array.array` or numpy array). Result is cached by the type of the value.
+
+    :param value: Value to check.
+    :type value: Any
+
+    :returns: `True` if value is rendered as the binary value, otherwise `False`.
+    :rtype: bool
+    """
+
+    type_   = type(value)
+    binary  = BINARY_TYPE_CACHE.get(type_)
+
+    if binary is None:
+        binary = BINARY_TYPE_CACHE[type_] = isinstance(value, BINARY_TYPES) or supports_buffer(value)
+
+    return binary
+
+
+def strip_styles(text: str) -> str:
+    """Encodes styled text (text rendered with the style tokens, i.e. by :class:`ColoredFormatter`) as plain text,
+    by dropping the style tokens. It is one pass over the text, without rendering it again.
+
+    :param text: Styled text.
+    :type text: str
+
+    :returns: Plain text.
+    :rtype: str
+    """
+
+    if '\x1b' not in text:
+        return text
+
+    return STYLE_PATTERN.sub('', text)
+
+
+@lru_cache(TEMPLATE_CACHE_SIZE)
+def parse_template(template: str) -> Template:
+    """Parses template once and caches the result (bounded LRU, see
+    :data:`pyrolog.defaults.TEMPLATE_CACHE_SIZE`).
+
+    :param template: Message or format string.
+    :type template: str
+
+    :returns: Parsed template.
+    :rtype: Template
+    """
+
+    names       = set()
+    positional  = False
+    literals    = []
+    has_fields  = False
+    templates   = [template, ]
+
+    while templates:
+        for literal, field_name, format_spec, _ in FORMAT_PARSER.parse(templates.pop()):
+            literals.append(literal)
+
+            if field_name is None:
+                continue
+
+            has_fields  = True
+            first       = FIELD_NAME_PATTERN.match(field_name).group()
+
+            if first == '' or first.isdigit():
+                positional = True
+            else:
+                names.add(first)
+
+            if format_spec and '{' in format_spec:
+                templates.append(format_spec)
+
+    return Template(frozenset(names), positional, None if has_fields else ''.join(literals))
+
+
+@lru_cache(TEMPLATE_CACHE_SIZE)
+def compile_template(template: str, encoding: str) -> tuple[Segment, ...] | None:
+    """Splits format string to the segments with the encoded literal text, for the formatting to bytes (see
+    :meth:`PlainFormatter.format_bytes()`). Result is cached (bounded LRU, see
+    :data:`pyrolog.defaults.TEMPLATE_CACHE_SIZE`).
+
+    :param template: Format string.
+    :type template: str
+    :param encoding: Encoding.
+    :type encoding: str
+
+    :returns: Segments, or None if template references positional arguments (fields can't be formatted separately).
+    :rtype: tuple[Segment, ...] | None
+    """
+
+    if parse_template(template).positional:
+        return None
+
+    segments  = []
+    text      = ''
+    constant  = ''
+    names     = set()
+
+    def flush_constant():
+        if constant:
+            segments.append(Segment(text.encode(encoding), None, None, None) if not names else
+                            Segment(None, constant, tuple(sorted(names)), None))
+
+    # adjacent literal text and fields, that don't depend on the record, are joined to one segment
+    for literal, field_name, format_spec, conversion in FORMAT_PARSER.parse(template):
+        text      += literal
+        constant  += literal.replace('{', '{{').replace('}', '}}')
+
+        if field_name is None:
+            continue
+
+        field         = '{' + field_name + ('!' + conversion if conversion else '') + \
+            (':' + format_spec if format_spec else '') + '}'
+        field_names   = parse_template(field).names
+
+        if not field_names & RECORD_VARIABLES:
+            constant += field
+            names    |= field_names
+            continue
+
+        flush_constant()
+        text      = ''
+        constant  = ''
+        names     = set()
+
+        if field_name in RECORD_VARIABLES and not conversion and not format_spec:
+            segments.append(Segment(None, None, None, field_name))
+        else:
+            segments.append(Segment(None, field, None, None))
+
+    flush_constant()
+
+    return tuple(segments)
+
 ####
 
 
@@ -66,6 +280,74 @@ class Uncolored:
     def __repr__(self):
         return repr(self.value)
 
+
+class Lazy:
+    """Argument that is evaluated only when the record is accepted by some handler and is formatted. Value is
+    evaluated once, even if record is formatted by the many handlers. Use :func:`lazy` to make it.
+
+    :ivar func: Function without arguments, that returns the value.
+    :type func: Callable[[], Any]
+    :ivar evaluated: Determines whether value is already evaluated.
+    :type evaluated: bool
+    """
+
+    __slots__ = ('func', 'evaluated', '_value')
+
+    def __init__(self, func: Callable[[], Any]):
+        """
+        :param func: Function without arguments, that returns the value.
+        :type func: Callable[[], Any]
+        """
+
+        self.func       = func
+        self.evaluated  = False
+        self._value     = None
+
+    @property
+    def value(self) -> Any:
+        """Evaluated value."""
+
+        if not self.evaluated:
+            self._value     = self.func()
+            self.evaluated  = True
+
+        return self._value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.value, name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.value[key]
+
+    def __format__(self, format_spec):
+        return self.value.__format__(format_spec)
+
+    def __str__(self):
+        return str(self.value)
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+def lazy(func: Callable[[], Any]) -> Lazy:
+    """Makes lazy argument. Function is called only when the record is really formatted, so expensive arguments cost
+    nothing while their level is filtered.
+
+    Example:
+
+    .. code-block:: python
+
+        logger.debug('State: {}', pyrolog.lazy(lambda: expensive_summary(state)))
+
+    :param func: Function without arguments, that returns the value.
+    :type func: Callable[[], Any]
+
+    :returns: Lazy argument.
+    :rtype: Lazy
+    """
+
+    return Lazy(func)
+
 ####
 
 
@@ -82,8 +364,23 @@ class Formatter:
     :type logging_context: LoggingContext
     :ivar time_formatting: (**System variable.** Do not change it manually) Determines whether to spend time formatting time.
     :type time_formatting: bool
+    :ivar embeds_exceptions: If it is True, exception is passed to :meth:`format()` and is included to the formatted
+        record, otherwise handlers write :meth:`format_exception()` after the record.
+    :type embeds_exceptions: bool
+    :ivar source: Formatter, which styled output encoded by :func:`strip_styles()` is the output of this formatter
+        (i.e. plain variant of the :class:`ColoredFormatter`). Handlers use it to render record once for the colored
+        and plain streams.
+    :type source: Formatter | None
+    :ivar origin: Formatter, which copy this formatter is (i.e. profiled copy, see
+        :meth:`pyrolog.Profiler.profiled_formatter()`). Copies share the cache of the rendered bound fields with it,
+        so the short-lived copies don't add entries to the cache.
+    :type origin: Formatter | None
     """
 
+    embeds_exceptions = False
+    source: 'Formatter | None' = None
+    origin: 'Formatter | None' = None
+
     def __init__(self,
                  format_string: str = MINIMAL_FORMAT_STRING,
                  time_format_string: str = MINIMAL_TIME_FORMAT_STRING,
@@ -108,7 +405,7 @@ class Formatter:
 
         self.time_formatting = '{time}' in self.format_string
 
-        defined_formatters.append(self)
+        defined_formatters.add(self)
 
     @property
     def format_string(self):
@@ -142,6 +439,63 @@ class Formatter:
             return True
         return False
 
+    def render_template(self,
+                        template: str,
+                        variables: VarDict,
+                        fmt_args: list[Any] | tuple[Any, ...] = (),
+                        fmt_kwargs: dict[str, Any] | None = None
+                        ) -> str:
+        """Formats template. Only the fields referenced by template are looked up, names are searched in the
+        `variables`, then in the `fmt_kwargs` and then in the static variables. Found fields are added to the
+        `variables` dict (so it must be the dict made for the current record), then it is passed to the formatting as
+        is, without merging all the variables into a new dict.
+
+        :param template: Message or format string.
+        :type template: str
+        :param variables: Variables of the record (level, logger name, etc.).
+        :type variables: VarDict
+        :param fmt_args: Positioned arguments for formatting.
+        :type fmt_args: list[Any] | tuple[Any, ...]
+        :param fmt_kwargs: Named arguments for formatting.
+        :type fmt_kwargs: dict[str, Any] | None
+
+        :returns: Formatted template.
+        :rtype: str
+        """
+
+        names, positional, literal = parse_template(template)
+
+        if literal is not None:
+            return literal
+
+        missing = names.difference(variables)
+
+        if missing:
+            static_variables = self.static_variables
+
+            for name in missing:
+                if fmt_kwargs and name in fmt_kwargs:
+                    variables[name] = fmt_kwargs[name]
+                elif name in static_variables:
+                    variables[name] = static_variables[name]
+
+        if positional:
+            return template.format(*fmt_args, **variables)
+
+        return template.format_map(variables)
+
+    def for_stream(self, colors: bool) -> 'Formatter':
+        """Gets formatter, that must be used for the stream. By default, it is this formatter.
+
+        :param colors: Determines whether stream supports colors (see :func:`pyrolog.utils.supports_colors()`).
+        :type colors: bool
+
+        :returns: Formatter.
+        :rtype: Formatter
+        """
+
+        return self
+
     @abstractmethod
     def format(self,
                message: str,
@@ -152,10 +506,39 @@ class Formatter:
                group_name: str,
                group_color: str,
                fmt_args: list[Any],
-               fmt_kwargs: dict[str, Any]
+               fmt_kwargs: dict[str, Any],
+               fields: BoundFields | None = None,
+               exc: Exception | None = None
                ):
         raise NotImplementedError('Method "format()" isn\'t implemented')
 
+    def format_bytes(self,
+                     encoding: str,
+                     message: str,
+                     time: datetime.datetime | None,
+                     level: str,
+                     logger_color: str,
+                     logger_name: str,
+                     group_name: str,
+                     group_color: str,
+                     fmt_args: list[Any],
+                     fmt_kwargs: dict[str, Any],
+                     fields: BoundFields | None = None,
+                     exc: Exception | None = None
+                     ) -> bytes:
+        """Formats record to bytes, for the handlers with the binary IOs (see :class:`pyrolog.IOHandler`). By
+        default, it is the encoded result of :meth:`format()`.
+
+        :param encoding: Encoding.
+        :type encoding: str
+
+        :returns: Encoded record.
+        :rtype: bytes
+        """
+
+        return self.format(message, time, level, logger_color, logger_name, group_name, group_color,
+                           fmt_args, fmt_kwargs, fields, exc).encode(encoding)
+
     @abstractmethod
     def format_exception(self, exc: Exception):
         raise NotImplementedError('Method "format_exception()" isn\'t implemented')
@@ -170,15 +553,53 @@ class PlainFormatter(Formatter):
 
     :ivar offsets: Determines whether to use offsets or not.
     :type offsets: bool
+    :ivar binary_preview: Maximum count of the rendered bytes of the binary values (`bytes`, `bytearray`,
+        `memoryview` and other objects with the buffer protocol). `None` means no limit.
+    :type binary_preview: int | None
+    :ivar binary_hex: If it is set to True, binary values are rendered as hex dump, instead of escaped string.
+    :type binary_hex: bool
+    :ivar tracebacks: Cache of the rendered tracebacks, used by :meth:`format_exception()`.
+    :type tracebacks: TracebackCache
+    :ivar render_generation: (**System variable.** Do not change it manually) Is increased when the cached rendered
+        fields must be rendered again.
+    :type render_generation: int
+    :ivar encoded_segments: (**System variable.** Do not change it manually) Cache of the encoded fields of the format
+        string, that are the same for all the records of the logger and level (see :meth:`format_bytes()`), by the
+        encoding, field and values of the variables used by the field.
+    :type encoded_segments: dict[tuple, bytes]
     """
 
-    def __init__(self, *args: Any, offsets: bool = True, **kwargs: dict[str, Any]):
+    render_generation = 0
+
+    def __init__(self,
+                 *args: Any,
+                 offsets: bool = True,
+                 binary_preview: int | None = BINARY_PREVIEW,
+                 binary_hex: bool = False,
+                 max_frames: int | None = None,
+                 collapse_tracebacks: bool = False,
+                 **kwargs: dict[str, Any]):
         """
         :param offsets: If True, format string can use offsets to prettify output.
         :type offsets: bool
+        :param binary_preview: Maximum count of the rendered bytes of the binary values (`bytes`, `bytearray`,
+            `memoryview` and other objects with the buffer protocol). `None` means no limit.
+        :type binary_preview: int | None
+        :param binary_hex: If it is set to True, binary values are rendered as hex dump, instead of escaped string.
+        :type binary_hex: bool
+        :param max_frames: Maximum count of the rendered frames of the tracebacks. `None` means no limit.
+        :type max_frames: int | None
+        :param collapse_tracebacks: If it is set to True, repeated identical tracebacks are collapsed to the
+            `same as #N (seen K times)` reference.
+        :type collapse_tracebacks: bool
         """
         super().__init__(*args, **kwargs)
 
+        self.tracebacks                            = TracebackCache(max_frames=max_frames, collapse=collapse_tracebacks)
+        self.encoded_segments: dict[tuple, bytes]  = {}
+
+        self.binary_preview                          = binary_preview
+        self.binary_hex                              = binary_hex
         self.offsets                                 = offsets
         self.static_variables['level_offset']        = self.logging_context.get_level_offset() if offsets else 0
         self.static_variables['logger_name_offset']  = self.logging_context.get_logger_name_offset() if offsets else 0
@@ -197,17 +618,99 @@ class PlainFormatter(Formatter):
                        group_color: str,
                        fmt_args: list[Any],
                        fmt_kwargs: dict[str, Any]):
-        return message.format(
-            level=level,
-            logger_color=logger_color,
-            logger_name=logger_name,
-            group_name=group_name,
-            group_color=group_color,
-            *fmt_args,
-            **fmt_kwargs,
-            **self.static_variables,
+        return self.render_template(
+            message,
+            {
+                'level': level,
+                'logger_color': logger_color,
+                'logger_name': logger_name,
+                'group_name': group_name,
+                'group_color': group_color,
+            },
+            fmt_args,
+            fmt_kwargs,
         )
 
+    def prepare_arguments(self,
+                          message: str,
+                          fmt_args: list[Any] | tuple[Any, ...],
+                          fmt_kwargs: dict[str, Any]
+                          ) -> tuple[list[Any] | tuple[Any, ...], dict[str, Any]]:
+        """Prepares arguments of the record for formatting (see :meth:`prepare_variables()`). By default, replaces
+        binary arguments with their previews (see :meth:`replace_binary()`).
+
+        :param message: Message.
+        :type message: str
+        :param fmt_args: Positioned arguments for formatting.
+        :type fmt_args: list[Any] | tuple[Any, ...]
+        :param fmt_kwargs: Named arguments for formatting.
+        :type fmt_kwargs: dict[str, Any]
+
+        :returns: Prepared positioned and named arguments.
+        :rtype: tuple[list[Any] | tuple[Any, ...], dict[str, Any]]
+        """
+
+        return self.replace_binary(fmt_args, fmt_kwargs)
+
+    def record_variables(self,
+                         level: str,
+                         logger_color: str,
+                         logger_name: str,
+                         group_name: str,
+                         group_color: str) -> VarDict:
+        """Makes variables of the record, that don't depend on the message (see :meth:`prepare_variables()`).
+
+        :returns: Variables of the record.
+        :rtype: VarDict
+        """
+
+        return {
+            'level': level,
+            'logger_color': logger_color,
+            'logger_name': logger_name,
+            'group_name': group_name,
+            'group_color': group_color,
+        }
+
+    def prepare_variables(self,
+                          message: str,
+                          time: datetime.datetime | None,
+                          level: str,
+                          logger_color: str,
+                          logger_name: str,
+                          group_name: str,
+                          group_color: str,
+                          fmt_args: list[Any],
+                          fmt_kwargs: dict[str, Any],
+                          fields: BoundFields | None = None
+                          ) -> tuple[VarDict, list[Any] | tuple[Any, ...], dict[str, Any]]:
+        """Prepares variables of the format string: arguments (see :meth:`prepare_arguments()`), variables of the
+        record (see :meth:`record_variables()`), bound fields and the context prefix, message and time. Is shared by
+        :meth:`format()` and :meth:`format_bytes()`, so they differ only in the rendering of the format string.
+
+        :returns: Variables, positioned and named arguments for the format string.
+        :rtype: tuple[VarDict, list[Any] | tuple[Any, ...], dict[str, Any]]
+        """
+
+        fmt_args, fmt_kwargs = self.prepare_arguments(message, fmt_args, fmt_kwargs)
+
+        context = ''
+
+        if fields:
+            rendered_fields, context  = self.render_fields(fields)
+            fmt_kwargs                = {**rendered_fields, **fmt_kwargs}
+
+        variables = self.record_variables(level, logger_color, logger_name, group_name, group_color)
+
+        # named argument of the record overrides the context prefix
+        if 'context' not in fmt_kwargs:
+            variables['context'] = context
+
+        variables['message']  = self.render_template(message, variables, fmt_args, fmt_kwargs)
+        variables['time']     = self.format_time(time) if self.time_formatting else '*'
+
+        return variables, fmt_args, fmt_kwargs
+
     def format(self,
                message: str,
                time: datetime.datetime | None,
@@ -217,45 +720,220 @@ class PlainFormatter(Formatter):
                group_name: str,
                group_color: str,
                fmt_args: list[Any],
-               fmt_kwargs: dict[str, Any]
+               fmt_kwargs: dict[str, Any],
+               fields: BoundFields | None = None,
+               exc: Exception | None = None
                ):
-        return self.format_string.format(
-            message=self.format_message(
-                message,
-                level,
-                logger_color,
-                logger_name,
-                group_name,
-                group_color,
-                fmt_args,
-                fmt_kwargs
-            ),
-            time=self.format_time(time) if self.time_formatting else '*',
-            level=level,
-            logger_color=logger_color,
-            logger_name=logger_name,
-            group_name=group_name,
-            group_color=group_color,
-            *fmt_args,
-            **fmt_kwargs,
-            **self.static_variables,
-        )
+        variables, fmt_args, fmt_kwargs = self.prepare_variables(message, time, level, logger_color, logger_name,
+                                                                 group_name, group_color, fmt_args, fmt_kwargs,
+                                                                 fields)
+
+        return self.render_template(self.format_string, variables, fmt_args, fmt_kwargs)
+
+    def format_bytes(self,
+                     encoding: str,
+                     message: str,
+                     time: datetime.datetime | None,
+                     level: str,
+                     logger_color: str,
+                     logger_name: str,
+                     group_name: str,
+                     group_color: str,
+                     fmt_args: list[Any],
+                     fmt_kwargs: dict[str, Any],
+                     fields: BoundFields | None = None,
+                     exc: Exception | None = None
+                     ) -> bytes:
+        """Formats record to bytes. Literal text of the format string is encoded once (see
+        :func:`compile_template()`), fields, that don't depend on the message, time and context (i.e. level column,
+        logger and group names), are encoded once for every combination of their values (see
+        :attr:`encoded_segments`), so only the message, time and context are encoded for every record.
+
+        :param encoding: Encoding.
+        :type encoding: str
+
+        :returns: Encoded record.
+        :rtype: bytes
+        """
+
+        segments = compile_template(self.format_string, encoding)
+
+        if segments is None:
+            return super().format_bytes(encoding, message, time, level, logger_color, logger_name, group_name,
+                                        group_color, fmt_args, fmt_kwargs, fields, exc)
+
+        variables, fmt_args, fmt_kwargs = self.prepare_variables(message, time, level, logger_color, logger_name,
+                                                                 group_name, group_color, fmt_args, fmt_kwargs,
+                                                                 fields)
+
+        static   = self.static_variables
+        encoded  = self.encoded_segments
+        parts    = []
+
+        for data, template, names, variable in segments:
+            if data is not None:
+                parts.append(data)
+                continue
+
+            if variable is not None:
+                value = variables.get(variable)
+
+                if type(value) is str:
+                    parts.append(value.encode(encoding))
+                else:
+                    # context prefix is overridden by the named argument of the record
+                    parts.append(self.render_template('{' + variable + '}', variables, fmt_args, fmt_kwargs)
+                                 .encode(encoding))
+                continue
+
+            # named arguments of the record can override the static variables
+            if names is None or fmt_kwargs and not fmt_kwargs.keys().isdisjoint(names):
+                parts.append(self.render_template(template, variables, fmt_args, fmt_kwargs).encode(encoding))
+                continue
+
+            key = (encoding, template, *[variables[n] if n in variables else static.get(n) for n in names])
+
+            try:
+                data = encoded.get(key)
+            except TypeError:
+                # unhashable static variable
+                parts.append(self.render_template(template, variables, fmt_args, fmt_kwargs).encode(encoding))
+                continue
+
+            if data is None:
+                data = self.render_template(template, variables, fmt_args, fmt_kwargs).encode(encoding)
+
+                if len(encoded) >= ENCODED_SEGMENTS_CACHE_SIZE:
+                    encoded.clear()
+
+                encoded[key] = data
+
+            parts.append(data)
+
+        return b''.join(parts)
+
+    def format_binary(self, value: Any) -> str:
+        """Renders binary value (`bytes`, `bytearray`, `memoryview` or other object with the buffer protocol). Values
+        that are not longer than :attr:`binary_preview` are rendered as by `str()` (except the memoryviews and the
+        objects without own `repr()`), longer ones (and all values, if :attr:`binary_hex` is set) are rendered as a
+        preview with length, i.e. `<bytes len=1048576: b'...'...>`. Only the previewed slice of the buffer is read,
+        the buffer isn't copied.
+
+        :param value: Binary value.
+        :type value: Any
+
+        :returns: Rendered value.
+        :rtype: str
+        """
+
+        limit = self.binary_preview
+
+        with memoryview(value) as view:
+            length = view.nbytes
+
+            # short values are rendered as is, if their type has the readable representation
+            if not self.binary_hex and (limit is None or length <= limit) and \
+                    (isinstance(value, (bytes, bytearray)) or type(value).__repr__ not in (object.__repr__,
+                                                                                            memoryview.__repr__)):
+                return str(value)
+
+            if not view.c_contiguous:
+                return f'<{type(value).__name__} len={length}>'
+
+            with view.cast('B') as flat, flat[:limit] as head:
+                preview    = head.hex(' ') if self.binary_hex else repr(head.tobytes())
+                truncated  = TRUNCATION_MARK if length > head.nbytes else ''
+
+        return f'<{type(value).__name__} len={length}: {preview}{truncated}>'
+
+    def replace_binary(self,
+                       fmt_args: list[Any] | tuple[Any, ...],
+                       fmt_kwargs: dict[str, Any]
+                       ) -> tuple[list[Any] | tuple[Any, ...], dict[str, Any]]:
+        """Replaces binary arguments with their previews (see :meth:`format_binary()`). Arguments are copied only if
+        they contain binary values.
+
+        :param fmt_args: Positioned arguments for formatting.
+        :type fmt_args: list[Any] | tuple[Any, ...]
+        :param fmt_kwargs: Named arguments for formatting.
+        :type fmt_kwargs: dict[str, Any]
+
+        :returns: Arguments with the binary values replaced.
+        :rtype: tuple[list[Any] | tuple[Any, ...], dict[str, Any]]
+        """
+
+        for a in fmt_args:
+            if is_binary(a):
+                fmt_args = [self.format_binary(a) if is_binary(a) else a for a in fmt_args]
+                break
+
+        for v in fmt_kwargs.values():
+            if is_binary(v):
+                fmt_kwargs = {k: self.format_binary(v) if is_binary(v) else v for k, v in fmt_kwargs.items()}
+                break
+
+        return fmt_args, fmt_kwargs
+
+    def render_field(self, value: Any) -> Any:
+        """Renders value of the bound field.
+
+        :param value: Value of the field.
+        :type value: Any
+        """
+
+        return value
+
+    def render_fields(self, fields: BoundFields) -> tuple[dict[str, Any], str]:
+        """Renders bound fields (see :meth:`pyrolog.Logger.bind()` and :func:`pyrolog.context()`) and the context
+        prefix (`{context}` in the format string, i.e. `request_id=... user=...`). Named argument `context` of the
+        record overrides the prefix.
+
+        Fields with the values of immutable scalar types are rendered once and cached in the fields object, so they
+        aren't formatted on every record. The context prefix is cached too, if all the fields are cached.
+
+        :param fields: Bound fields.
+        :type fields: BoundFields
+
+        :returns: Dict with the rendered fields and the context prefix.
+        :rtype: tuple[dict[str, Any], str]
+        """
+
+        owner = self.origin or self
+
+        if owner not in fields.rendered or fields.rendered[owner][3] != self.render_generation:
+            static   = {k: self.render_field(v) for k, v in fields.items() if type(v) in STATIC_FIELD_TYPES}
+            dynamic  = [k for k in fields if k not in static]
+            context  = None if dynamic else ' '.join([f'{k}={v}' for k, v in static.items()])
+
+            fields.rendered[owner] = (static, dynamic, context, self.render_generation)
+
+        static, dynamic, context, _ = fields.rendered[owner]
+
+        if not dynamic:
+            return static, context
+
+        rendered = {k: static[k] if k in static else self.render_field(fields[k]) for k in fields}
+
+        return rendered, ' '.join([f'{k}={v}' for k, v in rendered.items()])
 
     def format_exception(self, exc: Exception):
-        return ''.join(traceback.format_exception(exc))[:-1]
+        return self.tracebacks.format(exc)
 
     def format_time(self, time: datetime.datetime | None):
         if time is None:
             return ''
 
-        return self.time_format_string.format(
-            year=time.year,
-            month=time.month,
-            day=time.day,
-            hour=time.hour,
-            minute=time.minute,
-            second=time.second,
-            microsecond=str(time.microsecond)[:6].ljust(6),
+        return self.render_template(
+            self.time_format_string,
+            {
+                'year': time.year,
+                'month': time.month,
+                'day': time.day,
+                'hour': time.hour,
+                'minute': time.minute,
+                'second': time.second,
+                'microsecond': str(time.microsecond)[:6].ljust(6),
+            }
         )
 
 
@@ -266,6 +944,19 @@ class ColoredFormatter(PlainFormatter):
     :type color_dict: ColorDict
     :ivar use_repr: If it set to True, repr() will be used instead of str() while format arguments.
     :type use_repr: bool
+    :ivar max_items: Maximum count of the rendered items of every list, tuple, dict, set or deque.
+    :type max_items: int | None
+    :ivar max_depth: Maximum depth of the nested containers.
+    :type max_depth: int | None
+    :ivar max_chars: Maximum length of the rendered value (visible characters, colors aren't counted).
+    :type max_chars: int | None
+    :ivar max_string: Maximum length of every rendered string.
+    :type max_string: int | None
+    :ivar colors: If it is True, output is always colored. If it is False, no colors are rendered (output is plain).
+        If it is None, colors are chosen by the stream of the handler (see :meth:`for_stream()`).
+    :type colors: bool | None
+    :ivar reset: Style token, that resets the style (empty, if colors aren't rendered).
+    :type reset: str
     """
 
     def __init__(self,
@@ -276,6 +967,11 @@ class ColoredFormatter(PlainFormatter):
                  use_repr: bool = False,
                  unpack_lists: bool = False,
                  unpack_dicts: bool = False,
+                 max_items: int | None = MAX_VALUE_ITEMS,
+                 max_depth: int | None = MAX_VALUE_DEPTH,
+                 max_chars: int | None = MAX_VALUE_CHARS,
+                 max_string: int | None = MAX_VALUE_STRING,
+                 colors: bool | None = None,
                  **kwargs: dict[str, Any]):
         """
         :param format_string: Format string.
@@ -290,72 +986,373 @@ class ColoredFormatter(PlainFormatter):
         :type unpack_lists: bool
         :param unpack_dicts: Splits the elements by commas and arrows (=>).
         :type unpack_dicts: bool
+        :param max_items: Maximum count of the rendered items of every list, tuple, dict, set or deque. `None` means
+            no limit.
+        :type max_items: int | None
+        :param max_depth: Maximum depth of the nested containers. `None` means no limit.
+        :type max_depth: int | None
+        :param max_chars: Maximum length of the rendered value (visible characters, colors aren't counted). `None`
+            means no limit.
+        :type max_chars: int | None
+        :param max_string: Maximum length of every rendered string. `None` means no limit.
+        :type max_string: int | None
+        :param colors: If it is True, output is always colored. If it is False, no colors are rendered. If it is None
+            (by default), output to the terminals is colored, and output to the other streams (files, pipes) is plain.
+        :type colors: bool | None
         """
         super().__init__(format_string, time_format_string, *args, **kwargs)
 
+        self._type_cache: dict[type, tuple[Callable, str]]  = {}
+        self._types: dict[str | type, str] | None           = None
+        self._plain_variant: ColoredFormatter | None        = None
+
         self.color_dict    = color_dict
         self.use_repr      = use_repr
         self.unpack_lists  = unpack_lists
         self.unpack_dicts  = unpack_dicts
+        self.max_items     = max_items
+        self.max_depth     = max_depth
+        self.max_chars     = max_chars
+        self.max_string    = max_string
+        self.colors        = colors
+        self.reset         = '' if colors is False else TextStyle.reset
+
+        if colors is not False:
+            fix_windows_console()
 
-        self.static_variables['fore']          = TextColor
-        self.static_variables['bg']            = BGColor
-        self.static_variables['style']         = TextStyle
-        self.static_variables['reset']         = TextStyle.reset
+            self.static_variables['fore']          = TextColor
+            self.static_variables['bg']            = BGColor
+            self.static_variables['style']         = TextStyle
+            self.static_variables['reset']         = TextStyle.reset
 
         self._func = repr if use_repr else str
 
+    def add_static_variable(self, name: str, value: Any):
+        super().add_static_variable(name, value)
+        self._plain_variant = None
+
+    def del_static_variable(self, name: str) -> bool:
+        self._plain_variant = None
+        return super().del_static_variable(name)
+
+    def for_stream(self, colors: bool) -> Formatter:
+        """Gets formatter for the stream. If :attr:`colors` is None and stream doesn't support colors, it is the plain
+        variant of this formatter (with the same settings, but without colors), so no style tokens are rendered.
+        Plain variant has this formatter as the :attr:`source`, so when the record is already rendered with colors
+        for the other handler, plain output is encoded from it by :func:`strip_styles()`.
+
+        :param colors: Determines whether stream supports colors.
+        :type colors: bool
+
+        :returns: Formatter.
+        :rtype: Formatter
+        """
+
+        if colors or self.colors is not None:
+            return self
+
+        if self._plain_variant is None:
+            variant = copy.copy(self)
+
+            variant.static_variables = {**self.static_variables,
+                                        'fore': empty_colors.EmptyTextColor,
+                                        'bg': empty_colors.EmptyBGColor,
+                                        'style': empty_colors.EmptyTextStyle,
+                                        'reset': ''}
+            variant._type_cache  = {}
+            variant.colors       = False
+            variant.reset        = ''
+            variant.source       = self
+
+            defined_formatters.add(variant)
+
+            self._plain_variant = variant
+
+        return self._plain_variant
+
+    @property
+    def color_dict(self) -> ColorDict:
+        return self._color_dict
+
+    @color_dict.setter
+    def color_dict(self, value: ColorDict):
+        self._color_dict = value
+        self.invalidate_type_cache()
+
+    def invalidate_type_cache(self):
+        """Clears cache with the renderers and colors resolved for every type, the cached bound fields and the plain
+        variant (see :meth:`for_stream()`). It is done automatically, when color dict or its types dict is replaced.
+        Call it after the types colors are changed in place, or after the settings of the formatter are changed
+        directly (i.e. :attr:`max_items`), so the next records are rendered with the new settings.
+        """
+
+        self._type_cache.clear()
+        self._types          = self._color_dict['types']
+        self._plain_variant  = None
+        self.render_generation += 1
+
     def get_level_color(self, level: str) -> str:
+        if self.colors is False:
+            return ''
+
         if level in self.color_dict['levels']:
             return self.color_dict['levels'][level]
         else:
             return ''
 
     def get_value_color(self, type_: type) -> str:
-        if type_ in self.color_dict['types']:
-            return self.color_dict['types'][type_]
-        elif isinstance(type_, Exception):
-            return self.color_dict['types']['exception']
-        else:
-            return self.color_dict['types']['all']
+        """Gets color of the given type. The color is searched by the MRO of the type, so subclasses of the types
+        from color dict have the same color. Exceptions have color of the `'exception'` key, other types have color of
+        the `'all'` key.
+
+        :param type_: Type of the value.
+        :type type_: type
+
+        :returns: Color.
+        :rtype: str
+        """
+
+        if type_ not in self._type_cache:
+            self.resolve_type(type_)
+
+        return self._type_cache[type_][1]
+
+    def resolve_type(self, type_: type, value: Any = None) -> tuple[Callable, str]:
+        """Resolves renderer and color for the given type by its MRO and caches them. Is called once for every type.
+
+        Types without own renderer, that support buffer protocol (i.e. `array.array` or numpy arrays), are rendered as
+        binary values, as by :class:`PlainFormatter` (see :func:`is_binary()`). It is checked by the given value.
+
+        :param type_: Type of the value.
+        :type type_: type
+        :param value: Value of this type.
+        :type value: Any
+
+        :returns: Renderer and color.
+        :rtype: tuple[Callable, str]
+        """
+
+        types_colors  = self.color_dict['types']
+        mro           = type_.__mro__
+        renderer      = next((VALUE_RENDERERS[t] for t in mro if t in VALUE_RENDERERS), None)
+        color         = next((types_colors[t] for t in mro if t in types_colors), None)
+
+        if renderer is None:
+            if type(value) is type_ and is_binary(value):
+                renderer = ColoredFormatter.format_binary_value
+            else:
+                renderer = ColoredFormatter.format_scalar
+
+        if color is None and renderer is ColoredFormatter.format_binary_value:
+            color = types_colors.get(bytes)
+
+        if color is None:
+            color = types_colors['exception'] if issubclass(type_, BaseException) else types_colors['all']
+
+        if self.colors is False:
+            color = ''
+
+        self._type_cache[type_] = (renderer, color)
+        return renderer, color
 
     def format_value(self, value: Any) -> str:
-        if isinstance(value, fmt):
-            value_color = self.get_value_color(type(value[1]))
-            return value_color + value[0].format(value[1])
+        """Formats value with colors. Rendering is iterative and bounded: containers are rendered up to
+        :attr:`max_items` items and :attr:`max_depth` levels, strings are cut to :attr:`max_string` characters and
+        rendering stops when :attr:`max_chars` characters are rendered. Truncated parts are marked with `...`.
+
+        :param value: Value to be formatted.
+        :type value: Any
+
+        :returns: Colored value.
+        :rtype: str
+        """
+
+        type_cache  = self._type_cache
+        max_chars   = self.max_chars
+        output      = []
+        length      = 0
+
+        # items of the stack are (value, depth) pairs, or (text, -1) pairs for the already rendered text
+        stack = [(value, 0), ]
+
+        while stack:
+            value, depth = stack.pop()
+
+            if depth < 0:
+                text = value
+            else:
+                type_ = type(value)
+                renderer, color = type_cache[type_] if type_ in type_cache else self.resolve_type(type_, value)
+                text = renderer(self, value, color, depth, stack)
+
+            output.append(text)
+
+            # only the visible characters are counted, so the colored output and its plain variant are cut at the
+            # same point
+            length += len(text) if '\x1b' not in text else len(strip_styles(text))
+
+            if max_chars is not None and length >= max_chars and stack:
+                output.append(TRUNCATION_MARK + self.reset)
+                break
+
+        return ''.join(output)
+
+    def limit_string(self, value: Any) -> str:
+        """Converts value to the string (by `str()` or `repr()`) and cuts it to :attr:`max_string` characters.
+
+        :param value: Value to be converted.
+        :type value: Any
+
+        :returns: String.
+        :rtype: str
+        """
+
+        max_string = self.max_string
+
+        # do not copy (or repr) whole long string if only its beginning will be rendered
+        if max_string is not None and isinstance(value, str) and len(value) > max_string:
+            return self._func(value[:max_string]) + TRUNCATION_MARK
+
+        text = self._func(value)
+
+        if max_string is not None and len(text) > max_string:
+            return text[:max_string] + TRUNCATION_MARK
+
+        return text
+
+    def push_items(self,
+                   items: list[Any],
+                   count: int,
+                   separator: str,
+                   closing: str,
+                   depth: int,
+                   stack: list[tuple[Any, int]]):
+        """Pushes items of the container to the rendering stack of :meth:`format_value()`, with separators between
+        them and the closing text after them. Only :attr:`max_items` items are pushed.
+
+        :param items: Items to be rendered. Must be a sequence, items of the dicts are (key, separator, value) tuples.
+        :type items: list[Any]
+        :param count: Real count of the items in the container.
+        :type count: int
+        :param separator: Text between the items.
+        :type separator: str
+        :param closing: Text after the items.
+        :type closing: str
+        :param depth: Depth of the items.
+        :type depth: int
+        :param stack: Rendering stack.
+        :type stack: list[tuple[Any, int]]
+        """
+
+        if len(items) < count:
+            closing = f'{separator}{TRUNCATION_MARK} (+{count - len(items)}){closing}'
 
-        elif isinstance(value, list):
-            list_color = self.get_value_color(list)
-            output = '' if self.unpack_lists else f'{list_color}['
-            temp = [self.format_value(v) for v in value]
-            output += f'{list_color}, '.join(temp) + '' if self.unpack_lists else f'{list_color}]{TextStyle.reset}'
+        stack.append((closing, -1))
 
-            return output
+        for i in range(len(items) - 1, -1, -1):
+            item = items[i]
 
-        elif isinstance(value, tuple):
-            tuple_color = self.get_value_color(tuple)
-            output = f'{tuple_color}('
-            temp = [self.format_value(v) for v in value]
-            output += f'{tuple_color}, '.join(temp) + f'{tuple_color}){TextStyle.reset}'
+            if type(item) is DictItem:
+                stack.append((item[2], depth))
+                stack.append((item[1], -1))
+                stack.append((item[0], depth))
+            else:
+                stack.append((item, depth))
 
-            return output
+            if i:
+                stack.append((separator, -1))
 
-        elif isinstance(value, dict):
-            dict_color = self.get_value_color(dict)
+    def format_lazy(self, value: Lazy, color: str, depth: int, stack: list[tuple[Any, int]]) -> str:
+        stack.append((value.value, depth))
+        return ''
 
-            if self.unpack_dicts:
-                return f'{dict_color}, '.join([f'{self.format_value(k)} {dict_color}=> {self.format_value(v)}{TextStyle.reset}' for k, v in value.items()])
+    def format_fmt(self, value: fmt, color: str, depth: int, stack: list[tuple[Any, int]]) -> str:
+        string  = value[1].value if isinstance(value[1], Lazy) else value[1]
+        text    = value[0].format(string)
 
-            output = f'{dict_color}{{'
-            temp = [f'{self.format_value(k)}{dict_color}: {self.format_value(v)}' for k, v in value.items()]
-            output += f'{dict_color}, '.join(temp) + f'{dict_color}}}{TextStyle.reset}'
+        if self.max_string is not None and len(text) > self.max_string:
+            text = text[:self.max_string] + TRUNCATION_MARK
 
-            return output
+        return self.get_value_color(type(string)) + text
 
-        elif isinstance(value, Uncolored):
-            return self._func(value) + TextStyle.reset
+    def format_list(self, value: list, color: str, depth: int, stack: list[tuple[Any, int]]) -> str:
+        opening, closing = ('', '') if self.unpack_lists else (f'{color}[', f'{color}]{self.reset}')
 
-        return self.get_value_color(type(value)) + self._func(value) + TextStyle.reset
+        if self.max_depth is not None and depth >= self.max_depth:
+            return f'{opening}{color}{TRUNCATION_MARK}{closing}'
+
+        items = value if self.max_items is None else value[:self.max_items]
+        self.push_items(items, len(value), f'{color}, ', closing, depth + 1, stack)
+
+        return opening
+
+    def format_tuple(self, value: tuple, color: str, depth: int, stack: list[tuple[Any, int]]) -> str:
+        if self.max_depth is not None and depth >= self.max_depth:
+            return f'{color}({TRUNCATION_MARK}){self.reset}'
+
+        items = value if self.max_items is None else value[:self.max_items]
+        self.push_items(items, len(value), f'{color}, ', f'{color}){self.reset}', depth + 1, stack)
+
+        return f'{color}('
+
+    def format_set(self, value: set | frozenset, color: str, depth: int, stack: list[tuple[Any, int]]) -> str:
+        name = type(value).__name__
+
+        if not value:
+            return f'{color}{name}(){self.reset}'
+
+        opening, closing = (f'{color}{{', f'{color}}}{self.reset}') if type(value) is set else \
+            (f'{color}{name}({{', f'{color}}}){self.reset}')
+
+        if self.max_depth is not None and depth >= self.max_depth:
+            return f'{opening}{color}{TRUNCATION_MARK}{closing}'
+
+        items = list(islice(value, self.max_items))
+        self.push_items(items, len(value), f'{color}, ', closing, depth + 1, stack)
+
+        return opening
+
+    def format_deque(self, value: deque, color: str, depth: int, stack: list[tuple[Any, int]]) -> str:
+        maxlen   = '' if value.maxlen is None else f', maxlen={value.maxlen}'
+        opening  = f'{color}{type(value).__name__}(['
+        closing  = f'{color}]{maxlen}){self.reset}'
+
+        if self.max_depth is not None and depth >= self.max_depth:
+            return f'{opening}{color}{TRUNCATION_MARK}{closing}'
+
+        items = list(islice(value, self.max_items))
+        self.push_items(items, len(value), f'{color}, ', closing, depth + 1, stack)
+
+        return opening
+
+    def format_dict(self, value: dict, color: str, depth: int, stack: list[tuple[Any, int]]) -> str:
+        opening, closing = ('', '') if self.unpack_dicts else (f'{color}{{', f'{color}}}{self.reset}')
+
+        if self.max_depth is not None and depth >= self.max_depth:
+            return f'{opening}{color}{TRUNCATION_MARK}{closing}'
+
+        if self.unpack_dicts:
+            key_separator, value_ending = f' {color}=> ', self.reset
+        else:
+            key_separator, value_ending = f'{color}: ', ''
+
+        # value ending is pushed as a part of the separator, so the last value is ended by the closing text
+        items = [DictItem(k, key_separator, v) for k, v in islice(value.items(), self.max_items)]
+        self.push_items(items, len(value), f'{value_ending}{color}, ', f'{value_ending}{closing}', depth + 1, stack)
+
+        return opening
+
+    def format_binary_value(self, value: Any, color: str, depth: int, stack: list[tuple[Any, int]]) -> str:
+        return color + self.format_binary(value) + self.reset
+
+    def format_uncolored(self, value: Uncolored, color: str, depth: int, stack: list[tuple[Any, int]]) -> str:
+        return self.limit_string(value.value) + self.reset
+
+    def format_scalar(self, value: Any, color: str, depth: int, stack: list[tuple[Any, int]]) -> str:
+        return color + self.limit_string(value) + self.reset
+
+    def render_field(self, value: Any) -> str:
+        return self.format_value(value)
 
     def format_message(self,
                        message: str,
@@ -367,18 +1364,54 @@ class ColoredFormatter(PlainFormatter):
                        group_color: str,
                        fmt_args: list[Any],
                        fmt_kwargs: dict[str, Any]) -> str:
-        return message.format(
-            level=level,
-            level_color=level_color,
-            logger_color=logger_color,
-            logger_name=logger_name,
-            group_name=group_name,
-            group_color=group_color,
-            *fmt_args,
-            **fmt_kwargs,
-            **self.static_variables,
+        return self.render_template(
+            message,
+            {
+                'level': level,
+                'level_color': level_color,
+                'logger_color': logger_color,
+                'logger_name': logger_name,
+                'group_name': group_name,
+                'group_color': group_color,
+            },
+            fmt_args,
+            fmt_kwargs,
         )
 
+    def prepare_arguments(self,
+                          message: str,
+                          fmt_args: list[Any] | tuple[Any, ...],
+                          fmt_kwargs: dict[str, Any]
+                          ) -> tuple[list[Any] | tuple[Any, ...], dict[str, Any]]:
+        message_template  = parse_template(message)
+        format_template   = parse_template(self.format_string)
+
+        # color only the arguments that are really referenced by templates
+        colored_args = [self.format_value(a) for a in fmt_args] \
+            if message_template.positional or format_template.positional else ()
+        colored_kwargs = {k: self.format_value(v) for k, v in fmt_kwargs.items()
+                          if k in message_template.names or k in format_template.names}
+
+        return colored_args, colored_kwargs
+
+    def record_variables(self,
+                         level: str,
+                         logger_color: str,
+                         logger_name: str,
+                         group_name: str,
+                         group_color: str) -> VarDict:
+        if self.colors is False:
+            logger_color = group_color = ''
+
+        return {
+            'level': level,
+            'level_color': self.get_level_color(level),
+            'logger_color': logger_color,
+            'logger_name': logger_name,
+            'group_name': group_name,
+            'group_color': group_color,
+        }
+
     def format(self,
                message: str,
                time: datetime.datetime | None,
@@ -388,53 +1421,256 @@ class ColoredFormatter(PlainFormatter):
                group_name: str,
                group_color: str,
                fmt_args: list[Any],
-               fmt_kwargs: dict[str, Any]
+               fmt_kwargs: dict[str, Any],
+               fields: BoundFields | None = None,
+               exc: Exception | None = None
                ) -> str:
-        colored_args    = [self.format_value(a) for a in fmt_args]
-        colored_kwargs  = {k: self.format_value(v) for k, v in fmt_kwargs.items()}
-        level_color     = self.get_level_color(level)
-
-        return self.format_string.format(
-            message=self.format_message(
-                message,
-                level,
-                level_color,
-                logger_color,
-                logger_name,
-                group_name,
-                group_color,
-                colored_args,
-                colored_kwargs
-            ),
-            time=self.format_time(time) if self.time_formatting else '*',
-            level=level,
-            level_color=level_color,
-            logger_color=logger_color,
-            logger_name=logger_name,
-            group_name=group_name,
-            group_color=group_color,
-            *colored_args,
-            **colored_kwargs,
-            **self.static_variables,
-        ) + TextStyle.reset
+        # only the replacement of the types dict is detected, changes in place need invalidate_type_cache()
+        if self._color_dict['types'] is not self._types:
+            self.invalidate_type_cache()
+
+        return super().format(message, time, level, logger_color, logger_name, group_name, group_color,
+                              fmt_args, fmt_kwargs, fields, exc) + self.reset
+
+    def format_bytes(self,
+                     encoding: str,
+                     message: str,
+                     time: datetime.datetime | None,
+                     level: str,
+                     logger_color: str,
+                     logger_name: str,
+                     group_name: str,
+                     group_color: str,
+                     fmt_args: list[Any],
+                     fmt_kwargs: dict[str, Any],
+                     fields: BoundFields | None = None,
+                     exc: Exception | None = None
+                     ) -> bytes:
+        # colors of the values are chosen by the whole message, record is encoded as is
+        return Formatter.format_bytes(self, encoding, message, time, level, logger_color, logger_name, group_name,
+                                      group_color, fmt_args, fmt_kwargs, fields, exc)
 
     def format_exception(self, exc: Exception):
-        return self.color_dict['types']['exception'] + ''.join(traceback.format_exception(exc))[:-1]
+        if self.colors is False:
+            return self.tracebacks.format(exc)
 
-    def format_time(self, time: datetime.datetime | None):
-        if time is None:
-            return ''
+        return self.color_dict['types']['exception'] + self.tracebacks.format(exc)
 
-        return self.time_format_string.format(
-            year=time.year,
-            month=time.month,
-            day=time.day,
-            hour=time.hour,
-            minute=time.minute,
-            second=time.second,
-            microsecond=str(time.microsecond)[:6].ljust(6),
-            **self.static_variables,
-        )
 
-defined_formatters: list[Formatter] = []
-"""List with the defined formatters."""
+class JsonFormatter(PlainFormatter):
+    """Structured formatter, that formats every record to one JSON object (JSON lines). Object contains time, level,
+    logger name, group path, formatted message, raw arguments, bound fields and formatted exception.
+
+    The constant part of the object (static fields, logger name and group path) is encoded once for every logger,
+    only variable fields are encoded on every record. Uses `orjson` if it is installed (it is imported by the first
+    JSON formatter), otherwise the standard :mod:`json` module.
+
+    Example of the record:
+
+    .. code-block:: json
+
+        {"service":"api","logger":"Main","group":null,"time":"2023-05-01T12:00:00.000001","level":"info",
+         "message":"User bob logged in","args":["bob"],"kwargs":{},"fields":{"request_id":"a1"},"exc":null}
+
+    :ivar static_fields: Fields that are added to every record.
+    :type static_fields: dict[str, Any]
+    :ivar skip_kwargs: Names of the named arguments, that aren't included to the records.
+    :type skip_kwargs: frozenset[str]
+    :ivar orjson: `orjson` module, or `None` if it isn't installed or isn't used.
+    :type orjson: ModuleType | None
+    """
+
+    embeds_exceptions = True
+
+    def __init__(self,
+                 *args: Any,
+                 static_fields: dict[str, Any] | None = None,
+                 skip_kwargs: tuple[str, ...] = ('stack', ),
+                 use_orjson: bool = True,
+                 **kwargs: dict[str, Any]):
+        """
+        :param static_fields: Fields that are added to every record.
+        :type static_fields: dict[str, Any] | None
+        :param skip_kwargs: Names of the named arguments, that aren't included to the records. By default, it is
+            the frame info passed by the log methods.
+        :type skip_kwargs: tuple[str, ...]
+        :param use_orjson: If it is set to False, the standard :mod:`json` module is used, even if `orjson` is
+            installed.
+        :type use_orjson: bool
+        """
+        super().__init__(*args, offsets=False, **kwargs)
+
+        self.static_fields  = {} if static_fields is None else static_fields
+        self.skip_kwargs    = frozenset(skip_kwargs)
+        self.orjson         = import_orjson() if use_orjson else None
+
+        self._prefixes: dict[tuple[str, str], str] = {}
+        # json module is imported only when the JSON formatter is used
+        import json
+
+        self._encoder = json.JSONEncoder(default=self.encode_default, ensure_ascii=False, separators=(',', ':'))
+
+    def encode_default(self, value: Any) -> Any:
+        """Converts value, that isn't supported by JSON, to the supported one.
+
+        :param value: Value.
+        :type value: Any
+        """
+
+        if isinstance(value, Lazy):
+            return value.value
+
+        if is_binary(value):
+            return self.format_binary(value)
+
+        if isinstance(value, (set, frozenset)):
+            return list(value)
+
+        return str(value)
+
+    def encode(self, value: Any) -> str:
+        """Encodes value to JSON.
+
+        :param value: Value.
+        :type value: Any
+
+        :returns: JSON string.
+        :rtype: str
+        """
+
+        orjson = self.orjson
+
+        if orjson is not None:
+            try:
+                return orjson.dumps(value, default=self.encode_default, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                # i.e. integers out of the 64-bit range, the standard encoder supports them
+                pass
+
+        return self._encoder.encode(value)
+
+    def get_prefix(self, logger_name: str, group_name: str) -> str:
+        """Gets encoded constant part of the logger records (opening brace, static fields, logger name and group
+        path, and the trailing comma).
+
+        :param logger_name: Name of the logger.
+        :type logger_name: str
+        :param group_name: Group path of the logger.
+        :type group_name: str
+
+        :returns: Encoded constant part.
+        :rtype: str
+        """
+
+        key = (logger_name, group_name)
+
+        if key not in self._prefixes:
+            if len(self._prefixes) >= JSON_PREFIXES_CACHE_SIZE:
+                self._prefixes.clear()
+
+            constant = {**self.static_fields, 'logger': logger_name, 'group': None if group_name == '*' else group_name}
+            self._prefixes[key] = self.encode(constant)[:-1] + ','
+
+        return self._prefixes[key]
+
+    def format(self,
+               message: str,
+               time: datetime.datetime | None,
+               level: str,
+               logger_color: str,
+               logger_name: str,
+               group_name: str,
+               group_color: str,
+               fmt_args: list[Any],
+               fmt_kwargs: dict[str, Any],
+               fields: BoundFields | None = None,
+               exc: Exception | None = None
+               ) -> str:
+        variables = {
+            'level': level,
+            'logger_color': logger_color,
+            'logger_name': logger_name,
+            'group_name': group_name,
+            'group_color': group_color,
+        }
+        binary_args, binary_kwargs = self.replace_binary(fmt_args, fmt_kwargs)
+
+        record = {
+            'time': None if time is None else time.isoformat(),
+            'level': level,
+            'message': self.render_template(message, variables, binary_args, {**fields, **binary_kwargs}
+                                            if fields else binary_kwargs),
+            'args': fmt_args,
+            'kwargs': fmt_kwargs,
+            'fields': fields,
+            'exc': None if exc is None else self.format_exception(exc),
+        }
+
+        if self.skip_kwargs and not self.skip_kwargs.isdisjoint(fmt_kwargs):
+            fmt_kwargs = record['kwargs'] = {k: v for k, v in fmt_kwargs.items() if k not in self.skip_kwargs}
+
+        try:
+            encoded = self.encode(record)
+        except (TypeError, ValueError):
+            # unsupported keys or circular references
+            record['args']    = [repr(a) for a in fmt_args]
+            record['kwargs']  = {k: repr(v) for k, v in fmt_kwargs.items()}
+            record['fields']  = None if fields is None else {k: repr(v) for k, v in fields.items()}
+            encoded           = self.encode(record)
+
+        return self.get_prefix(logger_name, group_name) + encoded[1:]
+
+    def format_bytes(self,
+                     encoding: str,
+                     message: str,
+                     time: datetime.datetime | None,
+                     level: str,
+                     logger_color: str,
+                     logger_name: str,
+                     group_name: str,
+                     group_color: str,
+                     fmt_args: list[Any],
+                     fmt_kwargs: dict[str, Any],
+                     fields: BoundFields | None = None,
+                     exc: Exception | None = None
+                     ) -> bytes:
+        # fields are escaped by the JSON encoder, record is encoded as is
+        return Formatter.format_bytes(self, encoding, message, time, level, logger_color, logger_name, group_name,
+                                      group_color, fmt_args, fmt_kwargs, fields, exc)
+
+
+@lru_cache(None)
+def import_orjson() -> Any:
+    """Imports `orjson` module once, on the first call.
+
+    :returns: `orjson` module, or `None` if it isn't installed.
+    :rtype: ModuleType | None
+    """
+
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    return orjson
+
+
+VALUE_RENDERERS: dict[type, Callable] = {
+    Lazy: ColoredFormatter.format_lazy,
+    fmt: ColoredFormatter.format_fmt,
+    list: ColoredFormatter.format_list,
+    tuple: ColoredFormatter.format_tuple,
+    dict: ColoredFormatter.format_dict,
+    set: ColoredFormatter.format_set,
+    frozenset: ColoredFormatter.format_set,
+    deque: ColoredFormatter.format_deque,
+    Uncolored: ColoredFormatter.format_uncolored,
+    bytes: ColoredFormatter.format_binary_value,
+    bytearray: ColoredFormatter.format_binary_value,
+    memoryview: ColoredFormatter.format_binary_value,
+}
+"""Renderers of the values used by :meth:`ColoredFormatter.format_value()`. Renderer is searched by the MRO of the
+value type."""
+
+defined_formatters: weakref.WeakSet[Formatter] = weakref.WeakSet()
+"""Weak set with the defined formatters. Formatters are removed from it when they are garbage collected."""
@@ -16,12 +16,16 @@
     As example.
 """
 
+import sys
+
 from .handlers import Handler
 from .logging_context import LoggingContext
 from .logger import Logger
 from .defaults import DEFAULT_LOGGING_CONTEXT
 from .utils import update_group_name_offset
 
+from typing import Any
+
 __all__ = ['Group']
 
 
@@ -44,10 +48,13 @@ class Group:
     :type parent_group: Group | None
     :ivar subgroups: Subgroups of this group.
     :type subgroups: list[Group]
-    :ivar loggers: Loggers pinned to this group.
-    :type loggers: list[Logger]
+    :ivar name_path: Full name of the group, with the names of the parent groups separated by dots.
+    :type name_path: str
     """
 
+    __slots__ = ('name', 'handlers', 'logging_context', 'group_color', 'enabled', 'name_path', 'subgroups',
+                 'parent_group', '__weakref__')
+
     def __init__(self,
                  name: str = '',
                  handlers: Handler | list[Handler] | None = None,
@@ -79,7 +86,7 @@ class Group:
             self.logging_context  = logging_context
             self.group_color      = group_color
             self.enabled          = enabled
-            self.name_path        = name
+            self.name_path        = sys.intern(name)
 
         else:
             if isinstance(parent_group, str):
@@ -91,22 +98,54 @@ class Group:
             self.handlers         = parent_group.handlers
             self.logging_context  = parent_group.logging_context
             self.enabled          = parent_group.enabled
-            self.name_path        = parent_group.name_path + '.' + name
+            self.name_path        = sys.intern(parent_group.name_path + '.' + name)
             self.group_color      = parent_group.group_color if group_color == '' else group_color
 
             parent_group.subgroups.append(self)
-        self.name                     = name
-        self.subgroups: list[Group]   = []
-        self.loggers: list['Logger']  = []
-        self.parent_group             = parent_group
+        self.name                    = sys.intern(name)
+        self.subgroups: list[Group]  = []
+        self.parent_group            = parent_group
 
         self.logging_context.groups.append(self)
         self.logging_context.groups_by_name[name] = self
         update_group_name_offset(self.logging_context)
 
+    def __enter__(self) -> 'Group':
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+    def close(self):
+        """Unpins this group and all its subgroups from the logging context and from the parent group. After this,
+        group can't be found by its name and will be garbage collected with the last logger that uses it.
+        """
+
+        for sg in list(self.subgroups):
+            sg.close()
+
+        if self in self.logging_context.groups:
+            self.logging_context.groups.remove(self)
+
+        if self.logging_context.groups_by_name.get(self.name) is self:
+            del self.logging_context.groups_by_name[self.name]
+
+        if self.parent_group is not None and self in self.parent_group.subgroups:
+            self.parent_group.subgroups.remove(self)
+
+        update_group_name_offset(self.logging_context)
+
+    @property
+    def loggers(self) -> list[Logger]:
+        """Loggers pinned to this group. They are found by the loggers of the logging context, so group doesn't keep
+        its loggers alive and grouped loggers don't pay for the second weak reference."""
+
+        return [l for l in list(self.logging_context.loggers) if l.group is self]
+
     def enable(self):
         """Enables this group and all pinned loggers and subgroups."""
 
+        self.logging_context.check_frozen()
         self.enabled = True
 
         for l in self.loggers:
@@ -116,8 +155,9 @@ class Group:
             sg.enable()
 
     def disable(self):
-        """Enables this group and all pinned loggers and subgroups."""
+        """Disables this group and all pinned loggers and subgroups."""
 
+        self.logging_context.check_frozen()
         self.enabled = False
 
         for l in self.loggers:
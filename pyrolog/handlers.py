@@ -17,19 +17,45 @@
 """
 
 import datetime
+import itertools
+import os
+import atexit
+import queue
+import signal
 import sys
+import threading
+import weakref
 
 from os import PathLike
 
-from .formatters import Formatter, PlainFormatter
+from .formatters import Formatter, PlainFormatter, strip_styles, defined_formatters
+from .binary import BinaryWriter
 from .logging_context import LoggingContext
-from .defaults import DEFAULT_LOGGING_CONTEXT
-from ._types import LogLevel
+from .defaults import DEFAULT_LOGGING_CONTEXT, HEALTH_EWMA_ALPHA, QUEUE_SIZE, SHED_HIGH_WATERMARK, SHED_LOW_WATERMARK, \
+    SHED_COOLDOWN, SHUTDOWN_TIMEOUT, ATOMIC_WRITE_SIZE
+from .metrics import Metrics
+from .profiling import Profiler
+from .health import HandlerHealth, TRIPPED
+from .utils import LazyFrameInfo, supports_colors
+from ._types import LogLevel, BoundFields
 
 from abc import abstractmethod
-from typing import TextIO, Any
+from functools import partial
+from time import monotonic, perf_counter, perf_counter_ns
+from typing import TextIO, BinaryIO, Any, Callable
 
-__all__ = ['Handler', 'IOHandler', 'StdoutHandler', 'StderrHandler', 'FileHandler']
+try:
+    import fcntl
+except ImportError:
+    # not a POSIX system, large records of the appended files are written without the advisory lock
+    fcntl = None
+
+handlers: weakref.WeakSet['Handler'] = weakref.WeakSet()
+"""(**System variable.** Do not change it manually) Weak set with all the handlers, is used by the fork hooks (see
+:meth:`Handler.before_fork()`)."""
+
+__all__ = ['Handler', 'IOHandler', 'StdoutHandler', 'StderrHandler', 'FileHandler', 'BinaryHandler',
+           'BinaryFileHandler', 'GuardedHandler', 'QueueHandler', 'AppendIO', 'shutdown_on_signals']
 
 
 class Handler:
@@ -46,6 +72,8 @@ class Handler:
     :ivar enabled: Determines whether log any message or not. Isn't recommended to change it manually, but you may. Is
         recommended to use :meth:`enable()` and :meth:`disable()` methods.
     :type enabled: bool
+    :ivar name: Name of the handler, is used as label of the metrics (see :mod:`pyrolog.metrics`).
+    :type name: str
     """
 
     def __init__(self,
@@ -54,6 +82,7 @@ class Handler:
                  logging_context: LoggingContext = DEFAULT_LOGGING_CONTEXT,
                  log_exceptions: bool = True,
                  enabled: bool = True,
+                 name: str | None = None,
                  ):
         """
         :param log_level: Log level.
@@ -66,23 +95,150 @@ class Handler:
         :type log_exceptions: bool
         :param enabled: Determines whether log any message or not.
         :type enabled: bool
+        :param name: Name of the handler. By default, it is name of the handler class.
+        :type name: str | None
         """
         self.log_level        = log_level
         self.formatter        = formatter
         self.logging_context  = logging_context
         self.log_exceptions   = log_exceptions
         self.enabled          = enabled
+        self.name             = type(self).__name__ if name is None else name
+
+        handlers.add(self)
 
     def enable(self):
         """Enables handler."""
 
+        self.logging_context.check_frozen()
         self.enabled = True
 
     def disable(self):
         """Disables handler."""
 
+        self.logging_context.check_frozen()
         self.enabled = False
 
+    def fork_locks(self) -> list[threading.Lock]:
+        """Gets locks, that are held by the writes of the handler. They are acquired before the fork (see
+        :meth:`before_fork()`), so the child process doesn't inherit them held in the middle of the write.
+
+        :returns: Locks, in the order they are acquired.
+        :rtype: list[threading.Lock]
+        """
+
+        return []
+
+    def before_fork(self):
+        """Is called before the fork by the `os.register_at_fork()` hook: waits for the writes in progress and blocks
+        the new ones (by :meth:`fork_locks()`), flushes the IO, so the child doesn't inherit the unwritten buffer."""
+
+        for lock in self.fork_locks():
+            lock.acquire()
+
+        io = getattr(self, 'io', None)
+
+        if io is not None:
+            try:
+                io.flush()
+            except Exception:
+                pass
+
+    def after_fork(self, child: bool):
+        """Is called after the fork in the parent and child processes: releases locks acquired by
+        :meth:`before_fork()`. Handlers, that have background threads or per-process state, reinitialize it in the
+        child.
+
+        :param child: Determines whether it is called in the child process.
+        :type child: bool
+        """
+
+        for lock in reversed(self.fork_locks()):
+            lock.release()
+
+    def begin_shutdown(self, deadline: float | None):
+        """Begins shutdown of the handler (i.e. queued handlers stop accepting records and start draining). Is called
+        for all the handlers before :meth:`finish_shutdown()`, so they are drained in parallel. Does nothing by
+        default.
+
+        :param deadline: Time (by `time.monotonic()`), after which unwritten records are dropped. If it is None, there
+            is no deadline.
+        :type deadline: float | None
+        """
+
+    def finish_shutdown(self, deadline: float | None) -> int:
+        """Finishes shutdown of the handler: waits for the written records (until the deadline), flushes and closes
+        the IO. Handler is disabled after it.
+
+        :param deadline: Time (by `time.monotonic()`), after which unwritten records are dropped. If it is None, there
+            is no deadline.
+        :type deadline: float | None
+
+        :returns: Number of the dropped records.
+        :rtype: int
+        """
+
+        self.enabled = False
+        return 0
+
+    def shutdown(self, timeout: float | None = None) -> int:
+        """Shuts down the handler (see :meth:`begin_shutdown()` and :meth:`finish_shutdown()`). Use
+        :meth:`pyrolog.LoggingContext.shutdown()` to shut down all the handlers in parallel.
+
+        :param timeout: Time in seconds, after which unwritten records are dropped. If it is None, there is no
+            deadline.
+        :type timeout: float | None
+
+        :returns: Number of the dropped records.
+        :rtype: int
+        """
+
+        deadline = None if timeout is None else monotonic() + timeout
+
+        self.begin_shutdown(deadline)
+        return self.finish_shutdown(deadline)
+
+    def compile(self) -> Callable:
+        """Makes function, that writes records without checks of the handler state (enabled, log level). It is used by
+        the frozen loggers (see :meth:`pyrolog.LoggingContext.freeze()`), which check the state once, when they are
+        frozen. Function has the same arguments as :meth:`write()`. By default, it is :meth:`write()` itself.
+
+        If metrics are enabled (see :meth:`pyrolog.LoggingContext.enable_metrics()`), handlers, that override this
+        method, count written records by :meth:`pyrolog.Metrics.measured()`.
+
+        :returns: Function, that writes records.
+        :rtype: Callable
+        """
+
+        return self.write
+
+    def profile(self,
+                profiler: Profiler,
+                message: str,
+                level: str | int,
+                logger_color: str,
+                logger_name: str,
+                group_name: str,
+                group_color: str,
+                exc: Exception | None = None,
+                time: datetime.datetime | None = None,
+                fmt_args: list[Any] | None = None,
+                fmt_kwargs: dict[str, Any] | None = None,
+                fields: BoundFields | None = None):
+        """Writes the profiled record (see :mod:`pyrolog.profiling`). Has the same arguments as :meth:`write()`,
+        except the profiler. By default, times whole :meth:`write()` call as the ``handle`` stage.
+
+        :param profiler: Profiler.
+        :type profiler: Profiler
+        """
+
+        profiler.begin(self.name, self.formatter, logger_name, message)
+
+        start = perf_counter_ns()
+        self.write(message, level, logger_color, logger_name, group_name, group_color,
+                   exc, time, fmt_args, fmt_kwargs, fields)
+        profiler.add('handle', perf_counter_ns() - start)
+
     @abstractmethod
     def write(self,
               message: str,
@@ -94,7 +250,9 @@ class Handler:
               exc: Exception | None = None,
               time: datetime.datetime | None = None,
               fmt_args: list[Any] | None = None,
-              fmt_kwargs: dict[str, Any] | None = None):
+              fmt_kwargs: dict[str, Any] | None = None,
+              fields: BoundFields | None = None,
+              rendered: dict[Formatter, str] | None = None):
         raise NotImplementedError('Method "write()" isn\'t implemented!')
 
 
@@ -103,16 +261,64 @@ class IOHandler(Handler):
 
     :ivar io: IO to be used to write messages.
     :type io: TextIO
+    :ivar colors: Determines whether IO supports colors. Formatters, that choose colors by the stream (i.e.
+        :class:`pyrolog.ColoredFormatter`), render plain text to IOs without colors support.
+    :type colors: bool
+    :ivar output_encoding: Encoding of the records written to the binary IO, or None if IO is a text IO.
+    :type output_encoding: str | None
     """
 
-    def __init__(self, io: TextIO, *args: Any, **kwargs: dict[str, Any]):
+    def __init__(self,
+                 io: TextIO | BinaryIO,
+                 *args: Any,
+                 colors: bool | None = None,
+                 output_encoding: str | None = None,
+                 **kwargs: dict[str, Any]):
         """
         :param io: IO to be used to write messages.
-        :type io: TextIO
+        :type io: TextIO | BinaryIO
+        :param colors: Determines whether IO supports colors. If it isn't given, it is detected by
+            :func:`pyrolog.utils.supports_colors()`.
+        :type colors: bool | None
+        :param output_encoding: If it is given, IO is a binary IO (i.e. ``sys.stdout.buffer`` or the file opened in
+            the binary mode) and records are formatted to bytes in this encoding by
+            :meth:`pyrolog.Formatter.format_bytes()`, without the text layer of the IO.
+        :type output_encoding: str | None
         """
         super().__init__(*args, **kwargs)
 
-        self.io = io
+        self.io               = io
+        self.colors           = supports_colors(io) if colors is None else colors
+        self.output_encoding  = output_encoding
+
+        self._lock      = threading.Lock()
+        self._measured  = None
+
+        if output_encoding is not None:
+            self.emit = partial(self.emit_bytes, output_encoding)
+
+    def fork_locks(self) -> list[threading.Lock]:
+        return [self._lock]
+
+    def finish_shutdown(self, deadline: float | None) -> int:
+        self.enabled = False
+
+        # write in progress can hang (i.e. full pipe), don't wait for it after the deadline
+        if acquire(self._lock, deadline):
+            try:
+                self.close_io()
+            except Exception:
+                pass
+            finally:
+                self._lock.release()
+
+        return 0
+
+    def close_io(self):
+        """Flushes the IO at shutdown (see :meth:`Handler.finish_shutdown()`). Handlers, that own their IOs, also close
+        them."""
+
+        self.io.flush()
 
     def write(self,
               message: str,
@@ -124,14 +330,152 @@ class IOHandler(Handler):
               exc: Exception | None = None,
               time: datetime.datetime | None = None,
               fmt_args: list[Any] | None = None,
-              fmt_kwargs: dict[str, Any] | None = None):
-        if not self.enabled:
+              fmt_kwargs: dict[str, Any] | None = None,
+              fields: BoundFields | None = None,
+              rendered: dict[Formatter, str] | None = None):
+        metrics = self.logging_context.metrics
+
+        if not self.enabled or not self.logging_context.log_level(self.log_level, level):
+            if metrics is not None:
+                metrics.count('records_filtered', self.name, logger_name, level)
             return
 
-        if self.logging_context.log_level(self.log_level, level):
+        formatter = self.formatter.for_stream(self.colors)
+
+        if metrics is None:
+            self.emit(formatter, self.io, self._lock, self.log_exceptions,
+                      message, level, logger_color, logger_name, group_name, group_color,
+                      exc, time, fmt_args, fmt_kwargs, fields, rendered)
+        else:
+            self.measured_emit(metrics, formatter)(message, level, logger_color, logger_name, group_name, group_color,
+                                                   exc, time, fmt_args, fmt_kwargs, fields, rendered)
+
+    def compile(self) -> Callable:
+        """Makes function, that writes records with the formatter (chosen for the IO), IO and exceptions logging
+        setting bound to it. See :meth:`Handler.compile()`.
+
+        :returns: Function, that writes records.
+        :rtype: Callable
+        """
+
+        formatter  = self.formatter.for_stream(self.colors)
+        metrics    = self.logging_context.metrics
+
+        if metrics is None:
+            return partial(self.emit, formatter, self.io, self._lock, self.log_exceptions)
+
+        return self.measured_emit(metrics, formatter)
 
-            # log formatted message
-            self.io.write(self.formatter.format(
+    def measured_emit(self, metrics: Metrics, formatter: Formatter) -> Callable:
+        """Gets function, that writes records with the formatter and counts them by the metrics (see
+        :meth:`pyrolog.Metrics.measured()`). Function is made once and is made again only when the metrics registry,
+        formatter, IO, exceptions logging setting or name of the handler is changed.
+
+        :param metrics: Metrics registry.
+        :type metrics: Metrics
+        :param formatter: Formatter chosen for the IO.
+        :type formatter: Formatter
+
+        :returns: Function, that writes records.
+        :rtype: Callable
+        """
+
+        key       = (metrics, formatter, self.io, self.log_exceptions, self.name)
+        measured  = self._measured
+
+        if measured is None or measured[0] != key:
+            emit      = partial(self.emit, formatter, self.io, self._lock, self.log_exceptions)
+            measured  = self._measured = (key, metrics.measured(self.name, emit))
+
+        return measured[1]
+
+    def profile(self,
+                profiler: Profiler,
+                message: str,
+                level: str | int,
+                logger_color: str,
+                logger_name: str,
+                group_name: str,
+                group_color: str,
+                exc: Exception | None = None,
+                time: datetime.datetime | None = None,
+                fmt_args: list[Any] | None = None,
+                fmt_kwargs: dict[str, Any] | None = None,
+                fields: BoundFields | None = None):
+        """Writes the profiled record, timing the level check, formatter methods and IO calls. See
+        :meth:`Handler.profile()`.
+        """
+
+        formatter  = self.formatter.for_stream(self.colors)
+        metrics    = self.logging_context.metrics
+
+        profiler.begin(self.name, formatter, logger_name, message)
+
+        start     = perf_counter_ns()
+        accepted  = self.enabled and self.logging_context.log_level(self.log_level, level)
+        profiler.add('level_check', perf_counter_ns() - start)
+
+        if not accepted:
+            if metrics is not None:
+                metrics.count('records_filtered', self.name, logger_name, level)
+            return
+
+        emit = partial(self.emit, profiler.profiled_formatter(formatter), profiler.profiled_io(self.io), self._lock,
+                       self.log_exceptions)
+
+        if metrics is not None:
+            emit = metrics.measured(self.name, emit)
+
+        emit(message, level, logger_color, logger_name, group_name, group_color,
+             exc, time, fmt_args, fmt_kwargs, fields)
+        profiler.add('handle', perf_counter_ns() - start)
+
+    @staticmethod
+    def emit(formatter: Formatter,
+             io: TextIO,
+             lock: threading.Lock,
+             log_exceptions: bool,
+             message: str,
+             level: str | int,
+             logger_color: str,
+             logger_name: str,
+             group_name: str,
+             group_color: str,
+             exc: Exception | None = None,
+             time: datetime.datetime | None = None,
+             fmt_args: list[Any] | None = None,
+             fmt_kwargs: dict[str, Any] | None = None,
+             fields: BoundFields | None = None,
+             rendered: dict[Formatter, str] | None = None) -> int:
+        """Formats record by the formatter and writes it to the IO, without any checks.
+
+        :param formatter: Formatter.
+        :type formatter: Formatter
+        :param io: IO to be used to write messages.
+        :type io: TextIO
+        :param lock: Lock of the IO writes.
+        :type lock: threading.Lock
+        :param log_exceptions: Determines whether log exceptions or not.
+        :type log_exceptions: bool
+
+        :returns: Number of the written characters.
+        :rtype: int
+        """
+
+        embeds_exceptions = formatter.embeds_exceptions
+
+        # embedded exception depends on the handler settings, such records aren't shared
+        if embeds_exceptions and exc is not None:
+            rendered = None
+
+        text = None if rendered is None else rendered.get(formatter)
+
+        # record is already rendered with colors for the other handler, encode it as plain text
+        if text is None and rendered is not None and formatter.source in rendered:
+            text = strip_styles(rendered[formatter.source])
+
+        if text is None:
+            text = formatter.format(
                 message,
                 time,
                 level,
@@ -139,13 +483,106 @@ class IOHandler(Handler):
                 logger_name,
                 group_name,
                 group_color,
-                fmt_args, fmt_kwargs)+'\n')
+                fmt_args, fmt_kwargs, fields,
+                exc=exc if log_exceptions and embeds_exceptions else None)
 
-            # format and write exception to io if exceptions logging is enabled and exception was given
-            if self.log_exceptions and exc is not None:
-                self.io.write(self.formatter.format_exception(exc)+'\n')
+            if rendered is not None:
+                rendered[formatter] = text
 
-            self.io.flush()
+        # log formatted message
+        text += '\n'
+
+        # format and write exception to io if exceptions logging is enabled and exception was given
+        if log_exceptions and exc is not None and not embeds_exceptions:
+            text += formatter.format_exception(exc)+'\n'
+
+        with lock:
+            io.write(text)
+            io.flush()
+
+        return len(text)
+
+    @staticmethod
+    def emit_bytes(encoding: str,
+                   formatter: Formatter,
+                   io: BinaryIO,
+                   lock: threading.Lock,
+                   log_exceptions: bool,
+                   message: str,
+                   level: str | int,
+                   logger_color: str,
+                   logger_name: str,
+                   group_name: str,
+                   group_color: str,
+                   exc: Exception | None = None,
+                   time: datetime.datetime | None = None,
+                   fmt_args: list[Any] | None = None,
+                   fmt_kwargs: dict[str, Any] | None = None,
+                   fields: BoundFields | None = None,
+                   rendered: dict[Formatter, str] | None = None) -> int:
+        """Formats record to bytes by the formatter (see :meth:`pyrolog.Formatter.format_bytes()`) and writes it to
+        the binary IO, without any checks. It is used as :meth:`emit()` of the handlers with the output encoding.
+        Encoded records are shared between the handlers with the same formatter and encoding.
+
+        :param encoding: Encoding.
+        :type encoding: str
+        :param formatter: Formatter.
+        :type formatter: Formatter
+        :param io: Binary IO to be used to write messages.
+        :type io: BinaryIO
+        :param lock: Lock of the IO writes.
+        :type lock: threading.Lock
+        :param log_exceptions: Determines whether log exceptions or not.
+        :type log_exceptions: bool
+
+        :returns: Number of the written bytes.
+        :rtype: int
+        """
+
+        embeds_exceptions = formatter.embeds_exceptions
+
+        if embeds_exceptions and exc is not None:
+            rendered = None
+
+        key   = (formatter, encoding)
+        data  = None if rendered is None else rendered.get(key)
+
+        # record is already rendered as text for the other handler, only encode it
+        if data is None and rendered is not None:
+            text = rendered.get(formatter)
+
+            if text is None and formatter.source in rendered:
+                text = strip_styles(rendered[formatter.source])
+
+            if text is not None:
+                data = text.encode(encoding)
+
+        if data is None:
+            data = formatter.format_bytes(
+                encoding,
+                message,
+                time,
+                level,
+                logger_color,
+                logger_name,
+                group_name,
+                group_color,
+                fmt_args, fmt_kwargs, fields,
+                exc=exc if log_exceptions and embeds_exceptions else None)
+
+            if rendered is not None:
+                rendered[key] = data
+
+        data += b'\n'
+
+        if log_exceptions and exc is not None and not embeds_exceptions:
+            data += (formatter.format_exception(exc) + '\n').encode(encoding)
+
+        with lock:
+            io.write(data)
+            io.flush()
+
+        return len(data)
 
     def set_level(self, level: LogLevel):
         """Sets log level of handler to given.
@@ -153,39 +590,133 @@ class IOHandler(Handler):
         :param level: Log level.
         :type level: LogLevel
         """
+
+        self.logging_context.check_frozen()
         self.log_level = level
 
 
 class StdoutHandler(IOHandler):
     """Handles stdout output (console).
-    This class is shorthand for IOHandler(sys.stdout, ...)."""
+    This class is shorthand for IOHandler(sys.stdout, ...). If the output encoding is given, records are written to
+    the ``sys.stdout.buffer`` (text printed to the ``sys.stdout`` meanwhile is written when the text layer is
+    flushed)."""
 
     def __init__(self, *args: Any, **kwargs: dict[str, Any]):
-        super().__init__(sys.stdout, *args, **kwargs)
+        super().__init__(sys.stdout if kwargs.get('output_encoding') is None else sys.stdout.buffer, *args, **kwargs)
 
 
 class StderrHandler(IOHandler):
     """Handles stderr output (console).
-    This class is shorthand for IOHandler(sys.stdout, ...)."""
+    This class is shorthand for IOHandler(sys.stdout, ...). If the output encoding is given, records are written to
+    the ``sys.stderr.buffer``."""
 
     def __init__(self, *args: Any, **kwargs: dict[str, Any]):
-        super().__init__(sys.stderr, *args, **kwargs)
+        super().__init__(sys.stderr if kwargs.get('output_encoding') is None else sys.stderr.buffer, *args, **kwargs)
+
+
+class AppendIO:
+    """Text IO of the file opened in the append mode (``O_APPEND``), that can be shared by several processes. Every
+    :meth:`write()` (the whole record with its exception, see :meth:`IOHandler.emit()`) is encoded once and written
+    by one ``os.write()`` call without buffering, so records of the different processes are never mixed. Records
+    larger than the atomic write size are written under the advisory lock of the file (``flock``), which is taken by
+    the other processes for the large records too.
+
+    :ivar fd: File descriptor.
+    :type fd: int
+    :ivar encoding: Encoding.
+    :type encoding: str
+    :ivar atomic_size: Maximum size in bytes of the record written without the lock.
+    :type atomic_size: int
+    """
+
+    def __init__(self,
+                 path: str | bytes | PathLike[str] | PathLike[bytes] | int,
+                 encoding: str = 'utf8',
+                 atomic_size: int = ATOMIC_WRITE_SIZE):
+        """
+        :param path: Path to the file, or descriptor of the file opened with ``O_APPEND``.
+        :type path: str | bytes | PathLike[str] | PathLike[bytes] | int
+        :param encoding: Encoding.
+        :type encoding: str
+        :param atomic_size: Maximum size in bytes of the record written without the lock.
+        :type atomic_size: int
+        """
+
+        self.fd           = path if isinstance(path, int) else \
+            os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_CLOEXEC', 0), 0o666)
+        self.encoding     = encoding
+        self.atomic_size  = atomic_size
+
+        self.closed = False
+
+    def write(self, text: str | bytes) -> int:
+        data = text if isinstance(text, bytes) else text.encode(self.encoding)
+
+        if len(data) <= self.atomic_size or fcntl is None:
+            self.write_all(data)
+        else:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+
+            try:
+                self.write_all(data)
+            finally:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+        return len(text)
+
+    def write_all(self, data: bytes):
+        """Writes data to the file. Writes of the regular files are partial only on errors (i.e. full disk), so the
+        rest is written by the next calls.
+
+        :param data: Data.
+        :type data: bytes
+        """
+
+        view = memoryview(data)
+
+        while view:
+            view = view[os.write(self.fd, view):]
+
+    def flush(self):
+        pass
+
+    def isatty(self) -> bool:
+        return os.isatty(self.fd)
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            os.close(self.fd)
 
 
 class FileHandler(IOHandler):
     """Handles file output.
 
     :ivar file_io: Opened file object.
-    :type file_io: TextIO
+    :type file_io: TextIO | BinaryIO | AppendIO
     :ivar path: Path to the file.
     :type path: str | bytes | PathLike[str] | PathLike[bytes] | int
     :ivar encoding: Encoding, by default is the UTF-8.
-    :type encoding: str"""
+    :type encoding: str
+    :ivar per_process: Determines whether every forked process opens its own file.
+    :type per_process: bool
+    :ivar append: Determines whether the file is appended (and can be shared by several processes, see
+        :class:`AppendIO`) instead of truncated.
+    :type append: bool
+    :ivar bytes_output: Determines whether records are formatted to bytes and the file is opened in the binary mode
+        (see the output encoding of the :class:`IOHandler`).
+    :type bytes_output: bool"""
 
     def __init__(self,
                  path: str | bytes | PathLike[str] | PathLike[bytes] | int,
                  encoding: str = 'utf8',
                  *args: Any,
+                 per_process: bool = False,
+                 append: bool = False,
+                 bytes_output: bool = False,
                  **kwargs: dict[str, Any]
                  ):
         """
@@ -193,12 +724,1006 @@ class FileHandler(IOHandler):
         :type path: str | bytes | PathLike[str] | PathLike[bytes] | int
         :param encoding: Encoding, by default is the UTF-8.
         :type encoding: str
+        :param per_process: Determines whether every forked process opens its own file. ``{pid}`` in the path (if it
+            is a string) is replaced by the process id, i.e. ``app-{pid}.log``.
+        :type per_process: bool
+        :param append: Determines whether the file is appended (and can be shared by several processes, see
+            :class:`AppendIO`) instead of truncated.
+        :type append: bool
+        :param bytes_output: Determines whether records are formatted to bytes in the encoding of the file and the
+            file is opened in the binary mode, so the constant parts of the records are encoded once (see
+            :meth:`pyrolog.PlainFormatter.format_bytes()`).
+        :type bytes_output: bool
+
+        :raises ValueError: If the file is opened per process, but the path has no ``{pid}`` (the child would
+            truncate the file of the parent).
+        """
+        if per_process and not (isinstance(path, str) and '{pid}' in path):
+            raise ValueError('File opened per process needs "{pid}" in the path')
+
+        self.path          = path
+        self.encoding      = encoding
+        self.per_process   = per_process
+        self.append        = append
+        self.bytes_output  = bytes_output
+        self.file_io       = self.open()
+
+        super().__init__(self.file_io, *args, output_encoding=encoding if bytes_output else None, **kwargs)
+
+    def open(self) -> TextIO | BinaryIO | AppendIO:
+        """Opens the file.
+
+        :returns: Opened file object.
+        :rtype: TextIO | BinaryIO | AppendIO
+        """
+
+        path = self.path
+
+        if self.per_process and isinstance(path, str):
+            path = path.replace('{pid}', str(os.getpid()))
+
+        if self.append:
+            return AppendIO(path, self.encoding)
+
+        if self.bytes_output:
+            return open(path, 'wb')
+
+        return open(path, 'w', encoding=self.encoding)
+
+    def after_fork(self, child: bool):
+        super().after_fork(child)
+
+        # advisory lock is held by the open file, that is shared with the parent, so appended file is reopened too
+        if child and (self.per_process or self.append and not isinstance(self.path, int)):
+            # buffer is flushed before the fork, closing doesn't write anything
+            self.file_io.close()
+            self.file_io = self.io = self.open()
+
+    def close_io(self):
+        self.file_io.close()
+
+    def __del__(self):
+        # file isn't opened, if arguments are invalid
+        if hasattr(self, 'file_io'):
+            self.file_io.close()
+
+
+class BinaryHandler(Handler):
+    """Writes records to the binary IO in the compact binary format (see :mod:`pyrolog.binary`). Records aren't
+    formatted, so formatter of the handler is used only when logs are read. Read logs by
+    :class:`pyrolog.BinaryReader`, :func:`pyrolog.render_binary` or ``python -m pyrolog.decode``.
+
+    :ivar io: Binary IO to be used to write records.
+    :type io: BinaryIO
+    :ivar writer: Binary format writer.
+    :type writer: BinaryWriter
+    """
+
+    def __init__(self, io: BinaryIO, *args: Any, **kwargs: dict[str, Any]):
+        """
+        :param io: Binary IO to be used to write records.
+        :type io: BinaryIO
+        """
+        super().__init__(*args, **kwargs)
+
+        self.io      = io
+        self.writer  = BinaryWriter(io)
+
+        self._lock      = threading.Lock()
+        self._measured  = None
+
+    def fork_locks(self) -> list[threading.Lock]:
+        return [self._lock]
+
+    def finish_shutdown(self, deadline: float | None) -> int:
+        self.enabled = False
+
+        if acquire(self._lock, deadline):
+            try:
+                self.close_io()
+            except Exception:
+                pass
+            finally:
+                self._lock.release()
+
+        return 0
+
+    def close_io(self):
+        """Flushes the IO at shutdown (see :meth:`Handler.finish_shutdown()`). Handlers, that own their IOs, also close
+        them."""
+
+        self.io.flush()
+
+    def write(self,
+              message: str,
+              level: str | int,
+              logger_color: str,
+              logger_name: str,
+              group_name: str,
+              group_color: str,
+              exc: Exception | None = None,
+              time: datetime.datetime | None = None,
+              fmt_args: list[Any] | None = None,
+              fmt_kwargs: dict[str, Any] | None = None,
+              fields: BoundFields | None = None,
+              rendered: dict[Formatter, str] | None = None):
+        metrics = self.logging_context.metrics
+
+        if not self.enabled or not self.logging_context.log_level(self.log_level, level):
+            if metrics is not None:
+                metrics.count('records_filtered', self.name, logger_name, level)
+            return
+
+        if metrics is None:
+            self.emit(message, level, logger_color, logger_name, group_name, group_color,
+                      exc, time, fmt_args, fmt_kwargs, fields, rendered)
+        else:
+            self.measured_emit(metrics)(message, level, logger_color, logger_name, group_name, group_color,
+                                        exc, time, fmt_args, fmt_kwargs, fields, rendered)
+
+    def compile(self) -> Callable:
+        """Makes function, that writes records without checks of the handler state. See :meth:`Handler.compile()`.
+
+        :returns: Function, that writes records.
+        :rtype: Callable
+        """
+
+        metrics = self.logging_context.metrics
+
+        return self.emit if metrics is None else self.measured_emit(metrics)
+
+    def measured_emit(self, metrics: Metrics) -> Callable:
+        """Gets :meth:`emit()`, that counts records by the metrics (see :meth:`pyrolog.Metrics.measured()`).
+        Function is made once and is made again only when the metrics registry or name of the handler is changed.
+
+        :param metrics: Metrics registry.
+        :type metrics: Metrics
+
+        :returns: Function, that writes records.
+        :rtype: Callable
+        """
+
+        key       = (metrics, self.name)
+        measured  = self._measured
+
+        if measured is None or measured[0] != key:
+            measured = self._measured = (key, metrics.measured(self.name, self.emit))
+
+        return measured[1]
+
+    def emit(self,
+             message: str,
+             level: str | int,
+             logger_color: str,
+             logger_name: str,
+             group_name: str,
+             group_color: str,
+             exc: Exception | None = None,
+             time: datetime.datetime | None = None,
+             fmt_args: list[Any] | None = None,
+             fmt_kwargs: dict[str, Any] | None = None,
+             fields: BoundFields | None = None,
+             rendered: dict[Formatter, str] | None = None) -> int:
+        """Encodes record and writes it to the IO, without any checks.
+
+        :returns: Number of the written bytes.
+        :rtype: int
+        """
+
+        # dictionary of the writer must be consistent with the written frames
+        with self._lock:
+            written = self.writer.write(message, time, level, logger_color, logger_name, group_name, group_color,
+                                        fmt_args, fmt_kwargs, fields, exc if self.log_exceptions else None)
+            self.io.flush()
+
+        return written
+
+    def set_level(self, level: LogLevel):
+        """Sets log level of handler to given.
+
+        :param level: Log level.
+        :type level: LogLevel
+        """
+
+        self.logging_context.check_frozen()
+        self.log_level = level
+
+
+class BinaryFileHandler(BinaryHandler):
+    """Handles binary file output.
+
+    :ivar file_io: Opened file object.
+    :type file_io: BinaryIO
+    :ivar path: Path to the file.
+    :type path: str | bytes | PathLike[str] | PathLike[bytes] | int"""
+
+    def __init__(self,
+                 path: str | bytes | PathLike[str] | PathLike[bytes] | int,
+                 *args: Any,
+                 **kwargs: dict[str, Any]
+                 ):
+        """
+        :param path: Path to the file.
+        :type path: str | bytes | PathLike[str] | PathLike[bytes] | int
         """
-        self.file_io   = open(path, 'w', encoding=encoding)
-        self.path      = path
-        self.encoding  = encoding
+        self.file_io  = open(path, 'wb')
+        self.path     = path
 
         super().__init__(self.file_io, *args, **kwargs)
 
+    def close_io(self):
+        self.file_io.close()
+
     def __del__(self):
         self.file_io.close()
+
+
+class GuardedHandler(Handler):
+    """Wraps handler with the health tracking and circuit breaker (see :mod:`pyrolog.health`), so a slow or failing
+    handler (i.e. full disk, closed pipe) doesn't break the application. Exceptions raised by the wrapped handler
+    don't propagate to the logger. Records, that bypass the wrapped handler (the breaker is open or writing raised an
+    exception), are written by the fallback handler or dropped. Trips and recoveries of the breaker are logged as the
+    ``warn`` records by the notice handler.
+
+    Example:
+
+    .. code-block:: python
+
+        file_handler = pyrolog.GuardedHandler(
+            pyrolog.FileHandler('app.log'),
+            fallback=pyrolog.StderrHandler(),
+        )
+
+    .. note::
+        The breaker bypasses the handler after its writes became slow, but it can't interrupt the write, that hangs.
+
+    :ivar handler: Wrapped handler.
+    :type handler: Handler
+    :ivar fallback: Handler, that writes records bypassing the wrapped handler.
+    :type fallback: Handler | None
+    :ivar notify: Handler, that writes trips and recoveries of the breaker.
+    :type notify: Handler
+    :ivar health: Health of the wrapped handler.
+    :type health: HandlerHealth
+    """
+
+    def __init__(self,
+                 handler: Handler,
+                 fallback: Handler | None = None,
+                 notify: Handler | None = None,
+                 *args: Any,
+                 name: str | None = None,
+                 **kwargs: dict[str, Any]):
+        """
+        :param handler: Wrapped handler.
+        :type handler: Handler
+        :param fallback: Handler, that writes records bypassing the wrapped handler. If it isn't given, such records are
+            dropped.
+        :type fallback: Handler | None
+        :param notify: Handler, that writes trips and recoveries of the breaker. By default, it is the fallback
+            handler, or the :class:`StderrHandler` if there is no fallback.
+        :type notify: Handler | None
+        :param args: Arguments of the :class:`pyrolog.HandlerHealth`.
+        :type args: Any
+        :param name: Name of the handler. By default, it is name of the wrapped handler.
+        :type name: str | None
+        :param kwargs: Named arguments of the :class:`pyrolog.HandlerHealth`.
+        :type kwargs: dict[str, Any]
+        """
+        super().__init__(handler.log_level, handler.formatter, handler.logging_context, handler.log_exceptions,
+                         name=handler.name if name is None else name)
+
+        if notify is None:
+            notify = fallback if fallback is not None else StderrHandler(0, logging_context=handler.logging_context)
+
+        self.handler   = handler
+        self.fallback  = fallback
+        self.notify    = notify
+        self.health    = HandlerHealth(*args, **kwargs)
+
+    def fork_locks(self) -> list[threading.Lock]:
+        return self.health.fork_locks()
+
+    def write(self,
+              message: str,
+              level: str | int,
+              logger_color: str,
+              logger_name: str,
+              group_name: str,
+              group_color: str,
+              exc: Exception | None = None,
+              time: datetime.datetime | None = None,
+              fmt_args: list[Any] | None = None,
+              fmt_kwargs: dict[str, Any] | None = None,
+              fields: BoundFields | None = None,
+              rendered: dict[Formatter, str] | None = None):
+        if not self.enabled:
+            return
+
+        handler = self.handler
+
+        # filtered records don't affect the health
+        if not handler.enabled or not self.logging_context.log_level(handler.log_level, level):
+            handler.write(message, level, logger_color, logger_name, group_name, group_color,
+                          exc, time, fmt_args, fmt_kwargs, fields, rendered)
+            return
+
+        health = self.health
+
+        if not health.allow():
+            self.bypass(message, level, logger_color, logger_name, group_name, group_color,
+                        exc, time, fmt_args, fmt_kwargs, fields, rendered)
+            return
+
+        start = perf_counter()
+
+        try:
+            handler.write(message, level, logger_color, logger_name, group_name, group_color,
+                          exc, time, fmt_args, fmt_kwargs, fields, rendered)
+        except Exception as e:
+            transition = health.failure(e, perf_counter() - start)
+            self.bypass(message, level, logger_color, logger_name, group_name, group_color,
+                        exc, time, fmt_args, fmt_kwargs, fields, rendered)
+        else:
+            transition = health.success(perf_counter() - start)
+
+        if transition is not None:
+            self.notice(transition)
+
+    def bypass(self,
+               message: str,
+               level: str | int,
+               logger_color: str,
+               logger_name: str,
+               group_name: str,
+               group_color: str,
+               exc: Exception | None = None,
+               time: datetime.datetime | None = None,
+               fmt_args: list[Any] | None = None,
+               fmt_kwargs: dict[str, Any] | None = None,
+               fields: BoundFields | None = None,
+               rendered: dict[Formatter, str] | None = None):
+        """Writes record, that bypasses the wrapped handler, by the fallback handler, or drops it."""
+
+        if self.fallback is not None:
+            try:
+                self.fallback.write(message, level, logger_color, logger_name, group_name, group_color,
+                                    exc, time, fmt_args, fmt_kwargs, fields, rendered)
+                return
+            except Exception:
+                pass
+
+        metrics = self.logging_context.metrics
+
+        if metrics is not None:
+            metrics.count('records_dropped', self.name, logger_name, level)
+
+    def notice(self, transition: str):
+        """Logs trip or recovery of the breaker by the notice handler.
+
+        :param transition: Transition of the breaker (:data:`pyrolog.health.TRIPPED` or
+            :data:`pyrolog.health.RECOVERED`).
+        :type transition: str
+        """
+
+        health   = self.health
+        metrics  = self.logging_context.metrics
+
+        if transition is TRIPPED and metrics is not None:
+            metrics.add('breaker_trips', (self.name,))
+
+        log_levels  = self.logging_context.log_levels
+        level       = 'warn' if 'warn' in log_levels else max(log_levels, key=log_levels.get)
+
+        # numbers are formatted here, formatters (i.e. ColoredFormatter) can render arguments to the strings
+        try:
+            self.notify.write(
+                'Handler {} {}: average latency {latency} s, error rate {errors}, last error: {error}',
+                level, '', 'pyrolog', '', '',
+                time=datetime.datetime.now(),
+                fmt_args=[self.name, transition],
+                fmt_kwargs={'latency': f'{health.latency:.4f}', 'errors': f'{health.errors:.2f}',
+                            'error': repr(health.last_error)},
+            )
+        except Exception as e:
+            sys.stderr.write(f'pyrolog: notice of the handler {self.name} ({transition}) is not written: {e!r}\n')
+
+    def set_level(self, level: LogLevel):
+        """Sets log level of the wrapped handler to given.
+
+        :param level: Log level.
+        :type level: LogLevel
+        """
+
+        self.logging_context.check_frozen()
+        self.handler.set_level(level)
+        self.log_level = level
+
+
+class QueueHandler(Handler):
+    """Puts records to the queue, the wrapped handler formats and writes them in the background thread, so the
+    application doesn't wait for the formatting and IO. Arguments of the records are formatted later, so don't change
+    them after they are logged.
+
+    With the load shedding enabled, the handler raises its effective level (the level, records below which are skipped
+    before they are queued and formatted) step by step, while the queue is filled above the high watermark or the
+    average write latency is above the limit, and lowers it back, when the queue is drained to the low watermark and
+    the latency is below the half of the limit. Every change is logged by the wrapped handler as the ``warn`` record.
+
+    Records at or above the express level (``error`` by default) don't wait behind the queued ones: they are written
+    (and flushed) by the wrapped handler right away, in the calling thread. So, written records can be out of order.
+    Every record gets the sequence number as the ``seq`` named argument (use ``{seq}`` in the format string, or read
+    it from the JSON and binary logs), sort records by it to get the true order.
+
+    Wrap the handler by the :class:`GuardedHandler` to handle its failures: exceptions raised in the background thread
+    are dropped.
+
+    Example:
+
+    .. code-block:: python
+
+        handler = pyrolog.QueueHandler(
+            pyrolog.FileHandler(
+                'app.log',
+                log_level='debug',
+                formatter=pyrolog.PlainFormatter('#{seq} ' + pyrolog.defaults.MAXIMUM_FORMAT_STRING)
+            ),
+            shedding=True
+        )
+
+    :ivar handler: Wrapped handler.
+    :type handler: Handler
+    :ivar queue: Queue with the records (tuples with the arguments of the :meth:`write()`), None ends the worker.
+    :type queue: queue.Queue
+    :ivar block: Determines whether wait for the free place in the full queue, or drop the record.
+    :type block: bool
+    :ivar express_level: Level, records at or above which are written right away. If it is None, all records are
+        queued.
+    :type express_level: LogLevel | None
+    :ivar sequence: Counter of the sequence numbers of the records.
+    :type sequence: itertools.count
+    :ivar effective_level: Level, records below which are skipped. It is :attr:`log_level`, if the handler doesn't
+        shed the load.
+    :type effective_level: LogLevel
+    :ivar shedding: Determines whether the load shedding is enabled.
+    :type shedding: bool
+    :ivar max_level: The highest effective level set by the load shedding.
+    :type max_level: str
+    :ivar high_watermark: Fill of the queue (from 0 to 1), at which the effective level is raised.
+    :type high_watermark: float
+    :ivar low_watermark: Fill of the queue (from 0 to 1), at which the effective level is lowered back.
+    :type low_watermark: float
+    :ivar max_latency: Average write latency in seconds, at which the effective level is raised. If it is None,
+        latency isn't checked.
+    :type max_latency: float | None
+    :ivar cooldown: Minimum time in seconds between the changes of the effective level.
+    :type cooldown: float
+    :ivar latency: Moving average of the write latency of the wrapped handler, in seconds.
+    :type latency: float
+    :ivar level_changes: Number of the changes of the effective level.
+    :type level_changes: int
+    :ivar dropped: Number of the records dropped by the background thread after the deadline of the shutdown.
+    :type dropped: int
+    """
+
+    def __init__(self,
+                 handler: Handler,
+                 maxsize: int = QUEUE_SIZE,
+                 block: bool = False,
+                 express_level: LogLevel | None = 'error',
+                 shedding: bool = False,
+                 max_level: str = 'warn',
+                 high_watermark: float = SHED_HIGH_WATERMARK,
+                 low_watermark: float = SHED_LOW_WATERMARK,
+                 max_latency: float | None = None,
+                 cooldown: float = SHED_COOLDOWN,
+                 name: str | None = None):
+        """
+        :param handler: Wrapped handler.
+        :type handler: Handler
+        :param maxsize: Maximum count of the records in the queue.
+        :type maxsize: int
+        :param block: Determines whether wait for the free place in the full queue, or drop the record.
+        :type block: bool
+        :param express_level: Level, records at or above which are written right away. If it is None, or there is no
+            such level, all records are queued.
+        :type express_level: LogLevel | None
+        :param shedding: Determines whether the load shedding is enabled. Log level of the wrapped handler must be
+            the name or the value of the log level.
+        :type shedding: bool
+        :param max_level: The highest effective level set by the load shedding. If there is no such level, it is the
+            highest log level.
+        :type max_level: str
+        :param high_watermark: Fill of the queue (from 0 to 1), at which the effective level is raised.
+        :type high_watermark: float
+        :param low_watermark: Fill of the queue (from 0 to 1), at which the effective level is lowered back.
+        :type low_watermark: float
+        :param max_latency: Average write latency in seconds, at which the effective level is raised.
+        :type max_latency: float | None
+        :param cooldown: Minimum time in seconds between the changes of the effective level.
+        :type cooldown: float
+        :param name: Name of the handler. By default, it is name of the wrapped handler.
+        :type name: str | None
+
+        :raises ValueError: If the load shedding is enabled, but log level of the wrapped handler isn't the name or
+            the value of the log level.
+        """
+        super().__init__(handler.log_level, handler.formatter, handler.logging_context, handler.log_exceptions,
+                         name=handler.name if name is None else name)
+
+        log_levels = self.logging_context.log_levels
+
+        if shedding and not isinstance(handler.log_level, (str, int)):
+            raise ValueError('Load shedding needs log level of the handler to be the name or the value of the level')
+
+        self.handler          = handler
+        self.queue            = queue.Queue(maxsize)
+        self.block            = block
+        self.express_level    = None if isinstance(express_level, str) and express_level not in log_levels \
+            else express_level
+        self.sequence         = itertools.count(1)
+        self.effective_level  = handler.log_level
+        self.shedding         = shedding
+        self.max_level        = max_level if max_level in log_levels else max(log_levels, key=log_levels.get)
+        self.high_watermark   = high_watermark
+        self.low_watermark    = low_watermark
+        self.max_latency      = max_latency
+        self.cooldown         = cooldown
+        self.latency          = 0.0
+        self.level_changes    = 0
+
+        self.dropped      = 0
+
+        self._changed_at  = 0.0
+        self._closed      = False
+        self._deadline    = None
+        self._lock        = threading.Lock()
+        self._worker      = threading.Thread(target=self.work, name=f'pyrolog-queue-{self.name}', daemon=True)
+
+        self._worker.start()
+
+    def fork_locks(self) -> list[threading.Lock]:
+        return [self._lock, self.queue.mutex]
+
+    def after_fork(self, child: bool):
+        super().after_fork(child)
+
+        if child and not self._closed:
+            # queued records are written by the parent, worker thread doesn't exist in the child
+            self.queue    = queue.Queue(self.queue.maxsize)
+            self._worker  = threading.Thread(target=self.work, name=f'pyrolog-queue-{self.name}', daemon=True)
+
+            self._worker.start()
+
+    def write(self,
+              message: str,
+              level: str | int,
+              logger_color: str,
+              logger_name: str,
+              group_name: str,
+              group_color: str,
+              exc: Exception | None = None,
+              time: datetime.datetime | None = None,
+              fmt_args: list[Any] | None = None,
+              fmt_kwargs: dict[str, Any] | None = None,
+              fields: BoundFields | None = None,
+              rendered: dict[Formatter, str] | None = None):
+        logging_context = self.logging_context
+
+        if not self.enabled or not logging_context.log_level(self.effective_level, level):
+            metrics = logging_context.metrics
+
+            if metrics is not None:
+                shed = self.enabled and logging_context.log_level(self.log_level, level)
+                metrics.count('records_shed' if shed else 'records_filtered', self.name, logger_name, level)
+            return
+
+        fmt_kwargs = {'seq': next(self.sequence)} if fmt_kwargs is None else {**fmt_kwargs, 'seq': next(self.sequence)}
+
+        if self.express_level is not None and logging_context.log_level(self.express_level, level):
+            with self._lock:
+                self.handler.write(message, level, logger_color, logger_name, group_name, group_color,
+                                   exc, time, fmt_args, fmt_kwargs, fields)
+            return
+
+        # frame can't be inspected later, when it is already executing the other code
+        stack = fmt_kwargs.get('stack')
+
+        if isinstance(stack, LazyFrameInfo):
+            fmt_kwargs['stack'] = stack.detach()
+
+        record = (message, level, logger_color, logger_name, group_name, group_color,
+                  exc, time, fmt_args, fmt_kwargs, fields)
+
+        try:
+            self.queue.put(record, self.block)
+        except queue.Full:
+            metrics = logging_context.metrics
+
+            if metrics is not None:
+                metrics.count('records_dropped', self.name, logger_name, level)
+
+    def work(self):
+        """Writes records from the queue by the wrapped handler, until None is got. Is run in the background thread."""
+
+        q        = self.queue
+        handler  = self.handler
+        lock     = self._lock
+        alpha    = HEALTH_EWMA_ALPHA
+
+        while True:
+            try:
+                record = q.get(timeout=self.cooldown if self.effective_level != self.log_level else None)
+            except queue.Empty:
+                if self._closed:
+                    return
+
+                # no load, the effective level is lowered back while the queue is empty
+                self.adapt(0)
+                continue
+
+            if record is None:
+                q.task_done()
+                return
+
+            start = perf_counter()
+
+            try:
+                with lock:
+                    handler.write(*record)
+            except Exception:
+                pass
+
+            self.latency += alpha * (perf_counter() - start - self.latency)
+
+            q.task_done()
+
+            metrics = self.logging_context.metrics
+
+            if metrics is not None:
+                metrics.set('queue_depth', (self.name,), q.qsize())
+
+            if self.shedding:
+                self.adapt(q.qsize())
+
+            if self._closed:
+                # deadline of the shutdown is passed, the rest of the records is dropped
+                if self._deadline is not None and monotonic() >= self._deadline:
+                    self.dropped += self.discard()
+                    return
+
+                # queue was full at the shutdown, so there is no None at its end
+                if q.empty():
+                    return
+
+    def discard(self) -> int:
+        """Drops records from the queue.
+
+        :returns: Number of the dropped records.
+        :rtype: int
+        """
+
+        count    = 0
+        metrics  = self.logging_context.metrics
+
+        while True:
+            try:
+                record = self.queue.get_nowait()
+            except queue.Empty:
+                return count
+
+            self.queue.task_done()
+
+            if record is None:
+                continue
+
+            count += 1
+
+            if metrics is not None:
+                metrics.count('records_dropped', self.name, record[3], record[1])
+
+    def adapt(self, backlog: int):
+        """Raises or lowers the effective level by the backlog and latency (see :class:`QueueHandler`).
+
+        :param backlog: Count of the records in the queue.
+        :type backlog: int
+        """
+
+        now = monotonic()
+
+        if now - self._changed_at < self.cooldown:
+            return
+
+        maxsize      = self.queue.maxsize or QUEUE_SIZE
+        max_latency  = self.max_latency
+        log_levels   = self.logging_context.log_levels
+        current      = self.effective_level
+        current      = log_levels[current] if isinstance(current, str) else current
+        base         = log_levels[self.log_level] if isinstance(self.log_level, str) else self.log_level
+
+        if backlog >= maxsize * self.high_watermark or (max_latency is not None and self.latency >= max_latency):
+            # the next level above the current one, up to the maximum level
+            higher = [n for n, v in log_levels.items() if current < v <= log_levels[self.max_level]]
+
+            if higher:
+                self.change_level(min(higher, key=log_levels.get), backlog, now)
+
+        elif current > base and backlog <= maxsize * self.low_watermark and \
+                (max_latency is None or self.latency < max_latency / 2):
+            lower = [n for n, v in log_levels.items() if base <= v < current]
+
+            self.change_level(max(lower, key=log_levels.get) if lower else self.log_level, backlog, now)
+
+    def change_level(self, level: LogLevel, backlog: int, now: float):
+        """Sets the effective level, logs and counts the change.
+
+        :param level: New effective level.
+        :type level: LogLevel
+        :param backlog: Count of the records in the queue.
+        :type backlog: int
+        :param now: Time of the change (by `time.monotonic()`).
+        :type now: float
+        """
+
+        self.effective_level  = level
+        self.level_changes   += 1
+        self._changed_at      = now
+
+        metrics = self.logging_context.metrics
+
+        if metrics is not None:
+            metrics.add('level_changes', (self.name, str(level)))
+
+        log_levels    = self.logging_context.log_levels
+        notice_level  = 'warn' if 'warn' in log_levels else max(log_levels, key=log_levels.get)
+
+        # latency is formatted here, formatters (i.e. ColoredFormatter) can render arguments to the strings
+        try:
+            with self._lock:
+                self.handler.write(
+                    'Handler {} changed effective level to {}: backlog {backlog}, average latency {latency} s',
+                    notice_level, '', 'pyrolog', '', '',
+                    time=datetime.datetime.now(),
+                    fmt_args=[self.name, level],
+                    fmt_kwargs={'backlog': backlog, 'latency': f'{self.latency:.4f}', 'seq': next(self.sequence)},
+                )
+        except Exception as e:
+            sys.stderr.write(f'pyrolog: notice of the handler {self.name} (level change) is not written: {e!r}\n')
+
+    def join(self):
+        """Waits until all queued records are written."""
+
+        self.queue.join()
+
+    def begin_shutdown(self, deadline: float | None):
+        """Stops accepting records, the background thread writes queued ones and stops."""
+
+        self.enabled    = False
+        self._closed    = True
+        self._deadline  = deadline
+
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def finish_shutdown(self, deadline: float | None) -> int:
+        """Waits for the background thread until the deadline. Thread, that is still running after the deadline, can
+        hang only in the write of the wrapped handler, it drops the rest of the records after it and stops (thread is
+        a daemon, so it doesn't block the exit).
+
+        :returns: Number of the dropped records (including the records still in the queue).
+        :rtype: int
+        """
+
+        self._worker.join(None if deadline is None else max(deadline - monotonic(), 0))
+
+        dropped = self.dropped
+
+        if self._worker.is_alive():
+            dropped += self.queue.qsize()
+
+        self.dropped = 0
+
+        return dropped
+
+    def close(self, timeout: float | None = None) -> int:
+        """Writes queued records and stops the background thread. Records logged after it are dropped.
+
+        :param timeout: Time in seconds, after which unwritten records are dropped. If it is None, there is no
+            deadline.
+        :type timeout: float | None
+
+        :returns: Number of the dropped records.
+        :rtype: int
+        """
+
+        return self.shutdown(timeout)
+
+    def set_level(self, level: LogLevel):
+        """Sets log level of the wrapped handler to given, and resets the effective level.
+
+        :param level: Log level.
+        :type level: LogLevel
+        """
+
+        self.logging_context.check_frozen()
+        self.handler.set_level(level)
+        self.log_level        = level
+        self.effective_level  = level
+
+
+def acquire(lock: threading.Lock, deadline: float | None) -> bool:
+    """Acquires lock until the deadline.
+
+    :param lock: Lock.
+    :type lock: threading.Lock
+    :param deadline: Time (by `time.monotonic()`). If it is None, waits without the deadline.
+    :type deadline: float | None
+
+    :returns: True, if lock is acquired.
+    :rtype: bool
+    """
+
+    return lock.acquire(timeout=-1 if deadline is None else max(deadline - monotonic(), 0))
+
+
+def nesting(handler: Handler) -> int:
+    """Gets nesting of the handler: count of the handlers wrapped by it (see :class:`GuardedHandler`,
+    :class:`QueueHandler`). Wrapped handlers write under the locks of their wrappers, so locks of the outer handlers
+    are acquired before the fork first, and outer handlers are drained at shutdown first.
+
+    :param handler: Handler.
+    :type handler: Handler
+
+    :returns: Nesting.
+    :rtype: int
+    """
+
+    wrapped = getattr(handler, 'handler', None)
+
+    return 0 if not isinstance(wrapped, Handler) else nesting(wrapped) + 1
+
+
+forked_handlers: list[Handler] = []
+"""(**System variable.** Do not change it manually) Handlers prepared for the fork by :func:`before_fork()`."""
+
+
+def before_fork():
+    """Hook, that is called before the fork: prepares all the handlers (see :meth:`Handler.before_fork()`)."""
+
+    forked_handlers[:] = sorted(handlers, key=nesting, reverse=True)
+
+    for h in forked_handlers:
+        h.before_fork()
+
+
+def after_fork_in_parent():
+    """Hook, that is called after the fork in the parent process."""
+
+    for h in reversed(forked_handlers):
+        h.after_fork(False)
+
+    forked_handlers.clear()
+
+
+def after_fork_in_child():
+    """Hook, that is called after the fork in the child process: reinitializes handlers, locks of the metrics,
+    profilers and tracebacks caches (they could be held by the other threads), resets metrics and profiles (they are
+    collected per process), and freezes frozen logging contexts again (handlers could reopen their IOs)."""
+
+    for h in reversed(forked_handlers):
+        h.after_fork(True)
+
+    contexts = {h.logging_context for h in forked_handlers}
+
+    forked_handlers.clear()
+
+    for f in list(defined_formatters):
+        tracebacks = getattr(f, 'tracebacks', None)
+
+        if tracebacks is not None:
+            # lock could be held by the other thread of the parent, new one is made instead of it
+            tracebacks._lock = threading.Lock()
+
+    for context in contexts:
+        for registry in (context.metrics, context.profiler):
+            if registry is not None:
+                registry._lock = threading.Lock()
+                registry.reset()
+
+        if context.frozen:
+            context.thaw()
+            context.freeze()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=before_fork, after_in_parent=after_fork_in_parent, after_in_child=after_fork_in_child)
+
+
+def shutdown(timeout: float | None = SHUTDOWN_TIMEOUT, logging_context: LoggingContext | None = None) -> int:
+    """Shuts down the handlers (see :meth:`Handler.begin_shutdown()` and :meth:`Handler.finish_shutdown()`). All the
+    handlers are drained in parallel, so the whole shutdown takes no longer than the timeout (plus the time of the
+    write in progress, if the IO hangs). Records, that aren't written until the deadline, are dropped and reported to
+    the stderr. Is called at the exit of the interpreter for all the handlers, use
+    :meth:`pyrolog.LoggingContext.shutdown()` to shut down handlers of the logging context earlier.
+
+    :param timeout: Time in seconds, after which unwritten records are dropped. If it is None, there is no deadline.
+    :type timeout: float | None
+    :param logging_context: Logging context, which handlers are shut down. If it is None, all the handlers are shut
+        down.
+    :type logging_context: LoggingContext | None
+
+    :returns: Number of the dropped records.
+    :rtype: int
+    """
+
+    deadline  = None if timeout is None else monotonic() + timeout
+    targets   = sorted((h for h in list(handlers) if logging_context is None or h.logging_context is logging_context),
+                       key=nesting, reverse=True)
+
+    # frozen loggers write by the handlers without checks of their state
+    for context in {h.logging_context for h in targets}:
+        if context.frozen:
+            context.thaw()
+
+    for h in targets:
+        h.begin_shutdown(deadline)
+
+    # outer handlers first: records of the queues are written by the wrapped handlers, then they are closed
+    dropped = sum(h.finish_shutdown(deadline) for h in targets)
+
+    if dropped:
+        sys.stderr.write(f'pyrolog: {dropped} records are dropped at shutdown (not written in {timeout} seconds)\n')
+
+    return dropped
+
+
+def shutdown_on_signals(signals: tuple[int, ...] = (signal.SIGTERM,),
+                        timeout: float = SHUTDOWN_TIMEOUT) -> tuple[int, ...]:
+    """Installs signal handlers, that shut down all the handlers (see :func:`shutdown()`) and then terminate the
+    process by the default action of the signal. By default, process is terminated by SIGTERM without the exit hooks,
+    so queued records are lost. Must be called from the main thread.
+
+    Handlers are installed only for the signals with the default action. Ignored signals don't end the process, and
+    the signals with the Python handlers may not end it too (i.e. `KeyboardInterrupt` is caught by the application),
+    so the handlers aren't shut down by them (process, that exits by the Python handler, shuts down the handlers by
+    the exit hook).
+
+    Example:
+
+    .. code-block:: python
+
+        pyrolog.shutdown_on_signals()  # records are written when the service is stopped by SIGTERM
+
+    :param signals: Signals.
+    :type signals: tuple[int, ...]
+    :param timeout: Time in seconds, after which unwritten records are dropped.
+    :type timeout: float
+
+    :returns: Signals, for which handlers are installed.
+    :rtype: tuple[int, ...]
+
+    :raises ValueError: If the timeout is None (signal handler interrupts the main thread, that can hold the locks
+        of the handlers, so the shutdown without the deadline can hang forever).
+    """
+
+    if timeout is None:
+        raise ValueError('Shutdown on signals needs a finite timeout')
+
+    def handle(signum: int, frame: Any):
+        shutdown(timeout)
+
+        # signal is delivered again with the default action (i.e. termination with the right exit status)
+        signal.signal(signum, signal.SIG_DFL)
+        signal.raise_signal(signum)
+
+    installed = tuple(signum for signum in signals if signal.getsignal(signum) == signal.SIG_DFL)
+
+    for signum in installed:
+        signal.signal(signum, handle)
+
+    return installed
+
+
+atexit.register(shutdown)
@@ -0,0 +1,226 @@
+"""Health tracking of the handlers: moving averages of the write latency and errors, and the circuit breaker state
+(see :class:`pyrolog.GuardedHandler`).
+
+Circuit breaker is ``closed`` while the handler is healthy (records are written by it). It trips (becomes ``open``)
+when the average error rate or latency of the handler reaches the limit, then records bypass the handler. After the
+cooldown the breaker is ``half-open``: the next record is written by the handler as a probe, the breaker closes if it
+succeeds in time, or opens again.
+
+.. important::
+    Due to the library's import system, if you import `pyrolog` by this code:
+
+    .. code-block:: python
+
+        import pyrolog
+
+    You must use this as:
+
+    .. code-block:: python
+
+        pyrolog.HandlerHealth
+
+    As example.
+"""
+
+import threading
+
+from time import monotonic
+from typing import Any
+
+from .defaults import HEALTH_EWMA_ALPHA, BREAKER_ERROR_RATE, BREAKER_MAX_LATENCY, BREAKER_COOLDOWN
+
+__all__ = ['CLOSED', 'OPEN', 'HALF_OPEN', 'TRIPPED', 'RECOVERED', 'HandlerHealth']
+
+CLOSED = 'closed'
+"""State of the breaker: handler is healthy, records are written by it."""
+
+OPEN = 'open'
+"""State of the breaker: handler is bypassed."""
+
+HALF_OPEN = 'half-open'
+"""State of the breaker: cooldown is over, one record is written by the handler as a probe."""
+
+TRIPPED = 'tripped'
+"""Transition of the breaker: it is opened."""
+
+RECOVERED = 'recovered'
+"""Transition of the breaker: it is closed after the successful probe."""
+
+
+class HandlerHealth:
+    """Health of the handler and its circuit breaker (see :mod:`pyrolog.health`).
+
+    :ivar error_rate: Average error rate (from 0 to 1), at which the breaker trips.
+    :type error_rate: float
+    :ivar max_latency: Average latency in seconds, at which the breaker trips. If it is None, latency doesn't trip
+        the breaker.
+    :type max_latency: float | None
+    :ivar cooldown: Time in seconds, for which the handler is bypassed before the probe.
+    :type cooldown: float
+    :ivar alpha: Weight of the last record in the moving averages.
+    :type alpha: float
+    :ivar state: State of the breaker (:data:`CLOSED`, :data:`OPEN` or :data:`HALF_OPEN`).
+    :type state: str
+    :ivar latency: Moving average of the write latency, in seconds.
+    :type latency: float
+    :ivar errors: Moving average of the error rate.
+    :type errors: float
+    :ivar records: Number of the records written (or tried to be written) by the handler.
+    :type records: int
+    :ivar failures: Number of the records, which writing raised an exception.
+    :type failures: int
+    :ivar trips: Number of the breaker trips.
+    :type trips: int
+    :ivar last_error: Last exception raised by the handler.
+    :type last_error: Exception | None
+    """
+
+    def __init__(self,
+                 error_rate: float = BREAKER_ERROR_RATE,
+                 max_latency: float | None = BREAKER_MAX_LATENCY,
+                 cooldown: float = BREAKER_COOLDOWN,
+                 alpha: float = HEALTH_EWMA_ALPHA):
+        """
+        :param error_rate: Average error rate (from 0 to 1), at which the breaker trips.
+        :type error_rate: float
+        :param max_latency: Average latency in seconds, at which the breaker trips. If it is None, latency doesn't
+            trip the breaker.
+        :type max_latency: float | None
+        :param cooldown: Time in seconds, for which the handler is bypassed before the probe.
+        :type cooldown: float
+        :param alpha: Weight of the last record in the moving averages.
+        :type alpha: float
+        """
+
+        self.error_rate   = error_rate
+        self.max_latency  = max_latency
+        self.cooldown     = cooldown
+        self.alpha        = alpha
+
+        self.state                         = CLOSED
+        self.latency                       = 0.0
+        self.errors                        = 0.0
+        self.records                       = 0
+        self.failures                      = 0
+        self.trips                         = 0
+        self.last_error: Exception | None  = None
+
+        self._opened_at  = 0.0
+        self._lock       = threading.Lock()
+
+    def allow(self) -> bool:
+        """Determines whether the record can be written by the handler. When the cooldown is over, allows one probe.
+
+        :returns: True, if the record can be written by the handler.
+        :rtype: bool
+        """
+
+        if self.state is CLOSED:
+            return True
+
+        with self._lock:
+            if self.state is OPEN and monotonic() - self._opened_at >= self.cooldown:
+                self.state = HALF_OPEN
+                return True
+
+            return False
+
+    def success(self, latency: float) -> str | None:
+        """Adds successfully written record.
+
+        :param latency: Write latency in seconds.
+        :type latency: float
+
+        :returns: Transition of the breaker (:data:`TRIPPED`, :data:`RECOVERED`) or None.
+        :rtype: str | None
+        """
+
+        alpha = self.alpha
+
+        with self._lock:
+            self.records  += 1
+            self.latency  += alpha * (latency - self.latency)
+            self.errors   -= alpha * self.errors
+
+            if self.state is HALF_OPEN:
+                if self.max_latency is not None and latency >= self.max_latency:
+                    self.open()
+                    return None
+
+                self.state    = CLOSED
+                self.latency  = latency
+                self.errors   = 0.0
+                return RECOVERED
+
+            if self.state is CLOSED and self.max_latency is not None and self.latency >= self.max_latency:
+                self.open()
+                return TRIPPED
+
+        return None
+
+    def failure(self, exc: Exception, latency: float) -> str | None:
+        """Adds record, which writing raised an exception.
+
+        :param exc: Exception.
+        :type exc: Exception
+        :param latency: Time in seconds, after which the exception was raised.
+        :type latency: float
+
+        :returns: Transition of the breaker (:data:`TRIPPED`) or None.
+        :rtype: str | None
+        """
+
+        alpha = self.alpha
+
+        with self._lock:
+            self.records     += 1
+            self.failures    += 1
+            self.latency     += alpha * (latency - self.latency)
+            self.errors      += alpha * (1 - self.errors)
+            self.last_error   = exc
+
+            if self.state is HALF_OPEN:
+                self.open()
+                return None
+
+            if self.state is CLOSED and self.errors >= self.error_rate:
+                self.open()
+                return TRIPPED
+
+        return None
+
+    def open(self):
+        """Opens the breaker (is called under the lock)."""
+
+        if self.state is CLOSED:
+            self.trips += 1
+
+        self.state       = OPEN
+        self._opened_at  = monotonic()
+
+    def fork_locks(self) -> list[threading.Lock]:
+        """Gets locks, that are held by the updates of the health. They are acquired before the fork by the handler,
+        that owns the health (see :meth:`pyrolog.Handler.fork_locks()`).
+
+        :returns: Locks, in the order they are acquired.
+        :rtype: list[threading.Lock]
+        """
+
+        return [self._lock]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Converts health to the plain dict.
+
+        :returns: Dict with the state, averages and counters.
+        :rtype: dict[str, Any]
+        """
+
+        return {
+            'state': self.state,
+            'latency': self.latency,
+            'errors': self.errors,
+            'records': self.records,
+            'failures': self.failures,
+            'trips': self.trips,
+            'last_error': None if self.last_error is None else repr(self.last_error),
+        }
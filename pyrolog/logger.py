@@ -16,97 +16,54 @@
     As example.
 """
 
+import sys
+
 from datetime import datetime
 
 from .handlers import Handler
-from .utils import make_logger_binding, update_logger_name_offset
+from .utils import make_logger_binding, make_frozen_binding, update_logger_name_offset
 from .logging_context import LoggingContext
+from .context_scope import context_fields
 from .defaults import DEFAULT_LOGGING_CONTEXT
-from ._types import LogLevel
+from ._types import LogLevel, BoundFields
 
-from typing import TYPE_CHECKING, Any, Self
+from typing import TYPE_CHECKING, Any, Callable, Self
 
 if TYPE_CHECKING:
     from .group import Group
 
-__all__ = ['Logger']
+__all__ = ['BaseLogger', 'Logger', 'BoundLogger']
 
 
-class Logger:
-    """A logger object.
+class BaseLogger:
+    """Base of the :class:`Logger` and :class:`BoundLogger`: log methods and the record path. It has no instance
+    state, so the subclasses keep only the attributes they use.
 
-    :ivar name: Name of the logger.
-    :type name: str
-    :ivar handlers: Handlers to be used by logger.
-    :type handlers: list[Handler]
-    :ivar logging_context: The current logging context. (by default is defaults.DEFAULT_LOGGING_CONTEXT)
-    :type logging_context: LoggingContext
+    :ivar fields: Fields bound to the logger by :meth:`Logger.bind()`. Is `None` for the regular loggers.
+    :type fields: BoundFields | None
     """
 
-    def __init__(self,
-                 name: str = '',
-                 handlers: Handler | list[Handler] | None = None,
-                 logging_context: LoggingContext = DEFAULT_LOGGING_CONTEXT,
-                 logger_color: str = '',
-                 group: 'Group | str | None' = None,
-                 enabled: bool = True,
-                 ):
-        """Creates a new Logger object.
-
-        :param name: Name of the logger. (by default it is empty)
-        :type name: str | None
-        :param handlers: Handlers to be used by logger.
-        :type handlers: Handler | list[Handler] | None
-        :param logging_context: The current logging context. (by default is defaults.DEFAULT_LOGGING_CONTEXT)
-        :type logging_context: LoggingContext
-        :param logger_color: Color of the logger. (visible only by using ColoredFormatter)
-        :type logger_color: str
-        :param group: Group of the logger. If it is not None, then copies all parameters from that group.
-        :type group: Group | str | None
-        :param enabled: If it is set to False, logger will not log any messages.
-        :type enabled: bool
-        """
-
-        if group is None:
-            self.handlers         = [handlers, ] if isinstance(handlers, Handler) else handlers
-            self.logging_context  = logging_context
-            self.enabled          = enabled
-
-            self.group_name_path  = '*'
-            self.group_color      = ''
+    __slots__ = ()
 
-        else:
-            self.logging_context = logging_context if isinstance(group, str) else group.logging_context
-            self.change_group(group)
-
-        self.name          = name
-        self.logger_color  = logger_color
-        self.group         = group
-
-        self.logging_context.loggers.append(self)
-        update_logger_name_offset(self.logging_context)
-
-    def change_group(self, group: 'Group | str'):
-        """Moves logger to the given group.
-
-        :param group: Group where be placed logger.
-        :type group: Group | str
-        """
+    name: str
+    logger_color: str
+    logging_context: LoggingContext
+    enabled: bool
+    group: 'Group | None'
+    handlers: list[Handler]
 
-        if isinstance(group, str):
-            if group not in self.logging_context.groups_by_name:
-                raise NameError(f'Group "{group}" isn\'t defined in given logging context.')
+    fields: BoundFields | None = None
 
-            group = self.logging_context.groups_by_name[group]
+    _frozen: dict[str, Callable] | None = None
 
-        self.handlers         = group.handlers
-        self.logging_context  = group.logging_context
-        self.enabled          = group.enabled
+    def __enter__(self) -> Self:
+        return self
 
-        self.group_name_path  = group.name_path
-        self.group_color      = group.group_color
+    def __exit__(self, *exc_info: Any):
+        self.close()
 
-        group.loggers.append(self)
+    def close(self):
+        """Closes the logger."""
 
     def set_level(self, level: LogLevel):
         """Sets given log level to all handlers.
@@ -115,6 +72,8 @@ class Logger:
         :type level: LogLevel
         """
 
+        self.logging_context.check_frozen()
+
         for h in self.handlers:
             h.set_level(level)
 
@@ -125,6 +84,7 @@ class Logger:
         :type handler: Handler
         """
 
+        self.logging_context.check_frozen()
         self.handlers.append(handler)
 
     def remove_handler(self, handler: Handler):
@@ -134,15 +94,19 @@ class Logger:
         :type handler: Handler
         """
 
+        self.logging_context.check_frozen()
+
         if handler in self.handlers:
             self.handlers.remove(handler)
 
     def enable(self):
         """Enables a logger."""
+        self.logging_context.check_frozen()
         self.enabled = True
 
     def disable(self):
         """Disables a logger."""
+        self.logging_context.check_frozen()
         self.enabled = False
 
     def record(self,
@@ -165,21 +129,56 @@ class Logger:
         :type kwargs: dict[str, Any]
         """
 
+        metrics = self.logging_context.metrics
+
         if not self.enabled:
+            if metrics is not None:
+                metrics.count('records_filtered', '', self.name, level)
             return
 
-        for h in self.handlers:
+        if metrics is not None:
+            metrics.count('records_emitted', '', self.name, level)
+
+        fields  = self.fields
+        scoped  = context_fields.get()
+
+        if scoped is not None:
+            fields = scoped if fields is None else fields.merge(scoped)
+
+        group     = self.group
+        handlers  = self.handlers
+        time      = datetime.now()
+
+        if group is None:
+            group_name_path, group_color = '*', ''
+        else:
+            group_name_path, group_color = group.name_path, group.group_color
+
+        profiler = self.logging_context.profiler
+
+        if profiler is not None and profiler.sample():
+            for h in handlers:
+                h.profile(profiler, message, level, self.logger_color, self.name, group_name_path, group_color,
+                          exc, time, args, kwargs, fields)
+            return
+
+        # record is rendered once for all the handlers that use the same formatter
+        rendered = {} if len(handlers) > 1 else None
+
+        for h in handlers:
             h.write(
                 message,
                 level,
                 self.logger_color,
                 self.name,
-                self.group_name_path,
-                self.group_color,
+                group_name_path,
+                group_color,
                 exc=exc,
-                time=datetime.now(),
+                time=time,
                 fmt_args=args,
                 fmt_kwargs=kwargs,
+                fields=fields,
+                rendered=rendered,
             )
 
     @staticmethod
@@ -187,7 +186,7 @@ class Logger:
         """Binds all log methods for the Logger object instance."""
 
         for level in DEFAULT_LOGGING_CONTEXT.log_levels:
-            setattr(Logger, level, make_logger_binding(level))
+            setattr(BaseLogger, level, make_logger_binding(level))
 
     ####
 
@@ -277,4 +276,240 @@ class Logger:
         """
         ...
 
-Logger.bind_log_methods()
+
+class Logger(BaseLogger):
+    """A logger object.
+
+    :ivar name: Name of the logger.
+    :type name: str
+    :ivar handlers: Handlers to be used by logger.
+    :type handlers: list[Handler]
+    :ivar logging_context: The current logging context. (by default is defaults.DEFAULT_LOGGING_CONTEXT)
+    :type logging_context: LoggingContext
+    :ivar group: Group of the logger. Handlers, group name path and color of the grouped logger are taken from the
+        group, they aren't copied to every logger.
+    :type group: Group | None
+    """
+
+    # loggers are made per entity in some applications, so they don't have the instance dict (frozen loggers keep
+    # their log methods in the _frozen slot, see freeze())
+    __slots__ = ('name', 'logger_color', 'logging_context', 'enabled', 'group', '_handlers', '_frozen',
+                 '__weakref__')
+
+    def __init__(self,
+                 name: str = '',
+                 handlers: Handler | list[Handler] | None = None,
+                 logging_context: LoggingContext = DEFAULT_LOGGING_CONTEXT,
+                 logger_color: str = '',
+                 group: 'Group | str | None' = None,
+                 enabled: bool = True,
+                 ):
+        """Creates a new Logger object.
+
+        :param name: Name of the logger. (by default it is empty)
+        :type name: str | None
+        :param handlers: Handlers to be used by logger.
+        :type handlers: Handler | list[Handler] | None
+        :param logging_context: The current logging context. (by default is defaults.DEFAULT_LOGGING_CONTEXT)
+        :type logging_context: LoggingContext
+        :param logger_color: Color of the logger. (visible only by using ColoredFormatter)
+        :type logger_color: str
+        :param group: Group of the logger. If it is not None, then copies all parameters from that group.
+        :type group: Group | str | None
+        :param enabled: If it is set to False, logger will not log any messages.
+        :type enabled: bool
+        """
+
+        self.group    = None
+        self._frozen  = None
+
+        if group is None:
+            self._handlers        = [handlers, ] if isinstance(handlers, Handler) else \
+                [] if handlers is None else handlers
+            self.logging_context  = logging_context
+            self.enabled          = enabled
+
+        else:
+            self.logging_context = logging_context if isinstance(group, str) else group.logging_context
+            self.change_group(group)
+
+        # names are repeated in the loggers made per entity, they are compared by the formatters caches too
+        self.name          = sys.intern(name)
+        self.logger_color  = logger_color
+
+        self.logging_context.loggers.add(self)
+        update_logger_name_offset(self.logging_context)
+
+        if self.logging_context.frozen:
+            self.freeze()
+
+    def close(self):
+        """Unpins logger from its logging context and group. Loggers are also unpinned automatically when they are
+        garbage collected, this method only makes it explicit (and updates the offsets right away).
+
+        Example:
+
+        .. code-block:: python
+
+            with pyrolog.Logger('RequestLogger', handlers=[...]) as logger:
+                logger.info('Handling request')
+        """
+
+        self.logging_context.loggers.discard(self)
+
+        update_logger_name_offset(self.logging_context)
+
+    def bind(self, **fields: Any) -> 'BoundLogger':
+        """Makes a lightweight child logger with the given fields bound to it. Child shares handlers, level state and
+        group with this logger, but isn't pinned to the logging context, so it is cheap to create one per request.
+
+        Bound fields can be used in the format strings and messages as named arguments.
+
+        Example:
+
+        .. code-block:: python
+
+            request_logger = logger.bind(request_id=request.id, user=request.user)
+            request_logger.info('Handling {request_id} for {user}')
+
+        :param fields: Fields to be bound.
+        :type fields: Any
+
+        :returns: Child logger.
+        :rtype: BoundLogger
+        """
+
+        return BoundLogger(self, BoundFields(fields))
+
+    def freeze(self):
+        """Makes functions of the log methods of this logger for its current configuration, log methods call them
+        instead of :meth:`record()`. Is called by :meth:`LoggingContext.freeze()`, see it for the details. Bound
+        loggers and direct :meth:`record()` calls use the usual path.
+        """
+
+        self._frozen = {level: make_frozen_binding(self, level)
+                        for level in self.logging_context.log_levels if hasattr(type(self), level)}
+
+    def thaw(self):
+        """Restores the usual log methods of this logger (see :meth:`freeze()`)."""
+
+        self._frozen = None
+
+    @property
+    def handlers(self) -> list[Handler]:
+        """Handlers to be used by logger. Grouped logger uses handlers of its group, unless they are replaced."""
+
+        handlers = self._handlers
+
+        return self.group.handlers if handlers is None else handlers
+
+    @handlers.setter
+    def handlers(self, value: list[Handler]):
+        self._handlers = value
+
+    @property
+    def group_name_path(self) -> str:
+        """Name path of the logger group (see :attr:`Group.name_path`), or ``*`` for the logger without group."""
+
+        return '*' if self.group is None else self.group.name_path
+
+    @property
+    def group_color(self) -> str:
+        """Color of the logger group."""
+
+        return '' if self.group is None else self.group.group_color
+
+    def change_group(self, group: 'Group | str'):
+        """Moves logger to the given group.
+
+        :param group: Group where be placed logger.
+        :type group: Group | str
+        """
+
+        if isinstance(group, str):
+            if group not in self.logging_context.groups_by_name:
+                raise NameError(f'Group "{group}" isn\'t defined in given logging context.')
+
+            group = self.logging_context.groups_by_name[group]
+
+        if self.group is not None:
+            self.logging_context.check_frozen()
+
+        self._handlers        = None
+        self.logging_context  = group.logging_context
+        self.enabled          = group.enabled
+        self.group            = group
+
+
+class BoundLogger(BaseLogger):
+    """Child logger made by :meth:`Logger.bind()`. It stores only the parent logger and the bound fields, everything
+    else (handlers, level state, group, name) is taken from the parent.
+
+    :ivar parent: Parent logger.
+    :type parent: Logger
+    :ivar fields: Bound fields.
+    :type fields: BoundFields
+    """
+
+    __slots__ = ('parent', 'fields')
+
+    def __init__(self, parent: Logger, fields: BoundFields):
+        """
+        :param parent: Parent logger.
+        :type parent: Logger
+        :param fields: Fields to be bound.
+        :type fields: BoundFields
+        """
+
+        self.parent  = parent
+        self.fields  = fields
+
+    def __repr__(self):
+        return f'<BoundLogger {self.parent.name!r} {dict(self.fields)!r}>'
+
+    @property
+    def name(self) -> str:
+        return self.parent.name
+
+    @property
+    def handlers(self) -> list[Handler]:
+        return self.parent.handlers
+
+    @property
+    def logging_context(self) -> LoggingContext:
+        return self.parent.logging_context
+
+    @property
+    def logger_color(self) -> str:
+        return self.parent.logger_color
+
+    @property
+    def group(self) -> 'Group | None':
+        return self.parent.group
+
+    @property
+    def group_name_path(self) -> str:
+        return self.parent.group_name_path
+
+    @property
+    def group_color(self) -> str:
+        return self.parent.group_color
+
+    @property
+    def enabled(self) -> bool:
+        return self.parent.enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self.parent.enabled = value
+
+    def bind(self, **fields: Any) -> 'BoundLogger':
+        return BoundLogger(self.parent, BoundFields(self.fields, **fields))
+
+    def change_group(self, group: 'Group | str'):
+        self.parent.change_group(group)
+
+    def close(self):
+        """Bound loggers aren't pinned anywhere, so there is nothing to close."""
+
+BaseLogger.bind_log_methods()
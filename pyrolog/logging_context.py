@@ -16,8 +16,12 @@
     As example.
 """
 
+import weakref
+
 from functools import lru_cache
 
+from .metrics import Metrics
+from .profiling import Profiler
 from ._types import LogLevelDict, LogOnlyLevels, LogLevel
 
 from typing import TYPE_CHECKING
@@ -26,7 +30,11 @@ if TYPE_CHECKING:
     from .logger import Logger
     from .group import Group
 
-__all__ = ['LoggingContext']
+__all__ = ['FrozenContextError', 'LoggingContext']
+
+
+class FrozenContextError(RuntimeError):
+    """Raised when configuration of the frozen logging context is changed (see :meth:`LoggingContext.freeze()`)."""
 
 
 class LoggingContext:
@@ -34,12 +42,19 @@ class LoggingContext:
 
     :ivar log_levels: Dict with the registered log levels.
     :type log_levels: LogLevelDict
-    :ivar loggers: List with the loggers pinned to logging context instance.
-    :type loggers: list[Logger]
-    :ivar groups: List with the groups pinned to logging context instance.
+    :ivar loggers: Weak set with the loggers pinned to logging context instance. Loggers are removed automatically when
+        they are garbage collected or closed by :meth:`Logger.close()`.
+    :type loggers: weakref.WeakSet[Logger]
+    :ivar groups: List with the groups pinned to logging context instance. Groups are removed by :meth:`Group.close()`.
     :type groups: list[Group]
     :ivar groups_by_name: Dictionary with groups with names as keys.
     :type groups_by_name: dict[str, 'Group']
+    :ivar frozen: Determines whether configuration is frozen (see :meth:`freeze()`).
+    :type frozen: bool
+    :ivar metrics: Metrics of the logging, or ``None`` if metrics are disabled (see :meth:`enable_metrics()`).
+    :type metrics: Metrics | None
+    :ivar profiler: Profiler of the logging, or ``None`` if profiling is disabled (see :meth:`enable_profiling()`).
+    :type profiler: Profiler | None
     """
 
     def __init__(self, log_levels: LogLevelDict):
@@ -50,10 +65,128 @@ class LoggingContext:
 
         self.log_levels = log_levels
 
-        self.loggers: list['Logger']             = []
+        self.loggers: weakref.WeakSet['Logger']  = weakref.WeakSet()
         self.groups: list['Group']               = []
         self.groups_by_name: dict[str, 'Group']  = {}
 
+        self.frozen                     = False
+        self.metrics: Metrics | None    = None
+        self.profiler: Profiler | None  = None
+
+    def enable_metrics(self) -> Metrics:
+        """Enables metrics of the logging (see :mod:`pyrolog.metrics`). If metrics are already enabled, does nothing.
+
+        :returns: Metrics of the logging context.
+        :rtype: Metrics
+
+        :raises FrozenContextError: If configuration is frozen.
+        """
+
+        self.check_frozen()
+
+        if self.metrics is None:
+            self.metrics = Metrics()
+
+        return self.metrics
+
+    def disable_metrics(self):
+        """Disables metrics of the logging, collected values are dropped.
+
+        :raises FrozenContextError: If configuration is frozen.
+        """
+
+        self.check_frozen()
+        self.metrics = None
+
+    def enable_profiling(self, every: int = 100, slowest: int = 10) -> Profiler:
+        """Enables sampled profiling of the logging pipeline stages (see :mod:`pyrolog.profiling`). If profiling is
+        already enabled, the profiler is replaced.
+
+        :param every: Every N-th record is profiled.
+        :type every: int
+        :param slowest: Number of the slowest calls kept for every stage.
+        :type slowest: int
+
+        :returns: Profiler of the logging context.
+        :rtype: Profiler
+
+        :raises FrozenContextError: If configuration is frozen.
+        """
+
+        self.check_frozen()
+        self.profiler = Profiler(every, slowest)
+
+        return self.profiler
+
+    def disable_profiling(self):
+        """Disables profiling, collected statistics are dropped.
+
+        :raises FrozenContextError: If configuration is frozen.
+        """
+
+        self.check_frozen()
+        self.profiler = None
+
+    def freeze(self):
+        """Freezes configuration of the loggers, groups and handlers pinned to the logging context, for the
+        production. Every log method of every logger calls the function made for this logger and level, with the
+        checks of the logger and handlers state (enabled, log levels) done once, now, and with the formatters and IOs
+        of the handlers bound to it. Log methods of the levels, that no handler accepts (or of the disabled
+        loggers), do nothing.
+
+        While configuration is frozen, it can't be changed by the methods (:meth:`Logger.enable()`,
+        :meth:`Handler.set_level()`, etc.), they raise :class:`FrozenContextError`. Loggers created while
+        configuration is frozen are frozen too. Use :meth:`thaw()` to change the configuration.
+
+        Example:
+
+        .. code-block:: python
+
+            setup_logging()
+            pyrolog.defaults.DEFAULT_LOGGING_CONTEXT.freeze()
+        """
+
+        for l in list(self.loggers):
+            l.freeze()
+
+        self.frozen = True
+
+    def thaw(self):
+        """Unfreezes configuration (see :meth:`freeze()`), loggers use the usual log methods again."""
+
+        self.frozen = False
+
+        for l in list(self.loggers):
+            l.thaw()
+
+    def shutdown(self, timeout: float | None = 5.0) -> int:
+        """Shuts down the handlers pinned to the logging context: queued records are written in parallel until the
+        deadline, IOs are flushed and files are closed. Records, that aren't written until the deadline, are dropped
+        and reported to the stderr. Handlers of all the logging contexts are shut down at the exit of the interpreter
+        automatically (see :func:`pyrolog.handlers.shutdown()`).
+
+        :param timeout: Time in seconds, after which unwritten records are dropped (the same as
+            :data:`pyrolog.defaults.SHUTDOWN_TIMEOUT` by default). If it is None, there is no deadline.
+        :type timeout: float | None
+
+        :returns: Number of the dropped records.
+        :rtype: int
+        """
+
+        # handlers depend on this module
+        from .handlers import shutdown
+
+        return shutdown(timeout, self)
+
+    def check_frozen(self):
+        """Checks if configuration can be changed.
+
+        :raises FrozenContextError: If configuration is frozen.
+        """
+
+        if self.frozen:
+            raise FrozenContextError('Configuration of the logging context is frozen, thaw() it to change')
+
     def enable_all_loggers(self):
         """Enables all loggers pinned to the logging context."""
 
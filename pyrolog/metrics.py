@@ -0,0 +1,358 @@
+"""Metrics of the logging itself: records emitted, filtered, written, dropped and errored per logger, level and handler,
+bytes written, flushes and queue depths. Metrics are disabled by default and are enabled for the logging context by
+:meth:`pyrolog.LoggingContext.enable_metrics()`, while they are disabled the loggers and handlers only check that
+:attr:`pyrolog.LoggingContext.metrics` is ``None``.
+
+Counters are kept per thread (so the hot path doesn't take any lock) and are aggregated when they are read by
+:meth:`Metrics.snapshot()` or :meth:`Metrics.exposition()`. Counters of the finished threads are folded to the shared
+total, so servers, that make a thread per request, don't keep counters of every thread.
+
+Example:
+
+.. code-block:: python
+
+    metrics = pyrolog.defaults.DEFAULT_LOGGING_CONTEXT.enable_metrics()
+    ...
+    metrics.snapshot()['records_written']
+    # {('StdoutHandler', 'MainLogger', 'info'): 12, ...}
+    print(metrics.exposition())
+    # # HELP pyrolog_records_written_total Records written by the handlers.
+    # # TYPE pyrolog_records_written_total counter
+    # pyrolog_records_written_total{handler="StdoutHandler",logger="MainLogger",level="info"} 12
+
+.. important::
+    Due to the library's import system, if you import `pyrolog` by this code:
+
+    .. code-block:: python
+
+        import pyrolog
+
+    You must use this as:
+
+    .. code-block:: python
+
+        pyrolog.Metrics
+
+    As example.
+"""
+
+import threading
+import weakref
+
+from typing import Callable, NamedTuple
+
+__all__ = ['MetricInfo', 'METRICS', 'Metrics']
+
+
+class MetricInfo(NamedTuple):
+    """Description of the metric."""
+
+    type: str
+    """Type of the metric: ``counter`` or ``gauge``."""
+    labels: tuple[str, ...]
+    """Names of the labels, in the order of the values in the label tuples."""
+    help: str
+    """Description of the metric."""
+
+
+METRICS = {
+    'records_emitted': MetricInfo('counter', ('logger', 'level'), 'Records recorded by the enabled loggers.'),
+    'records_filtered': MetricInfo('counter', ('handler', 'logger', 'level'),
+                                   'Records skipped by the disabled loggers (with the empty handler label), '
+                                   'disabled handlers or log levels of the handlers.'),
+    'records_written': MetricInfo('counter', ('handler', 'logger', 'level'), 'Records written by the handlers.'),
+    'records_dropped': MetricInfo('counter', ('handler', 'logger', 'level'),
+                                  'Records dropped by the handlers (i.e. on the queue overflow).'),
+    'records_errored': MetricInfo('counter', ('handler', 'logger', 'level'),
+                                  'Records which writing raised an exception.'),
+    'bytes_written': MetricInfo('counter', ('handler',),
+                                'Bytes written by the handlers (characters, for the text IOs).'),
+    'flushes': MetricInfo('counter', ('handler',), 'Flushes of the handlers IOs.'),
+    'records_shed': MetricInfo('counter', ('handler', 'logger', 'level'),
+                               'Records skipped by the raised effective levels of the handlers (load shedding).'),
+    'level_changes': MetricInfo('counter', ('handler', 'level'),
+                                'Changes of the effective levels of the handlers (load shedding), by the new level.'),
+    'breaker_trips': MetricInfo('counter', ('handler',), 'Trips of the circuit breakers of the handlers.'),
+    'queue_depth': MetricInfo('gauge', ('handler',), 'Records waiting in the queues of the handlers.'),
+}
+"""Metrics collected by the library, by names."""
+
+
+class ThreadToken:
+    """Object kept in the thread-local storage of the :class:`Metrics`. It is deleted, when the thread exits, and its
+    finalizer folds counters of the thread to the shared total."""
+
+    __slots__ = ('__weakref__', )
+
+
+class Metrics:
+    """Registry of the metrics of the logging context.
+
+    :ivar gauges: Current values of the gauges, by the metric name and label values. Gauges are set directly (not per
+        thread), because only the last value matters.
+    :type gauges: dict[tuple[str, tuple[str, ...]], int]
+    """
+
+    def __init__(self):
+        self.gauges: dict[tuple[str, tuple[str, ...]], int] = {}
+
+        self._local                                                  = threading.local()
+        self._counters: list[dict[tuple[str, tuple[str, ...]], int]]  = []
+        self._finished: dict[tuple[str, tuple[str, ...]], int]        = {}
+        self._keys: dict[str, dict]                                  = {}
+        self._lock                                                   = threading.Lock()
+
+    def thread_counters(self) -> dict[tuple[str, tuple[str, ...]], int]:
+        """Gets counters of the current thread (creates them on the first call in the thread). When the thread exits,
+        its counters are folded to the shared total (see :meth:`fold()`).
+
+        :returns: Counters of the current thread, by the metric name and label values.
+        :rtype: dict[tuple[str, tuple[str, ...]], int]
+        """
+
+        try:
+            return self._local.counters
+        except AttributeError:
+            counters  = self._local.counters = {}
+            token     = self._local.token = ThreadToken()
+
+            # finalizer doesn't keep the registry alive, and isn't needed at the exit of the interpreter
+            weakref.finalize(token, fold_thread_counters, weakref.ref(self), counters).atexit = False
+
+            with self._lock:
+                self._counters.append(counters)
+
+            return counters
+
+    def fold(self, counters: dict[tuple[str, tuple[str, ...]], int]):
+        """Adds counters of the finished thread to the shared total and forgets them.
+
+        :param counters: Counters of the thread.
+        :type counters: dict[tuple[str, tuple[str, ...]], int]
+        """
+
+        with self._lock:
+            self._counters  = [c for c in self._counters if c is not counters]
+            finished        = self._finished
+
+            for key, value in counters.items():
+                finished[key] = finished.get(key, 0) + value
+
+    def record_key(self,
+                   name: str,
+                   handler_name: str,
+                   logger_name: str,
+                   level: str | int) -> tuple[str, tuple[str, ...]]:
+        """Gets key of the counter of the record metric, which labels are the handler, logger and level (or some of
+        them, in the order of the metric labels, see :data:`METRICS`). Keys are cached by the label values, so
+        counting of the records doesn't allocate the labels.
+
+        :param name: Name of the metric.
+        :type name: str
+        :param handler_name: Name of the handler (is empty for the metrics of the loggers).
+        :type handler_name: str
+        :param logger_name: Name of the logger.
+        :type logger_name: str
+        :param level: Level of the record.
+        :type level: str | int
+
+        :returns: Key of the counter.
+        :rtype: tuple[str, tuple[str, ...]]
+        """
+
+        try:
+            return self._keys[name][handler_name][logger_name][level]
+        except KeyError:
+            values  = {'handler': handler_name, 'logger': logger_name, 'level': str(level)}
+            key     = (name, tuple(values[label] for label in METRICS[name].labels))
+
+            self._keys.setdefault(name, {}).setdefault(handler_name, {}).setdefault(logger_name, {})[level] = key
+
+            return key
+
+    def count(self, name: str, handler_name: str, logger_name: str, level: str | int, value: int = 1):
+        """Increases the counter of the record metric (see :meth:`record_key()`).
+
+        :param name: Name of the metric (see :data:`METRICS`).
+        :type name: str
+        :param handler_name: Name of the handler (is empty for the metrics of the loggers).
+        :type handler_name: str
+        :param logger_name: Name of the logger.
+        :type logger_name: str
+        :param level: Level of the record.
+        :type level: str | int
+        :param value: Value to be added.
+        :type value: int
+        """
+
+        self.increment(self.record_key(name, handler_name, logger_name, level), value)
+
+    def increment(self, key: tuple[str, tuple[str, ...]], value: int = 1):
+        """Increases the counter by its key (the metric name and label values, see :meth:`record_key()`).
+
+        :param key: Key of the counter.
+        :type key: tuple[str, tuple[str, ...]]
+        :param value: Value to be added.
+        :type value: int
+        """
+
+        counters = self.thread_counters()
+
+        counters[key] = counters.get(key, 0) + value
+
+    def add(self, name: str, labels: tuple[str, ...], value: int = 1):
+        """Increases the counter.
+
+        :param name: Name of the metric (see :data:`METRICS`).
+        :type name: str
+        :param labels: Label values, in the order of the metric labels.
+        :type labels: tuple[str, ...]
+        :param value: Value to be added.
+        :type value: int
+        """
+
+        self.increment((name, labels), value)
+
+    def set(self, name: str, labels: tuple[str, ...], value: int):
+        """Sets the gauge.
+
+        :param name: Name of the metric (see :data:`METRICS`).
+        :type name: str
+        :param labels: Label values, in the order of the metric labels.
+        :type labels: tuple[str, ...]
+        :param value: Value.
+        :type value: int
+        """
+
+        self.gauges[(name, labels)] = value
+
+    def measured(self, handler_name: str, emit: Callable, flushes: bool = True) -> Callable:
+        """Wraps function, that writes records (has the arguments of the :meth:`pyrolog.Handler.write()` and returns
+        number of the written bytes), to count written and errored records, bytes and flushes of the handler.
+
+        :param handler_name: Name of the handler.
+        :type handler_name: str
+        :param emit: Function, that writes records.
+        :type emit: Callable
+        :param flushes: Determines whether function flushes IO after every record.
+        :type flushes: bool
+
+        :returns: Wrapped function.
+        :rtype: Callable
+        """
+
+        increment    = self.increment
+        record_key   = self.record_key
+        bytes_key    = ('bytes_written', (handler_name, ))
+        flushes_key  = ('flushes', (handler_name, ))
+
+        def f(message, level, logger_color, logger_name, *args):
+            try:
+                written = emit(message, level, logger_color, logger_name, *args)
+            except Exception:
+                increment(record_key('records_errored', handler_name, logger_name, level))
+                raise
+
+            increment(record_key('records_written', handler_name, logger_name, level))
+
+            if written:
+                increment(bytes_key, written)
+            if flushes:
+                increment(flushes_key)
+
+            return written
+
+        return f
+
+    def snapshot(self) -> dict[str, dict[tuple[str, ...], int]]:
+        """Aggregates counters of all the threads.
+
+        :returns: Values of the metrics by the metric name (see :data:`METRICS`) and label values. Metrics without
+            values are present as empty dicts.
+        :rtype: dict[str, dict[tuple[str, ...], int]]
+        """
+
+        result: dict[str, dict[tuple[str, ...], int]] = {name: {} for name in METRICS}
+
+        with self._lock:
+            # copy is atomic, threads may update their counters meanwhile
+            counters = [c.copy() for c in self._counters]
+            counters.append(self._finished.copy())
+
+        counters.append(self.gauges.copy())
+
+        for c in counters:
+            for (name, labels), value in c.items():
+                values          = result.setdefault(name, {})
+                values[labels]  = values.get(labels, 0) + value
+
+        return result
+
+    def exposition(self, prefix: str = 'pyrolog_') -> str:
+        """Renders metrics in the Prometheus text exposition format.
+
+        :param prefix: Prefix of the metric names.
+        :type prefix: str
+
+        :returns: Metrics in the text exposition format.
+        :rtype: str
+        """
+
+        lines = []
+
+        for name, values in self.snapshot().items():
+            info  = METRICS.get(name, MetricInfo('untyped', (), ''))
+            name  = prefix + name + ('_total' if info.type == 'counter' else '')
+
+            lines.append(f'# HELP {name} {info.help}')
+            lines.append(f'# TYPE {name} {info.type}')
+
+            for labels, value in sorted(values.items()):
+                label_names = info.labels if len(info.labels) == len(labels) else \
+                    tuple(f'label{i}' for i in range(len(labels)))
+
+                rendered_labels = ','.join(f'{n}="{escape_label(v)}"' for n, v in zip(label_names, labels))
+
+                lines.append(f'{name}{{{rendered_labels}}} {value}' if rendered_labels else f'{name} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        """Resets all counters and gauges."""
+
+        with self._lock:
+            for c in self._counters:
+                c.clear()
+
+            self._finished.clear()
+
+        self.gauges.clear()
+
+
+def fold_thread_counters(metrics: 'weakref.ref[Metrics]', counters: dict[tuple[str, tuple[str, ...]], int]):
+    """Finalizer of the :class:`ThreadToken`: folds counters of the finished thread (see :meth:`Metrics.fold()`), if
+    the registry is still alive.
+
+    :param metrics: Weak reference to the registry.
+    :type metrics: weakref.ref[Metrics]
+    :param counters: Counters of the thread.
+    :type counters: dict[tuple[str, tuple[str, ...]], int]
+    """
+
+    registry = metrics()
+
+    if registry is not None:
+        registry.fold(counters)
+
+
+def escape_label(value: str) -> str:
+    """Escapes label value for the text exposition format.
+
+    :param value: Label value.
+    :type value: str
+
+    :returns: Escaped value.
+    :rtype: str
+    """
+
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
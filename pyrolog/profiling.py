@@ -0,0 +1,390 @@
+"""Sampled per-stage latency profiling of the logging pipeline. Profiling is disabled by default and is enabled for the
+logging context by :meth:`pyrolog.LoggingContext.enable_profiling()`. Then every N-th record goes through
+:meth:`pyrolog.Handler.profile()` instead of :meth:`pyrolog.Handler.write()`, which times the stages of the handler by
+`time.perf_counter_ns()`:
+
+* ``level_check`` - checks of the handler state and log level;
+* ``format`` - :meth:`pyrolog.Formatter.format()` (includes the stages below);
+* ``format_bytes`` - :meth:`pyrolog.Formatter.format_bytes()`, for the handlers with the binary IOs (includes the
+  stages below);
+* ``format_value`` - colorization of the values by :meth:`pyrolog.ColoredFormatter.format_value()`;
+* ``format_time`` - :meth:`pyrolog.Formatter.format_time()`;
+* ``format_exception`` - :meth:`pyrolog.Formatter.format_exception()`;
+* ``write`` and ``flush`` - calls of the IO methods;
+* ``handle`` - whole record handling by the handler.
+
+Timings are aggregated to the histograms per handler, formatter and stage. Sampled records aren't shared between the
+handlers (see :meth:`pyrolog.Handler.write()`), so every handler formats them itself.
+
+Example:
+
+.. code-block:: python
+
+    profiler = pyrolog.defaults.DEFAULT_LOGGING_CONTEXT.enable_profiling(every=100)
+    ...
+    print(profiler.report())
+
+.. important::
+    Due to the library's import system, if you import `pyrolog` by this code:
+
+    .. code-block:: python
+
+        import pyrolog
+
+    You must use this as:
+
+    .. code-block:: python
+
+        pyrolog.Profiler
+
+    As example.
+"""
+
+import copy
+import heapq
+import itertools
+import threading
+
+from time import perf_counter_ns
+
+from typing import TYPE_CHECKING, Any, Callable, TextIO, BinaryIO
+
+if TYPE_CHECKING:
+    from .formatters import Formatter
+
+__all__ = ['PROFILED_METHODS', 'StageStats', 'ProfiledIO', 'Profiler']
+
+PROFILED_METHODS = ('format', 'format_bytes', 'format_value', 'format_time', 'format_exception')
+"""Methods of the formatters, that are timed as the stages of the same names."""
+
+
+class StageStats:
+    """Statistics of the stage.
+
+    :ivar samples: Number of the timed calls.
+    :type samples: int
+    :ivar total: Total time of the calls, in nanoseconds.
+    :type total: int
+    :ivar max: Maximum time of the call, in nanoseconds.
+    :type max: int
+    :ivar histogram: Numbers of the calls by the histogram buckets. Bucket `i` contains calls with the time from
+        ``2 ** (i - 1)`` to ``2 ** i - 1`` nanoseconds.
+    :type histogram: list[int]
+    :ivar slowest: Heap with the slowest calls, as tuples (time in nanoseconds, logger name, message template).
+    :type slowest: list[tuple[int, str, str]]
+    """
+
+    def __init__(self, slowest: int):
+        """
+        :param slowest: Number of the slowest calls to be kept.
+        :type slowest: int
+        """
+
+        self.samples                               = 0
+        self.total                                 = 0
+        self.max                                   = 0
+        self.histogram                             = [0] * 65
+        self.slowest: list[tuple[int, str, str]]  = []
+
+        self._slowest_size = slowest
+
+    def add(self, elapsed: int, logger_name: str, template: str):
+        """Adds timed call.
+
+        :param elapsed: Time of the call, in nanoseconds.
+        :type elapsed: int
+        :param logger_name: Name of the logger, that recorded the message.
+        :type logger_name: str
+        :param template: Message template.
+        :type template: str
+        """
+
+        self.samples  += 1
+        self.total    += elapsed
+        self.max       = max(self.max, elapsed)
+
+        self.histogram[min(elapsed.bit_length(), 64)] += 1
+
+        if len(self.slowest) < self._slowest_size:
+            heapq.heappush(self.slowest, (elapsed, logger_name, template))
+        elif elapsed > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (elapsed, logger_name, template))
+
+    def percentile(self, percent: float) -> int:
+        """Estimates the percentile by the histogram.
+
+        :param percent: Percent (from 0 to 100).
+        :type percent: float
+
+        :returns: Upper bound of the histogram bucket with the percentile, in nanoseconds.
+        :rtype: int
+        """
+
+        rank   = self.samples * percent / 100
+        count  = 0
+
+        for i, n in enumerate(self.histogram):
+            count += n
+
+            if n and count >= rank:
+                return min(2 ** i - 1, self.max)
+
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Converts statistics to the plain dict.
+
+        :returns: Dict with the statistics.
+        :rtype: dict[str, Any]
+        """
+
+        return {
+            'samples': self.samples,
+            'total_ns': self.total,
+            'max_ns': self.max,
+            'histogram': {2 ** i - 1: n for i, n in enumerate(self.histogram) if n},
+            'slowest': sorted(self.slowest, reverse=True),
+        }
+
+
+class ProfiledIO:
+    """Wrapper of the IO, that times calls of the ``write()`` and ``flush()`` methods.
+
+    :ivar io: Wrapped IO.
+    :type io: TextIO | BinaryIO
+    :ivar profiler: Profiler.
+    :type profiler: Profiler
+    """
+
+    def __init__(self, io: TextIO | BinaryIO, profiler: 'Profiler'):
+        """
+        :param io: Wrapped IO.
+        :type io: TextIO | BinaryIO
+        :param profiler: Profiler.
+        :type profiler: Profiler
+        """
+        self.io        = io
+        self.profiler  = profiler
+
+    def write(self, data: str | bytes) -> int:
+        start   = perf_counter_ns()
+        result  = self.io.write(data)
+        self.profiler.add('write', perf_counter_ns() - start)
+
+        return result
+
+    def flush(self):
+        start = perf_counter_ns()
+        self.io.flush()
+        self.profiler.add('flush', perf_counter_ns() - start)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.io, name)
+
+
+class Profiler:
+    """Sampled profiler of the logging pipeline stages (see :mod:`pyrolog.profiling`).
+
+    :ivar every: Every N-th record is profiled.
+    :type every: int
+    :ivar slowest: Number of the slowest calls kept for every stage.
+    :type slowest: int
+    :ivar records: Number of the profiled records.
+    :type records: int
+    :ivar stages: Statistics by the handler name, formatter class name and stage.
+    :type stages: dict[tuple[str, str, str], StageStats]
+    """
+
+    def __init__(self, every: int = 100, slowest: int = 10):
+        """
+        :param every: Every N-th record is profiled.
+        :type every: int
+        :param slowest: Number of the slowest calls kept for every stage.
+        :type slowest: int
+        """
+
+        self.every                                           = every
+        self.slowest                                         = slowest
+        self.records                                         = 0
+        self.stages: dict[tuple[str, str, str], StageStats]  = {}
+
+        self._counter  = itertools.count()
+        self._local    = threading.local()
+        self._lock     = threading.Lock()
+
+    def sample(self) -> bool:
+        """Determines whether the next record is profiled.
+
+        :returns: True, if the record is profiled.
+        :rtype: bool
+        """
+
+        if next(self._counter) % self.every:
+            return False
+
+        with self._lock:
+            self.records += 1
+
+        return True
+
+    def begin(self, handler_name: str, formatter: 'Formatter | None', logger_name: str, template: str):
+        """Begins handling of the profiled record by the handler in the current thread. Next timings of the thread
+        are added to the statistics of this handler.
+
+        :param handler_name: Name of the handler.
+        :type handler_name: str
+        :param formatter: Formatter used by the handler.
+        :type formatter: Formatter | None
+        :param logger_name: Name of the logger, that recorded the message.
+        :type logger_name: str
+        :param template: Message template.
+        :type template: str
+        """
+
+        self._local.current  = (handler_name, '-' if formatter is None else type(formatter).__name__,
+                                logger_name, template)
+        self._local.active   = set()
+
+    def add(self, stage: str, elapsed: int):
+        """Adds timing of the stage of the record begun by :meth:`begin()` in the current thread.
+
+        :param stage: Stage.
+        :type stage: str
+        :param elapsed: Time of the stage, in nanoseconds.
+        :type elapsed: int
+        """
+
+        handler_name, formatter_name, logger_name, template = self._local.current
+        key = (handler_name, formatter_name, stage)
+
+        with self._lock:
+            stats = self.stages.get(key)
+
+            if stats is None:
+                stats = self.stages[key] = StageStats(self.slowest)
+
+            stats.add(elapsed, logger_name, template)
+
+    def timed(self, stage: str, func: Callable) -> Callable:
+        """Wraps function to time its calls as the stage. Nested calls (i.e. recursive) aren't timed separately.
+
+        :param stage: Stage.
+        :type stage: str
+        :param func: Function.
+        :type func: Callable
+
+        :returns: Wrapped function.
+        :rtype: Callable
+        """
+
+        local = self._local
+
+        def f(*args, **kwargs):
+            active = local.active
+
+            if stage in active:
+                return func(*args, **kwargs)
+
+            active.add(stage)
+            start = perf_counter_ns()
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(stage, perf_counter_ns() - start)
+                active.discard(stage)
+
+        return f
+
+    def profiled_formatter(self, formatter: 'Formatter') -> 'Formatter':
+        """Makes copy of the formatter with the timed :data:`PROFILED_METHODS`. Copy shares caches with the
+        formatter (see :attr:`pyrolog.Formatter.origin`).
+
+        :param formatter: Formatter.
+        :type formatter: Formatter
+
+        :returns: Profiled formatter.
+        :rtype: Formatter
+        """
+
+        profiled         = copy.copy(formatter)
+        profiled.origin  = formatter.origin or formatter
+
+        for name in PROFILED_METHODS:
+            method = getattr(profiled, name, None)
+
+            if method is not None:
+                setattr(profiled, name, self.timed(name, method))
+
+        return profiled
+
+    def profiled_io(self, io: TextIO | BinaryIO) -> ProfiledIO:
+        """Wraps IO to time its ``write()`` and ``flush()`` calls.
+
+        :param io: IO.
+        :type io: TextIO | BinaryIO
+
+        :returns: Profiled IO.
+        :rtype: ProfiledIO
+        """
+
+        return ProfiledIO(io, self)
+
+    def stats(self) -> dict[tuple[str, str, str], dict[str, Any]]:
+        """Gets statistics as the plain dicts.
+
+        :returns: Statistics by the handler name, formatter class name and stage (see :meth:`StageStats.as_dict()`).
+        :rtype: dict[tuple[str, str, str], dict[str, Any]]
+        """
+
+        with self._lock:
+            return {key: stats.as_dict() for key, stats in self.stages.items()}
+
+    def report(self, top: int = 10) -> str:
+        """Renders text report: statistics of the stages, ordered by the mean time, and the slowest calls with the
+        loggers and templates responsible.
+
+        :param top: Number of the slowest calls in the report.
+        :type top: int
+
+        :returns: Report.
+        :rtype: str
+        """
+
+        with self._lock:
+            stages = sorted(self.stages.items(), key=lambda s: s[1].total / s[1].samples, reverse=True)
+
+            rows = [(handler_name, formatter_name, stage, f'{stats.samples:,}',
+                     *(f'{ns / 1000:.2f}' for ns in (stats.total / stats.samples, stats.percentile(50),
+                                                     stats.percentile(99), stats.max)))
+                    for (handler_name, formatter_name, stage), stats in stages]
+
+            slowest = heapq.nlargest(top, ((elapsed, handler_name, formatter_name, stage, logger_name, template)
+                                           for (handler_name, formatter_name, stage), stats in self.stages.items()
+                                           if stage != 'handle'
+                                           for elapsed, logger_name, template in stats.slowest))
+
+            records = self.records
+
+        header  = ('handler', 'formatter', 'stage', 'samples', 'mean us', 'p50 us', 'p99 us', 'max us')
+        widths  = [max(len(r[i]) for r in rows + [header]) for i in range(len(header))]
+
+        lines = [f'Profiled records: {records:,} (1 of {self.every})', '']
+
+        for row in [header] + rows:
+            lines.append('  '.join(v.ljust(w) if i < 3 else v.rjust(w) for i, (v, w) in enumerate(zip(row, widths))))
+
+        lines += ['', 'Slowest stages:']
+
+        for elapsed, handler_name, formatter_name, stage, logger_name, template in slowest:
+            lines.append(f'{elapsed / 1000:10.2f} us  {handler_name}/{formatter_name} {stage}  '
+                         f'logger {logger_name!r}  template {template!r}')
+
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        """Resets collected statistics."""
+
+        with self._lock:
+            self.records = 0
+            self.stages.clear()
@@ -0,0 +1,242 @@
+"""Dedicated module for the :class:`TracebackCache` class.
+
+.. important::
+    Due to the library's import system, if you import `pyrolog` by this code:
+
+    .. code-block:: python
+
+        import pyrolog
+
+    You must use this as:
+
+    .. code-block:: python
+
+        pyrolog.TracebackCache
+
+    As example.
+"""
+
+import threading
+
+from collections import OrderedDict
+
+from .defaults import TRACEBACK_CACHE_SIZE
+
+__all__ = ['RenderedTraceback', 'TracebackCache']
+
+CAUSE_MESSAGE    = '\nThe above exception was the direct cause of the following exception:\n\n'
+CONTEXT_MESSAGE  = '\nDuring handling of the above exception, another exception occurred:\n\n'
+
+
+class RenderedTraceback(Exception):
+    """Exception, which traceback is already rendered (i.e. read from the binary log). :class:`TracebackCache`
+    formats it as the rendered text.
+
+    :ivar text: Rendered traceback.
+    :type text: str
+    """
+
+    def __init__(self, text: str):
+        super().__init__(text)
+
+        self.text = text
+
+
+class TracebackEntry:
+    """Rendered traceback stored in the :class:`TracebackCache`.
+
+    :ivar number: Number of the traceback (used to reference it when identical tracebacks are collapsed).
+    :type number: int
+    :ivar text: Rendered stack of the traceback (without the exception line).
+    :type text: str
+    :ivar seen: How many times this traceback was formatted.
+    :type seen: int
+    """
+
+    __slots__ = ('number', 'text', 'seen')
+
+    def __init__(self, number: int, text: str):
+        self.number  = number
+        self.text    = text
+        self.seen    = 0
+
+
+class TracebackCache:
+    """Formats exceptions like :func:`traceback.format_exception()`, but caches rendered stacks of the tracebacks.
+    Stack is identified by the signature: type of the exception and code locations of its frames. So the same
+    exception raised from the same place is rendered (frames walked, source lines read) only once. Exception line
+    (type and message) is formatted every time, because message may be different.
+
+    :ivar size: Maximum count of the cached tracebacks (least recently used are dropped).
+    :type size: int
+    :ivar max_frames: Maximum count of the rendered frames (the innermost frames are rendered). `None` means no limit.
+    :type max_frames: int | None
+    :ivar collapse: If it is set to True, repeated identical tracebacks are collapsed to the
+        `same as #N (seen K times)` reference.
+    :type collapse: bool
+    """
+
+    def __init__(self, size: int = TRACEBACK_CACHE_SIZE, max_frames: int | None = None, collapse: bool = False):
+        """
+        :param size: Maximum count of the cached tracebacks (least recently used are dropped).
+        :type size: int
+        :param max_frames: Maximum count of the rendered frames (the innermost frames are rendered). `None` means no
+            limit.
+        :type max_frames: int | None
+        :param collapse: If it is set to True, repeated identical tracebacks are collapsed to the
+            `same as #N (seen K times)` reference.
+        :type collapse: bool
+        """
+
+        self.size        = size
+        self.max_frames  = max_frames
+        self.collapse    = collapse
+
+        self._entries: OrderedDict[tuple, TracebackEntry]  = OrderedDict()
+        self._lock                                         = threading.Lock()
+        self._numbers                                      = 0
+
+    def clear(self):
+        """Clears the cache."""
+
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def signature(exc: BaseException) -> tuple:
+        """Makes signature of the exception traceback. Only frames are walked, source lines aren't read.
+
+        :param exc: Exception.
+        :type exc: BaseException
+
+        :returns: Signature.
+        :rtype: tuple
+        """
+
+        locations  = []
+        tb         = exc.__traceback__
+
+        while tb is not None:
+            locations.append((tb.tb_frame.f_code, tb.tb_lineno))
+            tb = tb.tb_next
+
+        return type(exc), tuple(locations)
+
+    def format(self, exc: BaseException) -> str:
+        """Formats exception (with its chain of causes and contexts).
+
+        :param exc: Exception.
+        :type exc: BaseException
+
+        :returns: Formatted exception, without the trailing newline.
+        :rtype: str
+        """
+
+        if isinstance(exc, RenderedTraceback):
+            return exc.text
+
+        # traceback module is heavy to import, it is imported only when the first exception is formatted
+        import traceback
+
+        # exception groups are rendered with their sub-exceptions, leave it to the traceback module
+        if isinstance(exc, BaseExceptionGroup):
+            return ''.join(traceback.format_exception(exc))[:-1]
+
+        blocks  = []
+        seen    = set()
+
+        while exc is not None and id(exc) not in seen:
+            seen.add(id(exc))
+            blocks.append(self.format_single(exc))
+
+            if exc.__cause__ is not None:
+                blocks.append(CAUSE_MESSAGE)
+                exc = exc.__cause__
+            elif exc.__context__ is not None and not exc.__suppress_context__:
+                blocks.append(CONTEXT_MESSAGE)
+                exc = exc.__context__
+            else:
+                exc = None
+
+        return ''.join(reversed(blocks))[:-1]
+
+    def format_single(self, exc: BaseException) -> str:
+        """Formats exception without its chain.
+
+        :param exc: Exception.
+        :type exc: BaseException
+
+        :returns: Formatted exception.
+        :rtype: str
+        """
+
+        import traceback
+
+        exception_only = ''.join(traceback.format_exception_only(type(exc), exc))
+
+        if exc.__traceback__ is None:
+            return exception_only
+
+        signature = self.signature(exc)
+
+        with self._lock:
+            entry = self._entries.get(signature)
+
+            if entry is not None:
+                self._entries.move_to_end(signature)
+                entry.seen  += 1
+                seen         = entry.seen
+
+        if entry is None:
+            entry = self.render(exc, signature)
+
+            with self._lock:
+                entry.seen  += 1
+                seen         = entry.seen
+
+        if self.collapse and seen > 1:
+            return f'Traceback: same as #{entry.number} (seen {seen} times)\n{exception_only}'
+
+        return entry.text + exception_only
+
+    def render(self, exc: BaseException, signature: tuple) -> TracebackEntry:
+        """Renders stack of the exception traceback and caches it.
+
+        :param exc: Exception.
+        :type exc: BaseException
+        :param signature: Signature of the exception traceback.
+        :type signature: tuple
+
+        :returns: Cached entry.
+        :rtype: TracebackEntry
+        """
+
+        import traceback
+
+        frames_count  = len(signature[1])
+        limit         = None if self.max_frames is None else -self.max_frames
+        stack         = traceback.extract_tb(exc.__traceback__, limit=limit)
+
+        with self._lock:
+            self._numbers  += 1
+            number          = self._numbers
+
+        header  = f'Traceback #{number} (most recent call last):\n' if self.collapse \
+            else 'Traceback (most recent call last):\n'
+        hidden  = f'  [... {frames_count - len(stack)} frames hidden ...]\n' if frames_count > len(stack) else ''
+        entry   = TracebackEntry(number, header + hidden + ''.join(stack.format()))
+
+        with self._lock:
+            # the same traceback could be rendered by the other thread meanwhile, its entry is kept
+            if signature in self._entries:
+                return self._entries[signature]
+
+            self._entries[signature] = entry
+
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+        return entry
+
+    def __repr__(self) -> str:
+        return f'<TracebackCache {len(self._entries)}/{self.size}>'
@@ -16,22 +16,29 @@
     As example.
 """
 
-import inspect
+import os
+import sys
 
 from datetime import datetime
+from functools import partial
+from types import FrameType
 
 from .logging_context import LoggingContext
 from .defaults import DEFAULT_LOGGING_CONTEXT, MAXIMUM_TIME_FORMAT_STRING_FILENAME_SAFE
-from .formatters import PlainFormatter, defined_formatters
+from .formatters import PlainFormatter, Lazy, defined_formatters
+from .context_scope import context_fields
 
 from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
+    import inspect
+
     from .logger import Logger
 
 
-__all__ = ['make_logger_binding', 'make_new_log_level', 'update_logger_name_offset',
-           'update_group_name_offset', 'get_filename_timestamp']
+__all__ = ['make_logger_binding', 'make_frozen_binding', 'emit_nothing', 'LazyFrameInfo', 'lazy_frame_info',
+           'detached_frame_info', 'make_new_log_level', 'update_logger_name_offset', 'update_group_name_offset',
+           'get_filename_timestamp', 'supports_colors']
 
 
 def make_logger_binding(level: str) -> Callable:
@@ -45,11 +52,176 @@ def make_logger_binding(level: str) -> Callable:
     """
 
     def f(self: 'Logger', message: str, *args, exc: Exception | None = None, **kwargs):
-        self.record(message, level, *args, exc=exc, stack=inspect.stack()[1], **kwargs)
+        frozen = self._frozen
+
+        if frozen is None:
+            self.record(message, level, *args, exc=exc, stack=lazy_frame_info(sys._getframe(1)), **kwargs)
+            return
+
+        write = frozen[level]
+
+        # skipped levels don't need the frame
+        if write is not emit_nothing:
+            write(sys._getframe(1), message, args, exc, kwargs)
+
+    return f
+
+
+def emit_nothing(frame: FrameType, message: str, args: tuple, exc: Exception | None, kwargs: dict[str, Any]):
+    """Log method of the frozen logger for the level, that is not logged (see :func:`make_frozen_binding()`)."""
+
+
+def make_frozen_binding(logger: 'Logger', level: str) -> Callable:
+    """Makes function of the log method of the frozen logger (see :meth:`pyrolog.LoggingContext.freeze()`) for
+    given level. It is called by the log method with the frame of the caller, the message, positional arguments,
+    exception and keyword arguments. Logger state, handlers and their log levels are checked once, now: if no handler
+    logs the level, it is :func:`emit_nothing()`, otherwise the function writes records directly by the compiled
+    handlers (see :meth:`pyrolog.Handler.compile()`). If metrics are enabled, the function also counts emitted and
+    filtered records, and every N-th record is profiled, if profiling is enabled.
+
+    :param logger: Logger.
+    :type logger: Logger
+    :param level: Level.
+    :type level: str
+
+    :returns: Function of the log method, that is kept by the logger (see :meth:`pyrolog.Logger.freeze()`).
+    :rtype: Callable
+    """
+
+    logging_context  = logger.logging_context
+    metrics          = logging_context.metrics
+    accepted         = [h for h in logger.handlers if h.enabled and logging_context.log_level(h.log_level, level)]
+    writers          = tuple(h.compile() for h in accepted) if logger.enabled else ()
+
+    if metrics is not None:
+        emitted   = metrics.record_key('records_emitted', '', logger.name, level) if logger.enabled else None
+        filtered  = [metrics.record_key('records_filtered', h.name, logger.name, level)
+                     for h in logger.handlers if h not in accepted] \
+            if logger.enabled else [metrics.record_key('records_filtered', '', logger.name, level)]
+    elif not writers:
+        return emit_nothing
+
+    logger_color     = logger.logger_color
+    logger_name      = logger.name
+    group_name_path  = logger.group_name_path
+    group_color      = logger.group_color
+    shared           = len(writers) > 1
+    profiler         = logging_context.profiler
+
+    def f(frame: FrameType, message: str, args: tuple, exc: Exception | None, kwargs: dict[str, Any]):
+        if metrics is not None:
+            if emitted is not None:
+                metrics.increment(emitted)
+
+            for key in filtered:
+                metrics.increment(key)
+
+            if not writers:
+                return
+
+        kwargs['stack']  = lazy_frame_info(frame)
+        time             = datetime.now()
+        fields           = context_fields.get()
+
+        if profiler is not None and profiler.sample():
+            for h in accepted:
+                h.profile(profiler, message, level, logger_color, logger_name, group_name_path, group_color,
+                          exc, time, args, kwargs, fields)
+            return
+
+        rendered = {} if shared else None
+
+        for write in writers:
+            write(message, level, logger_color, logger_name, group_name_path, group_color,
+                  exc, time, args, kwargs, fields, rendered)
 
     return f
 
 
+class LazyFrameInfo(Lazy):
+    """Lazy :class:`inspect.FrameInfo` of the frame (see :func:`lazy_frame_info()`).
+
+    :ivar frame: Frame.
+    :type frame: FrameType
+    """
+
+    __slots__ = ('frame', )
+
+    def __init__(self, frame: FrameType):
+        """
+        :param frame: Frame.
+        :type frame: FrameType
+        """
+
+        super().__init__(None)
+
+        self.frame = frame
+
+    @property
+    def value(self) -> 'inspect.FrameInfo':
+        """Evaluated frame info."""
+
+        if not self.evaluated:
+            # inspect is heavy, it is imported only when frame info is really used
+            import inspect
+
+            self._value     = inspect.FrameInfo(self.frame, *inspect.getframeinfo(self.frame))
+            self.evaluated  = True
+
+        return self._value
+
+    def detach(self) -> Lazy:
+        """Makes lazy frame info, that doesn't reference the frame, for the records, that are formatted later (i.e. in
+        the background thread of :class:`pyrolog.QueueHandler`): the frame would execute the other code then, and
+        would keep its locals alive. File name, line number and function name are taken now, source line is read
+        only if the info is really formatted, `frame` of the info is None.
+
+        :returns: Lazy frame info.
+        :rtype: Lazy
+        """
+
+        frame  = self.frame
+        code   = frame.f_code
+
+        return Lazy(partial(detached_frame_info, code.co_filename, frame.f_lineno, code.co_name))
+
+
+def detached_frame_info(filename: str, lineno: int, function: str) -> 'inspect.FrameInfo':
+    """Makes :class:`inspect.FrameInfo` without the frame (see :meth:`LazyFrameInfo.detach()`).
+
+    :param filename: File name.
+    :type filename: str
+    :param lineno: Line number.
+    :type lineno: int
+    :param function: Function name.
+    :type function: str
+
+    :returns: Frame info.
+    :rtype: inspect.FrameInfo
+    """
+
+    import inspect
+    import linecache
+
+    line = linecache.getline(filename, lineno)
+
+    return inspect.FrameInfo(None, filename, lineno, function, [line, ] if line else None, 0 if line else None)
+
+
+def lazy_frame_info(frame: FrameType) -> LazyFrameInfo:
+    """Makes lazy :class:`inspect.FrameInfo` of the given frame. Source lines of the frame are read only if the info
+    is really formatted.
+
+    :param frame: Frame.
+    :type frame: FrameType
+
+    :returns: Lazy frame info.
+    :rtype: LazyFrameInfo
+    """
+
+    return LazyFrameInfo(frame)
+
+
 def make_new_log_level(logger_class: 'Logger',
                        name: str,
                        level: int,
@@ -68,11 +240,15 @@ def make_new_log_level(logger_class: 'Logger',
     :type logging_context: LoggingContext
     """
 
+    logging_context.check_frozen()
+
     name = name.lower()
     logging_context.log_levels[name] = level
 
-    # make function-bind for the log level
-    setattr(logger_class, name, make_logger_binding(name))
+    # make function-bind for the log level, on the class that defines the log methods (see
+    # :class:`pyrolog.BaseLogger`), so the bound loggers have it too
+    owner = next((c for c in logger_class.__mro__ if 'record' in vars(c)), logger_class)
+    setattr(owner, name, make_logger_binding(name))
 
     # update level offset
     for f in defined_formatters:
@@ -112,3 +288,27 @@ def get_filename_timestamp(format_string=MAXIMUM_TIME_FORMAT_STRING_FILENAME_SAF
     """
 
     return PlainFormatter(time_format_string=format_string).format_time(datetime.now())
+
+
+def supports_colors(stream: Any) -> bool:
+    """Checks if stream supports colors: it is a terminal and the `NO_COLOR` environment variable isn't set. Colors
+    can be forced for any stream by the `FORCE_COLOR` environment variable.
+
+    :param stream: Stream (IO).
+    :type stream: Any
+
+    :returns: `True` if colors must be rendered to the stream, otherwise `False`.
+    :rtype: bool
+    """
+
+    if os.environ.get('NO_COLOR'):
+        return False
+
+    if os.environ.get('FORCE_COLOR'):
+        return True
+
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        # no isatty() method or stream is closed
+        return False